@@ -0,0 +1,184 @@
+##
+# @file asset_cache.py
+#
+# @brief Cache of pre-decoded images that are memory mapped instead of decoded from PNG on every run.
+#
+# The first time an image is used it is decoded once and saved as raw pixels in the cache directory, with a thumbnail.
+# Later runs map the raw file into memory, so loading costs no decoding and pixels are only read from disk when they
+# are drawn. Run this file to convert every overlay ahead of time:
+#
+#     python asset_cache.py
+
+# Imports
+from collections import OrderedDict
+import mmap
+import os
+import struct
+import threading
+
+import pygame as pg
+
+## Directory the raw images are stored in, AAG_CACHE_DIR overrides it.
+cache_dir = os.environ.get("AAG_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "abstract_art_generator")
+
+## Magic bytes a raw image file starts with.
+raw_magic = b"AAGR"
+## Version of the raw image format.
+raw_version = 1
+## Raw image header: magic, version, reserved, width, height, source modification time in ns, source size in bytes.
+## The pixels follow as rows of BGRA bytes, the memory layout of a pg.SRCALPHA surface.
+_header = struct.Struct("<4sHHIIqq")
+
+## Size of the thumbnails saved alongside each image.
+thumbnail_size = (80, 45)
+## Most full size images kept mapped, the least recently used is dropped past it.
+default_max_images = 2
+
+
+def get_raw_path(source, size=None):
+    """! Gets the path a raw image is cached at.
+
+    @param source   Path of the source image.
+    @param size     Size of a scaled copy like a thumbnail, None for the full size image.
+
+    @return The path in cache_dir.
+    """
+    name = os.path.abspath(source).replace(os.sep, "_").replace(":", "_").lstrip("_")
+    if size is not None:
+        name += ".%dx%d" % size
+    return os.path.join(cache_dir, name + ".raw")
+
+
+def _save_raw(path, surface, stat):
+    """! Saves a surface as a raw image, replacing the file atomically so readers never see half of it. """
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(temp_path, "wb") as file:
+        file.write(_header.pack(raw_magic, raw_version, 0, surface.get_width(), surface.get_height(),
+                                stat.st_mtime_ns, stat.st_size))
+        file.write(pg.image.tobytes(surface, "BGRA"))
+    os.replace(temp_path, path)
+
+
+def convert(source):
+    """! Decodes an image and saves it and its thumbnail as raw images.
+
+    @param source   Path of the source image.
+
+    @raise OSError  If the image can't be read or the cache can't be written.
+    """
+    stat = os.stat(source)
+    os.makedirs(cache_dir, exist_ok=True)
+    image = pg.image.load(source)
+    _save_raw(get_raw_path(source), image, stat)
+    _save_raw(get_raw_path(source, thumbnail_size), pg.transform.smoothscale(image, thumbnail_size), stat)
+
+
+def open_raw(source, size=None):
+    """! Maps a cached raw image.
+
+    The file is mapped copy on write, so the surface can be drawn on without changing the file.
+
+    @param source   Path of the source image.
+    @param size     Size of a scaled copy like a thumbnail, None for the full size image.
+
+    @return A surface over the mapped pixels, or None if the raw image is missing or older than its source.
+    """
+    try:
+        stat = os.stat(source)
+        with open(get_raw_path(source, size), "rb") as file:
+            header = file.read(_header.size)
+            if len(header) < _header.size:
+                return None
+            magic, version, _, width, height, mtime_ns, source_size = _header.unpack(header)
+            if (magic != raw_magic or version != raw_version or mtime_ns != stat.st_mtime_ns
+                    or source_size != stat.st_size or os.fstat(file.fileno()).st_size != _header.size + width*height*4):
+                return None
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except OSError:
+        return None
+    # The surface keeps the memoryview and with it the mapping alive.
+    return pg.image.frombuffer(memoryview(mapped)[_header.size:], (width, height), "BGRA")
+
+
+def load(source, size=None):
+    """! Loads an image from the cache, converting it first if it isn't cached yet.
+
+    @param source   Path of the source image.
+    @param size     thumbnail_size for its thumbnail, None for the full size image.
+
+    @return The image surface. If the cache can't be written the image is decoded as usual instead.
+    """
+    surface = open_raw(source, size)
+    if surface is None:
+        try:
+            convert(source)
+            surface = open_raw(source, size)
+        except OSError:
+            surface = None
+    if surface is None:
+        image = pg.image.load(source)
+        surface = image if size is None else pg.transform.smoothscale(image, size)
+    return surface
+
+
+class image_cache:
+    """! Least recently used set of mapped full size images, so only the images in use stay mapped. """
+
+    def __init__(self, max_images=default_max_images):
+        """! Initializes the image cache.
+
+        @param max_images   Most images kept mapped, the least recently used is dropped past it.
+        """
+        ## Most images kept mapped.
+        self.max_images = max_images
+        self.__images = OrderedDict()
+        # The ui and the render worker thread load overlays at the same time.
+        self.__lock = threading.Lock()
+
+
+    def get(self, source):
+        """! Gets an image, mapping it if it isn't mapped yet.
+
+        @param source   Path of the source image.
+
+        @return The image surface. Dropping it from the cache unmaps it once no one else holds it.
+        """
+        with self.__lock:
+            image = self.__images.get(source)
+            if image is not None:
+                self.__images.move_to_end(source)
+                return image
+
+            image = self.__images[source] = load(source)
+            while len(self.__images) > self.max_images:
+                self.__images.popitem(last=False)
+            return image
+
+
+    def clear(self):
+        """! Drops every image. """
+        with self.__lock:
+            self.__images.clear()
+
+
+def convert_all(sources):
+    """! Converts images that aren't cached or changed since they were cached.
+
+    @param sources  Paths of the source images.
+
+    @return The paths that were converted.
+    """
+    converted = []
+    for source in sources:
+        if open_raw(source) is None or open_raw(source, thumbnail_size) is None:
+            convert(source)
+            converted.append(source)
+    return converted
+
+
+if __name__ == "__main__":
+    import assets
+    for path in convert_all([assets.asset_path(path) for path in assets.overlay_paths]):
+        print("converted", path)
+    print("cache", cache_dir)
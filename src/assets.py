@@ -7,12 +7,28 @@
 # - Created by Jessica Dawson on 03/16/2022.
 
 # Imports
+import functools
+import os
+
 import pygame as pg
+import pygame.freetype
+
+import asset_cache
+import startup_report
+
+## Directory holding the program source, assets and fonts.
+src_dir = os.path.dirname(os.path.abspath(__file__))
+
+def asset_path(relative_path):
+    """! Resolves a path relative to the program source directory.
 
-pg.freetype.init()
+    Lets the program and the headless render API be used from any working directory.
 
-## Program logo.
-logo = pg.image.load("assets/logo.png")
+    @param relative_path    Path relative to the source directory, like "assets/logo.png".
+
+    @return The absolute path.
+    """
+    return os.path.join(src_dir, relative_path)
 
 ## Background_color of ui.
 background_color = pg.Color("#322f3d")
@@ -27,28 +43,45 @@ active_color = (90, 90, 90)
 ## Color used to indicate inactive settings.
 inactive_color = (20, 20, 20)
 
-## Lock enabled graphic
-lock_enabled = pg.transform.scale(pg.image.load("assets/lock_enabled.png"), (20, 20))
-## Lock disabled graphic
-lock_disabled = pg.transform.scale(pg.image.load("assets/lock_disabled.png"), (20, 20))
-
-## Extra small font.
-xs_font = pg.freetype.Font("fonts/Basic.ttf", 12)
-## Small font.
-small_font = pg.freetype.Font("fonts/Basic.ttf", 14)
-## Medium font.
-medium_font = pg.freetype.Font("fonts/Basic.ttf", 18)
-## Large font.
-large_font = pg.freetype.Font("fonts/Basic.ttf", 24)
-## Extra large font.
-xl_font = pg.freetype.Font("fonts/Basic.ttf", 30)
-## Extra extra large font.
-xxl_font = pg.freetype.Font("fonts/Basic.ttf", 40)
-
-## List of font sizes.
-fonts = [xs_font, small_font, medium_font, large_font, xl_font, xxl_font]
+# Images and ui fonts are loaded the first time they are used, see __getattr__:
+# - logo: Program logo.
+# - lock_enabled, lock_disabled: Lock enabled and disabled graphics.
+# - xs_font, small_font, medium_font, large_font, xl_font, xxl_font: Ui fonts from extra small to extra extra large.
+# - fonts: List of the ui fonts, in font_sizes order.
+
+## Images loaded on first use, by name, as (path, size to scale to or None).
+_images = {
+    "logo": ("assets/logo.png", None),
+    "lock_enabled": ("assets/lock_enabled.png", (20, 20)),
+    "lock_disabled": ("assets/lock_disabled.png", (20, 20))
+}
+## Ui fonts loaded on first use, by name, as their size.
+_ui_fonts = {
+    "xs_font": 12,
+    "small_font": 14,
+    "medium_font": 18,
+    "large_font": 24,
+    "xl_font": 30,
+    "xxl_font": 40
+}
+
 ## Font size numbers that correspond with defined font sizes.
 font_sizes = [12, 14, 18, 24, 30, 40]
+
+## Overlay and border images, in the order the overlay widget numbers them from 1.
+overlay_paths = [
+    "assets/overlay1.png",
+    "assets/overlay2.png",
+    "assets/overlay3.png",
+    "assets/overlay4.png",
+    "assets/overlay5.png",
+    "assets/overlay6.png",
+    "assets/border7.png",
+    "assets/border8.png",
+    "assets/border9.png"
+]
+## The mapped overlay images, only the most recently used are kept.
+_overlay_images = asset_cache.image_cache()
 #-------------------------------------------
 
 def text_to_screen(window, text, color, pos, font_size):
@@ -60,5 +93,127 @@ def text_to_screen(window, text, color, pos, font_size):
     @param pos          Position of text.
     @param font_size    Size of text.
     """
-    font_used = fonts[font_sizes.index(font_size)]
-    font_used.render_to(window, pos, text, color)
\ No newline at end of file
+    get_ui_font(font_size).render_to(window, pos, text, color)
+
+
+def text_to_surface(surface, text, color, pos, font_name, font_size):
+    """! Draws text to a canvas surface with one of the text overlay fonts.
+
+    @param surface      Surface to draw to.
+    @param text         Text to draw.
+    @param color        Color of text.
+    @param pos          Position of text.
+    @param font_name    Name of a font in the fonts directory, like "Basic".
+    @param font_size    Size of text.
+    """
+    raster = render_text(text, font_name, font_size, color)
+    if raster is not None:
+        surface.blit(raster, pos)
+
+
+## Number of text overlay fonts kept open, each font and size pair is one entry.
+font_cache_size = 16
+## Number of rendered strings kept by render_text.
+text_cache_size = 8
+
+
+@functools.lru_cache(maxsize=font_cache_size)
+def get_font(font_name, font_size):
+    """! Gets a text overlay font, opening it from disk only the first time a font and size are used.
+
+    @param font_name    Name of a font in the fonts directory, like "Basic".
+    @param font_size    Size of the font.
+
+    @return The pygame.freetype.Font.
+    """
+    if not pg.freetype.get_init():
+        pg.freetype.init()
+    return pg.freetype.Font(asset_path("fonts/" + font_name + ".ttf"), font_size)
+
+
+@functools.lru_cache(maxsize=None)
+def get_ui_font(font_size):
+    """! Gets a ui font, opening it the first time its size is used.
+
+    @param font_size    One of font_sizes.
+
+    @return The pygame.freetype.Font.
+    """
+    with startup_report.timed("asset", "ui font %d" % font_size):
+        if not pg.freetype.get_init():
+            pg.freetype.init()
+        return pg.freetype.Font(asset_path("fonts/Basic.ttf"), font_size)
+
+
+def __getattr__(name):
+    """! Loads the images and ui fonts listed above the first time they are used.
+
+    @param name     Name of the module attribute.
+
+    @return The image or font, it is kept as a module attribute from then on.
+    """
+    if name in _images:
+        path, size = _images[name]
+        with startup_report.timed("asset", name):
+            value = pg.image.load(asset_path(path))
+            if size is not None:
+                value = pg.transform.scale(value, size)
+    elif name in _ui_fonts:
+        value = get_ui_font(_ui_fonts[name])
+    elif name == "fonts":
+        value = [get_ui_font(size) for size in font_sizes]
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def render_text(text, font_name, font_size, color):
+    """! Renders text to a surface just big enough to hold it.
+
+    The last few rendered strings are cached, so moving text only changes where the surface is blitted. The surface
+    holds the same pixels text_to_surface would draw at the top left of a transparent layer.
+
+    @param text         Text to draw.
+    @param font_name    Name of a font in the fonts directory, like "Basic".
+    @param font_size    Size of text.
+    @param color        Color of text.
+
+    @return The SRCALPHA text surface, don't draw on it. None if the text draws nothing.
+    """
+    return _render_text(text, font_name, font_size, tuple(pg.Color(color)))
+
+
+@functools.lru_cache(maxsize=text_cache_size)
+def _render_text(text, font_name, font_size, color):
+    """! Renders text, see render_text. """
+    font = get_font(font_name, font_size)
+    rect = font.get_rect(text)
+    if rect.width == 0 or rect.height == 0:
+        return None
+    raster = pg.Surface(rect.size, pg.SRCALPHA)
+    font.render_to(raster, (0, 0), text, color)
+    return raster
+
+
+def load_overlay(index):
+    """! Loads an overlay image.
+
+    Overlays are memory mapped from the pre-decoded asset cache, and only the most recently used ones stay mapped.
+
+    @param index    Index of the overlay in overlay_paths.
+
+    @return The overlay image surface, don't draw on it.
+    """
+    return _overlay_images.get(asset_path(overlay_paths[index]))
+
+
+def load_overlay_thumbnail(index):
+    """! Loads the thumbnail of an overlay image from the pre-decoded asset cache.
+
+    @param index    Index of the overlay in overlay_paths.
+
+    @return The asset_cache.thumbnail_size thumbnail surface.
+    """
+    with startup_report.timed("asset", "overlay thumbnail %d" % (index+1)):
+        return asset_cache.load(asset_path(overlay_paths[index]), asset_cache.thumbnail_size)
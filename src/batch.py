@@ -0,0 +1,196 @@
+##
+# @file batch.py
+#
+# @brief Generates art in bulk from the command line, randomized like Generate Randomly and rendered on a process pool.
+#
+# Run from the src directory, for example:
+#
+#     python batch.py 100 --out batch                          # 100 random 4K images
+#     python batch.py 20 --palette Lava --shape Circles - -    # keep the palette and the first layer's shape
+#
+# Every image gets its own master seed, derived from the batch seed, and the manifest written next to the images records
+# the recipe of each one, so any image can be rendered again with render.render_surface.
+
+# Imports
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+# The batch runs without a window, the dummy driver must be chosen before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pg
+
+from modules import generator_registry
+import assets
+import image_export
+import randomize
+import render
+
+## Name of the manifest written to the output directory.
+manifest_name = "manifest.json"
+## Image file name without its extension, from the image number starting at 1.
+file_name_format = "art_%05d"
+## Value of a per layer lock that leaves the layer's setting random.
+unlocked = "-"
+
+
+def image_seeds(seed, count):
+    """! Gets the master seeds of the images of a batch.
+
+    @param seed     The batch seed.
+    @param count    Number of images.
+
+    @return A master seed per image, the same for the same batch seed.
+    """
+    rng = render.seed_stream(seed, "batch")
+    return [rng.randrange(1 << 32) for _ in range(count)]
+
+
+def _init_worker():
+    """! Worker process initializer, pygame starts once per worker rather than once per image. """
+    pg.init()
+
+
+def _render_job(recipe, path, png_compression):
+    """! Worker job that renders a recipe and saves it.
+
+    Each worker compresses on a single thread, the batch already keeps every core busy with its own image.
+
+    @return The seconds the image took.
+    """
+    start = time.perf_counter()
+    surface = render.render_surface(recipe)
+    image_export.save_image(surface, path, png_compression=png_compression, threads=1)
+    return time.perf_counter() - start
+
+
+def get_layer_locks(args):
+    """! Gets the layer settings kept by the command line options.
+
+    An option takes one value kept for every layer, or one value per layer where unlocked leaves that layer's setting
+    random.
+
+    @param args     The parsed command line arguments.
+
+    @return A dict of the kept settings per layer, for randomize.random_recipe.
+
+    @raise ValueError   If an option has a wrong number of values, or a value that can't be drawn or is outside the
+                        range randomize picks the setting from.
+    """
+    choices = {"style": generator_registry.get_styles(), "shape": generator_registry.get_shapes()}
+    locks = [{} for _ in range(randomize.layer_count)]
+    for name in randomize.layer_settings:
+        values = getattr(args, name)
+        if values is None:
+            continue
+        if len(values) == 1:
+            values = values * randomize.layer_count
+        if len(values) != randomize.layer_count:
+            raise ValueError("--%s takes 1 or %d values" % (name, randomize.layer_count))
+        for layer_locks, value in zip(locks, values):
+            if value == unlocked:
+                continue
+            if name in choices and value not in choices[name]:
+                raise ValueError("Unknown %s %s, pick one of %s" % (name, value, ", ".join(choices[name])))
+            if name in randomize.layer_setting_ranges:
+                low, high = randomize.layer_setting_ranges[name]
+                if not value.lstrip("-").isdigit() or not low <= int(value) <= high:
+                    raise ValueError("--%s takes whole numbers from %d to %d, not %s" % (name, low, high, value))
+                layer_locks[name] = [51, int(value)] if name == "size" else int(value)
+            else:
+                layer_locks[name] = value
+    return locks
+
+
+def main(argv=None):
+    """! Generates a batch of art from the command line.
+
+    @param argv     Command line arguments, sys.argv by default.
+
+    @return The exit status, 1 if an image failed.
+    """
+    parser = argparse.ArgumentParser(description="Generates random art in bulk on a process pool.")
+    parser.add_argument("count", type=int, help="number of images")
+    parser.add_argument("--out", default="batch", help="output directory, created if missing")
+    parser.add_argument("--seed", type=int, default=None, help="batch seed, a new one by default")
+    parser.add_argument("--resolution", nargs=2, type=int, default=render.default_size, metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--format", default="png", choices=sorted(set(ext[1:] for ext in image_export.formats)))
+    parser.add_argument("--png-compression", type=int, default=image_export.default_png_compression)
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, the number of cores by default")
+    parser.add_argument("--palette", choices=list(randomize.palettes), default=None, help="palette to keep")
+    parser.add_argument("--background", type=int, default=None, help="index of the background color to keep")
+    parser.add_argument("--overlay", type=int, default=0, help="overlay number, 0 for none")
+    for name in randomize.layer_settings:
+        parser.add_argument("--" + name, nargs="+", default=None, metavar="VALUE",
+                            help="layer %s to keep, for every layer or per layer with %s for random" % (name, unlocked))
+    args = parser.parse_args(argv)
+
+    try:
+        layer_locks = get_layer_locks(args)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.palette is not None and args.background is not None and args.background >= len(randomize.palettes[args.palette]):
+        parser.error("%s has %d colors" % (args.palette, len(randomize.palettes[args.palette])))
+    if args.background is not None and args.background < 0:
+        parser.error("--background can't be negative")
+    if not 0 <= args.overlay <= len(assets.overlay_paths):
+        parser.error("--overlay takes 0 for none or an overlay number up to %d" % len(assets.overlay_paths))
+    if args.count < 0:
+        parser.error("count can't be negative")
+    if min(args.resolution) < 1:
+        parser.error("--resolution takes a width and height of at least 1")
+    low, high = image_export.png_compression_range
+    if not low <= args.png_compression <= high:
+        parser.error("--png-compression takes a level from %d to %d" % (low, high))
+    if args.processes is not None and args.processes < 1:
+        parser.error("--processes takes at least 1")
+
+    seed = render.new_seed() if args.seed is None else args.seed
+    processes = args.processes or os.cpu_count() or 1
+    os.makedirs(args.out, exist_ok=True)
+
+    images = []
+    for i, image_seed in enumerate(image_seeds(seed, args.count)):
+        images.append({
+            "file": "%s.%s" % (file_name_format % (i+1), args.format),
+            "recipe": randomize.random_recipe(image_seed, args.palette, args.background, layer_locks, args.overlay,
+                                              args.resolution)
+        })
+
+    print("%d images at %dx%d, batch seed %d, %d processes" % (args.count, args.resolution[0], args.resolution[1],
+                                                                seed, processes))
+    failed = 0
+    start = time.perf_counter()
+    # Spawned rather than forked workers, like layer_pool, each stays up for the whole batch.
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker) as executor:
+        jobs = {executor.submit(_render_job, image["recipe"], os.path.join(args.out, image["file"]),
+                                args.png_compression): image for image in images}
+        for done, job in enumerate(as_completed(jobs), 1):
+            image = jobs[job]
+            try:
+                image["seconds"] = round(job.result(), 3)
+                print("[%d/%d] %s %.2f s" % (done, args.count, image["file"], image["seconds"]))
+            except Exception as error:
+                image["error"] = str(error) or type(error).__name__
+                failed += 1
+                print("[%d/%d] %s FAILED %s" % (done, args.count, image["file"], image["error"]))
+    seconds = time.perf_counter() - start
+
+    with open(os.path.join(args.out, manifest_name), "w") as file:
+        json.dump({"seed": seed, "processes": processes, "seconds": round(seconds, 3), "images": images}, file,
+                  indent=1)
+
+    print("%d images in %.1f s, %.2f images/s, %d failed" % (args.count - failed, seconds,
+                                                              (args.count - failed) / seconds, failed))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+##
+# @file benchmark.py
+#
+# @brief Headless benchmark suite timing and memory profiling every generator over a complexity and magnitude grid.
+#
+# Run from the src directory, for example:
+#
+#     python benchmark.py --save           # record a baseline for this machine
+#     python benchmark.py                  # compare against it and report regressions
+
+# Imports
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+# The suite runs without a window, the dummy driver must be chosen before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pg
+
+from modules import generator_registry
+from modules.generators import generators
+import render
+
+## Complexities benchmarked by default, the sliders go from 1 to 30 and randomize picks 10 to 30.
+default_complexities = (10, 20, 30, 40)
+## Largest shape magnitudes benchmarked by default, the size slider goes from 50 to 400.
+default_magnitudes = (50, 100, 200, 400)
+## Palette the generators draw with.
+benchmark_palette = ["#f9ed69", "#f08a5d", "#b83b5e", "#6a2c70"]
+## Master seed of the random streams the generators draw with, so every run draws the same shapes.
+benchmark_seed = 0
+## Directory baselines are stored in, one file per machine tag.
+baseline_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+## Relative slowdown or memory growth reported as a regression by default.
+default_threshold = 0.25
+## Smallest time difference in milliseconds reported as a regression, below it timer noise dominates.
+min_time_delta = 1.0
+## Smallest memory difference in bytes reported as a regression.
+min_memory_delta = 64 * 1024
+## What the "peak" memory of a case counts, see run_case. Baselines that counted something else aren't compared.
+memory_metric = "traced+stamps"
+
+
+def machine_tag():
+    """! @return A file name safe tag naming this machine and the versions that change the results. """
+    tag = "%s-%s-%s-%dcpu-py%d.%d-pygame%s" % (platform.node() or "unknown", platform.system(), platform.machine(),
+                                               os.cpu_count() or 1, sys.version_info[0], sys.version_info[1],
+                                               pg.version.ver)
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", tag).lower()
+
+
+def baseline_path(tag=None):
+    """! @return The path of the baseline file of a machine tag, this machine by default. """
+    return os.path.join(baseline_dir, (tag or machine_tag()) + ".json")
+
+
+def case_name(shape, style, complexity, magnitude):
+    """! @return The name a benchmark case is stored under. """
+    return "%s/%s/c%d/m%d" % (shape, style, complexity, magnitude)
+
+
+def magnitude_range(magnitude):
+    """! @return The shape size range a magnitude is benchmarked with, the app draws sizes from 51 up to the slider. """
+    return [min(51, magnitude), magnitude]
+
+
+def run_case(generator, shape, style, complexity, magnitude, repeat):
+    """! Times and memory profiles one generator.
+
+    The draw is timed repeat times and the fastest run is kept, then drawn once more under tracemalloc, which slows
+    Python down too much to time with. Every run draws the same shapes from the same random stream. tracemalloc sees
+    Python objects and numpy buffers like the curve outlines, but not pygame surface pixels, so the bytes of the stamps
+    the case fills the stamp cache with are added to its peak.
+
+    @param generator    The generators utility to draw with.
+    @param shape        Shape to draw.
+    @param style        Style to draw.
+    @param complexity   Complexity of the layer.
+    @param magnitude    Largest shape magnitude.
+    @param repeat       Number of timed runs.
+
+    @return A dict with the best time in milliseconds, "ms", and the peak memory in bytes, "peak".
+    """
+    layer = pg.Surface(generator.canvas_size, pg.SRCALPHA)
+    size = magnitude_range(magnitude)
+    stream = render.layer_stream_name(0)
+
+    def draw():
+        layer.fill((0, 0, 0, 0))
+        generator.draw_shape(layer, shape, complexity, benchmark_palette, style, size,
+                             render.seed_stream(benchmark_seed, stream))
+
+    # The first draw fills the stamp cache, so every timed run measures the warm steady state the app sees.
+    generator.stamps.clear()
+    draw()
+    stamp_bytes = generator.stamps.get_bytes()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        draw()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        draw()
+        peak = tracemalloc.get_traced_memory()[1] + stamp_bytes
+    finally:
+        tracemalloc.stop()
+
+    return {"ms": round(best * 1000, 3), "peak": peak}
+
+
+def run_suite(shapes, styles, complexities, magnitudes, size=render.default_size, repeat=3, progress=None):
+    """! Runs every shape, style, complexity and magnitude combination.
+
+    @param shapes       Shapes to benchmark.
+    @param styles       Styles to benchmark.
+    @param complexities Complexities to benchmark.
+    @param magnitudes   Largest shape magnitudes to benchmark.
+    @param size         Canvas size.
+    @param repeat       Number of timed runs of each case.
+    @param progress     Function called with the case name and its result after each case, or None.
+
+    @return The results, a dict of run_case results by case_name.
+    """
+    generator = generators(size[0], size[1])
+    results = {}
+    for shape in shapes:
+        for style in styles:
+            if generator_registry.get(shape, style) is None:
+                continue
+            for complexity in complexities:
+                for magnitude in magnitudes:
+                    name = case_name(shape, style, complexity, magnitude)
+                    results[name] = run_case(generator, shape, style, complexity, magnitude, repeat)
+                    if progress is not None:
+                        progress(name, results[name])
+    return results
+
+
+def compare(results, baseline, threshold=default_threshold):
+    """! Compares results to a baseline.
+
+    A case regresses when its time or peak memory grew by more than the threshold and by more than the noise floors,
+    min_time_delta and min_memory_delta. Cases missing from either side are skipped.
+
+    @param results      Results of run_suite.
+    @param baseline     Results of a baseline run.
+    @param threshold    Relative growth reported, 0.25 reports anything over 25% slower or larger.
+
+    @return A list of (case name, metric, baseline value, new value) regressions.
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        if result["ms"] > old["ms"] * (1 + threshold) and result["ms"] - old["ms"] > min_time_delta:
+            regressions.append((name, "ms", old["ms"], result["ms"]))
+        if result["peak"] > old["peak"] * (1 + threshold) and result["peak"] - old["peak"] > min_memory_delta:
+            regressions.append((name, "peak", old["peak"], result["peak"]))
+    return regressions
+
+
+def get_mismatches(baseline, size, repeat, tag=None):
+    """! Gets the settings a baseline was measured with that differ from a run's.
+
+    Results measured on another machine, canvas size or number of runs can't be compared, a smaller canvas would hide
+    any regression.
+
+    @param baseline     A baseline as returned by load_baseline.
+    @param size         Canvas size of the run.
+    @param repeat       Number of timed runs of each case.
+    @param tag          Machine tag of the run, this machine's by default.
+
+    @return A list of descriptions of the differing settings, empty if the baseline can be compared.
+    """
+    settings = {"machine": tag or machine_tag(), "size": list(size), "repeat": repeat, "memory": memory_metric}
+    return ["%s %s instead of %s" % (name, baseline.get(name), value) for name, value in settings.items()
+            if baseline.get(name) != value]
+
+
+def load_baseline(path):
+    """! @return The baseline stored in a file, with its settings and its "results", or None if it doesn't exist. """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(path, results, size, repeat):
+    """! Saves results as a baseline, with the machine and settings they were measured with.
+
+    @param path     Path of the baseline file.
+    @param results  Results of run_suite.
+    @param size     Canvas size the results were measured on.
+    @param repeat   Number of timed runs of each case.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {
+        "machine": machine_tag(),
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "size": list(size),
+        "repeat": repeat,
+        "memory": memory_metric,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=1, sort_keys=True)
+
+
+def main(argv=None):
+    """! Runs the benchmark suite from the command line.
+
+    @param argv     Command line arguments, sys.argv by default.
+
+    @return The exit status, 1 if a regression was found, 2 if the baseline was measured with other settings.
+    """
+    parser = argparse.ArgumentParser(description="Times and memory profiles every generator headlessly.")
+    parser.add_argument("--shapes", nargs="+", default=None, help="shapes to run, all by default")
+    parser.add_argument("--styles", nargs="+", default=None, help="styles to run, all by default")
+    parser.add_argument("--complexities", nargs="+", type=int, default=default_complexities)
+    parser.add_argument("--magnitudes", nargs="+", type=int, default=default_magnitudes)
+    parser.add_argument("--size", nargs=2, type=int, default=render.default_size, metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each case, the fastest is kept")
+    parser.add_argument("--baseline", default=None, help="baseline file, the file of this machine's tag by default")
+    parser.add_argument("--threshold", type=float, default=default_threshold,
+                        help="relative growth reported as a regression")
+    parser.add_argument("--save", action="store_true", help="save the results as the baseline")
+    parser.add_argument("--quiet", action="store_true", help="only print regressions")
+    args = parser.parse_args(argv)
+
+    pg.init()
+    shapes = args.shapes or generator_registry.get_shapes()
+    styles = args.styles or generator_registry.get_styles()
+    path = args.baseline or baseline_path()
+    size = tuple(args.size)
+
+    def progress(name, result):
+        if not args.quiet:
+            print("%-40s %10.2f ms %10.1f KiB" % (name, result["ms"], result["peak"] / 1024))
+
+    if not args.quiet:
+        print("machine %s, canvas %dx%d" % (machine_tag(), size[0], size[1]))
+    results = run_suite(shapes, styles, args.complexities, args.magnitudes, size, args.repeat, progress)
+
+    status = 0
+    baseline = load_baseline(path)
+    mismatches = [] if baseline is None else get_mismatches(baseline, size, args.repeat)
+    if baseline is None:
+        print("no baseline at %s" % path)
+    elif mismatches:
+        print("can't compare against %s, it was measured with %s" % (path, ", ".join(mismatches)))
+        status = 2
+    else:
+        regressions = compare(results, baseline["results"], args.threshold)
+        for name, metric, old, new in regressions:
+            print("REGRESSION %-40s %s %g -> %g (%+.0f%%)" % (name, metric, old, new, (new / old - 1) * 100 if old else 100))
+        print("%d regressions in %d cases against %s" % (len(regressions), len(results), path))
+        status = 1 if regressions else 0
+
+    if args.save:
+        if baseline is not None and not mismatches:
+            # Cases left out of this run keep their old baseline.
+            baseline["results"].update(results)
+            results = baseline["results"]
+        elif mismatches:
+            # Results measured with other settings are replaced rather than mixed with these.
+            print("replacing the baseline measured with other settings")
+        save_baseline(path, results, size, args.repeat)
+        print("saved baseline %s" % path)
+        status = 0
+
+    pg.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
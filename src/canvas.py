@@ -7,14 +7,24 @@
 # - Created by Jessica Dawson on 03/16/2022.
 
 # Imports
+import functools
+
 import pygame as pg
 
 from widget_storage import widgets
+import profiler
+import render
+from render_graph import render_node
+
 
 class canvas:
     """! The canvas class.
 
     Provides the canvas the program draws on along with functions for drawing layers to the canvas and drawing the canvas to the ui.
+
+    The canvas is a render graph: the background, each layer, the text and the overlay feed the composite, which feeds
+    the display scale. Every node caches its output and only recomputes when its own parameters or one of its inputs
+    changed, so moving the text or picking an overlay doesn't redraw the art layers.
     """
 
     def __init__(self, x, y, width, height, display_width, display_height, window):
@@ -47,6 +57,16 @@ class canvas:
         self.bg_layer = pg.Surface((self.__width, self.__height))
         self.bg_layer.fill((255, 255, 255))
 
+        self.__background_node = render_node("background", self.__draw_background)
+        self.__layer_nodes = [render_node("layer_" + name, functools.partial(self.__draw_layer, i))
+                              for i, name in enumerate(("one", "two", "three"))]
+        self.__text_node = render_node("text", self.__draw_text)
+        self.__overlay_node = render_node("overlay", self.__draw_overlay)
+        self.__composite_node = render_node("composite", self.__composite,
+                                            [self.__background_node] + self.__layer_nodes
+                                            + [self.__text_node, self.__overlay_node])
+        self.__display_node = render_node("display_scale", self.__scale, [self.__composite_node])
+
 
     def generate_bg(self, color):
         """! Fill the canvas background with a color.
@@ -56,37 +76,83 @@ class canvas:
         self.bg_layer.fill(pg.Color(color))
 
 
-    def draw_layers(self):
+    def draw_layers(self, seed):
         """! Calls various widgets to draw to their layers.
 
-        Calls draw_canvas in all the drawing widgets.
+        Draws the layers whose settings, colors or seed changed, each with its own random stream. A layer with every
+        lock set keeps the seed it was drawn with, so it stays as it is. The text color is picked again from the master
+        seed.
+
+        @param seed     The master seed to draw with.
         """
-        self.generate_bg(widgets.color_palette.get_background_color())
+        with profiler.span("canvas.draw_layers"):
+            self.__background_node.set_params(widgets.color_palette.get_background_color())
 
-        widgets.layer_one.draw_canvas()
-        widgets.layer_two.draw_canvas()
-        widgets.layer_three.draw_canvas()
+            colors = list(widgets.color_palette.get_foreground_colors())
+            for widget, node in zip(self.get_layer_widgets(), self.__layer_nodes):
+                if widget.seed is None or not widget.is_locked():
+                    widget.seed = seed
+                node.set_params((widget.get_settings(), colors))
+                node.get()
 
-        widgets.text_overlay.draw_canvas()
+            widgets.text_overlay.randomize_color(render.seed_stream(seed, "text"))
 
 
     def draw_to_canvas(self):
         """! Blits layers to the canvas.
 
-        Combines the currently drawn layers into the canvas.
+        Combines the currently drawn layers into the canvas, redrawing the text and overlay first if their settings
+        changed. Nothing is composited or scaled again if no layer changed.
         """
-        self.canvas.blit(self.bg_layer, (0, 0))
+        with profiler.span("canvas.draw_to_canvas"):
+            self.__text_node.set_params(widgets.text_overlay.get_settings())
+            self.__overlay_node.set_params(widgets.overlay.get_active_overlay())
+            self.display_canvas = self.__display_node.get()
+
+
+    def get_layer_widgets(self):
+        """! @return The layer widgets, bottom first. """
+        return [widgets.layer_one, widgets.layer_two, widgets.layer_three]
+
 
-        self.canvas.blit(widgets.layer_one.layer, (0, 0))
-        self.canvas.blit(widgets.layer_two.layer, (0, 0))
-        self.canvas.blit(widgets.layer_three.layer, (0, 0))
+    def __draw_background(self, color):
+        """! Background node, fills the background layer with the background color once one is set. """
+        if color is not None:
+            self.generate_bg(color)
+        return self.bg_layer
 
-        self.canvas.blit(widgets.text_overlay.layer, (0, 0))
 
-        self.canvas.blit(widgets.overlay.overlay_layer, (0, 0))
+    def __draw_layer(self, index, params):
+        """! Layer node, draws a layer widget from its seed once it has been given settings. """
+        widget = self.get_layer_widgets()[index]
+        if params is not None:
+            widget.draw_canvas(render.seed_stream(params[0]["seed"], render.layer_stream_name(index)))
+        return widget.layer
+
+
+    def __draw_text(self, settings):
+        """! Text node, draws the text overlay. """
+        widgets.text_overlay.text_to_canvas()
+        return widgets.text_overlay.layer
+
+
+    def __draw_overlay(self, active_overlay):
+        """! Overlay node, draws the selected overlay image. """
+        widgets.overlay.draw_canvas()
+        return widgets.overlay.overlay_layer
+
+
+    def __composite(self, params, *layers):
+        """! Composite node, blits the layers to the canvas. """
+        render.composite(self.canvas, layers)
+        return self.canvas
+
 
-        self.canvas.convert()
-        self.display_canvas = pg.transform.smoothscale(self.canvas, (self.__display_width, self.__display_height))
+    def __scale(self, params, canvas):
+        """! Display scale node, scales the canvas to the display port. """
+        if canvas.get_size() == (self.__display_width, self.__display_height):
+            return canvas
+        return pg.transform.smoothscale(canvas, (self.__display_width, self.__display_height))
 
 
     def draw(self):
@@ -0,0 +1,171 @@
+##
+# @file export_worker.py
+#
+# @brief Defines the export_worker class which renders and saves exports in the background.
+
+# Imports
+import copy
+import queue
+import threading
+import traceback
+
+import pygame as pg
+
+import image_export
+import profiler
+
+## Smallest progress change reported with an event, so encoding a large image doesn't flood the event queue.
+progress_step = 0.01
+
+class export_job:
+    """! An export queued on an export_worker. The worker thread updates its state and progress. """
+
+    def __init__(self, path, recipe, surface, sizes, options):
+        """! Initializes the export job.
+
+        @param path     Path of the image, its extension picks the format, see image_export.formats.
+        @param recipe   The recipe of the art, see render.render_surface.
+        @param surface  The art already rendered from the recipe, or None to render it on the worker.
+        @param sizes    The (width, height) of each image of an image_export.save_pyramid export, None to save the art
+                        at its own size.
+        @param options  Keyword arguments for image_export.save_image, like png_compression.
+        """
+        ## Path of the image.
+        self.path = path
+        ## Sizes the art is saved at by image_export.save_pyramid, None to save it at its own size.
+        self.sizes = sizes
+        ## The recipe of the art, a copy so later changes to the ui don't reach the export.
+        self.recipe = copy.deepcopy(recipe)
+        ## Keyword arguments for image_export.save_image.
+        self.options = options
+        ## "queued", "rendering", "saving", "done" once saved or "failed".
+        self.state = "queued"
+        ## Fraction of the image saved so far, from 0 to 1.
+        self.progress = 0.0
+        ## Message of the error the export failed with, None unless the state is "failed".
+        self.error = None
+        ## The art to save, None once it is saved or while it still has to be rendered.
+        self.surface = surface
+
+
+    def is_finished(self):
+        """! @return True if the export was saved or failed. """
+        return self.state in ("done", "failed")
+
+
+class export_worker:
+    """! Renders and saves exports one after another on a background thread.
+
+    The ui only snapshots the recipe, and the finished background render when there is one, so it keeps running while
+    exports render and encode. Exports queue up in the order they are submitted.
+    """
+
+    def __init__(self, render_result, event_type=None):
+        """! Initializes the export worker and starts its thread.
+
+        @param render_result    Function returning the render of a recipe, like render_worker.result. It is called on
+                                the worker thread for exports submitted without a surface.
+        @param event_type       Pygame event type posted with a job attribute whenever an export changes state or
+                                makes progress, None to post no events.
+        """
+        self.__render_result = render_result
+        self.__event_type = event_type
+        self.__queue = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__jobs = []
+
+        self.__thread = threading.Thread(target=self.__run, name="export_worker", daemon=True)
+        self.__thread.start()
+
+
+    def submit(self, path, recipe, surface=None, sizes=None, **options):
+        """! Queues an export.
+
+        @param path     Path of the image, its extension picks the format. Paths ending in .svg are written by
+                        svg_export instead.
+        @param recipe   The recipe of the art, see render.render_surface.
+        @param surface  The art already rendered from the recipe, or None to render it on the worker.
+        @param sizes    The (width, height) of each image to save, see image_export.save_pyramid, none larger than the
+                        recipe size. None saves the art at the recipe size. Svg exports ignore it.
+        @param options  Keyword arguments for image_export.save_image, like png_compression or jpeg_quality.
+
+        @return The export_job, its state and progress follow the export.
+        """
+        job = export_job(path, recipe, surface, sizes, options)
+        with self.__lock:
+            # Finished exports are dropped except the latest, which the ui shows until the next one finishes.
+            finished = [old_job for old_job in self.__jobs if old_job.is_finished()]
+            self.__jobs = finished[-1:] + [old_job for old_job in self.__jobs if not old_job.is_finished()] + [job]
+        self.__queue.put(job)
+        self.__notify(job)
+        return job
+
+
+    def get_jobs(self):
+        """! @return The exports that haven't finished in the order they run, after the latest finished export. """
+        with self.__lock:
+            jobs = list(self.__jobs)
+        return [job for job in jobs if job.is_finished()][-1:] + [job for job in jobs if not job.is_finished()]
+
+
+    def wait(self):
+        """! Waits until every queued export has finished. """
+        self.__queue.join()
+
+
+    def __notify(self, job):
+        """! Posts the job's event, if the worker posts events. """
+        if self.__event_type is not None and pg.display.get_init():
+            pg.event.post(pg.event.Event(self.__event_type, job=job))
+
+
+    def __set_progress(self, job, progress):
+        """! Updates the job's progress, posting an event every progress_step. """
+        if progress - job.progress >= progress_step or progress >= 1.0:
+            job.progress = progress
+            self.__notify(job)
+
+
+    def __export(self, job):
+        """! Renders the job's art if needed and saves it. """
+        with profiler.span("export_worker.export", path=job.path):
+            if job.path.lower().endswith(".svg"):
+                # Only svg exports need the svg writer.
+                import svg_export
+                job.state = "saving"
+                self.__notify(job)
+                svg_export.export_svg(job.path, job.recipe)
+                return
+
+            surface = job.surface
+            if surface is None:
+                job.state = "rendering"
+                self.__notify(job)
+                surface = self.__render_result(job.recipe)
+
+            job.state = "saving"
+            self.__notify(job)
+            progress = lambda progress: self.__set_progress(job, progress)
+            if job.sizes is not None:
+                image_export.save_pyramid(surface, job.path, job.sizes, progress=progress, **job.options)
+            else:
+                image_export.save_image(surface, job.path, progress=progress, **job.options)
+
+
+    def __run(self):
+        """! Worker thread loop, exports the queued jobs in order. """
+        while True:
+            job = self.__queue.get()
+            try:
+                self.__export(job)
+                job.state = "done"
+            except Exception as error:
+                # Keep the worker alive for the exports queued after this one.
+                traceback.print_exc()
+                job.error = str(error) or type(error).__name__
+                job.state = "failed"
+            finally:
+                # The surface is only needed until it is saved.
+                job.surface = None
+                self.__notify(job)
+                self.__queue.task_done()
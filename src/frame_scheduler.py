@@ -0,0 +1,142 @@
+##
+# @file frame_scheduler.py
+#
+# @brief Defines the frame_scheduler class, which paces the main loop and tracks the parts of the window to redraw.
+
+# Imports
+import os
+import time
+
+import pygame as pg
+
+## Most frames drawn per second, AAG_FRAME_CAP overrides it. 0 doesn't cap the frame rate.
+default_frame_cap = int(os.environ.get("AAG_FRAME_CAP") or 60)
+## Seconds frames keep coming after the last event, so ui animations like a button returning from pressed can finish.
+default_settle_time = 0.5
+## Longest frame time handed to the ui, so waking up from a long idle isn't seen as one long frame.
+max_delta_time = 0.25
+
+class frame_scheduler:
+    """! Paces the main loop so it sleeps while nothing on screen changes.
+
+    The loop gets its events from next_events, which blocks in pg.event.wait while nothing is dirty and no animation is
+    pending, so an idle window costs no CPU. Otherwise frames run at most frame_cap times a second. Code that changes
+    what is on screen invalidates the window areas it touched, and a frame only redraws and presents those areas.
+    """
+
+    def __init__(self, size, get_sprites=None, frame_cap=default_frame_cap, settle_time=default_settle_time):
+        """! Initializes the frame scheduler.
+
+        @param size         Size of the window.
+        @param get_sprites  Function returning the sprites drawn over the window, like ui_manager.get_sprite_group.
+                            Sprites that change image, position or visibility are invalidated by invalidate_sprites.
+        @param frame_cap    Most frames drawn per second, 0 to not cap the frame rate.
+        @param settle_time  Seconds frames keep coming after the last event.
+        """
+        ## Most frames drawn per second, 0 to not cap the frame rate.
+        self.frame_cap = frame_cap
+        ## Seconds frames keep coming after the last event.
+        self.settle_time = settle_time
+        self.__window_rect = pg.Rect((0, 0), size)
+        self.__get_sprites = get_sprites
+        self.__sprite_states = {}
+        self.__clock = pg.time.Clock()
+        self.__dirty = []
+        self.__awake_until = 0.0
+        self.__last_frame = time.monotonic()
+
+
+    def invalidate(self, rect):
+        """! Marks a window area to be redrawn on the next frame.
+
+        @param rect     The area, anything pg.Rect accepts, None does nothing.
+        """
+        if rect is None:
+            return
+        rect = self.__window_rect.clip(rect)
+        if rect.width and rect.height:
+            self.__dirty.append(rect)
+
+
+    def invalidate_all(self):
+        """! Marks the whole window to be redrawn on the next frame. """
+        self.__dirty = [self.__window_rect.copy()]
+
+
+    def keep_awake(self, seconds):
+        """! Keeps frames coming for a while, for animations that change the screen without an event.
+
+        @param seconds  Seconds from now to keep running frames for.
+        """
+        self.__awake_until = max(self.__awake_until, time.monotonic() + seconds)
+
+
+    def is_dirty(self):
+        """! @return True if part of the window has to be redrawn. """
+        return bool(self.__dirty)
+
+
+    def is_idle(self):
+        """! @return True if nothing has to be redrawn and no animation is pending. """
+        return not self.__dirty and time.monotonic() >= self.__awake_until
+
+
+    def next_events(self, timeout=None):
+        """! Waits for the next frame and gets its events.
+
+        Waits out the rest of the frame if frames come faster than frame_cap, then blocks until an event arrives if the
+        loop is idle. Every event keeps the loop awake for settle_time.
+
+        @param timeout  Most seconds to block while idle, None to block until an event arrives.
+
+        @return The events of the frame and the seconds since the last frame, at most max_delta_time.
+        """
+        self.__clock.tick(self.frame_cap)
+
+        events = []
+        if self.is_idle():
+            # pg.event.wait blocks without polling, a timeout of 0 waits for as long as it takes.
+            event = pg.event.wait(0 if timeout is None else max(1, int(timeout * 1000)))
+            if event.type != pg.NOEVENT:
+                events.append(event)
+        events.extend(pg.event.get())
+        if events:
+            self.keep_awake(self.settle_time)
+
+        now = time.monotonic()
+        delta_time = min(now - self.__last_frame, max_delta_time)
+        self.__last_frame = now
+        return events, delta_time
+
+
+    def invalidate_sprites(self):
+        """! Invalidates the sprites that changed image, position or visibility, or were added or removed, since the
+        last call.
+        """
+        if self.__get_sprites is None:
+            return
+        # The images themselves are kept, not their ids, so a freed image's id being reused can't hide a change.
+        states = {sprite: (pg.Rect(sprite.rect), sprite.image, getattr(sprite, "visible", 1))
+                  for sprite in self.__get_sprites().sprites()}
+        for sprite, state in states.items():
+            old_state = self.__sprite_states.get(sprite)
+            if old_state is None or old_state[0] != state[0] or old_state[1] is not state[1] or old_state[2] != state[2]:
+                self.invalidate(state[0])
+                if old_state is not None:
+                    self.invalidate(old_state[0])
+        for sprite, old_state in self.__sprite_states.items():
+            if sprite not in states:
+                self.invalidate(old_state[0])
+        self.__sprite_states = states
+
+
+    def get_dirty_rects(self):
+        """! Gets the window areas to redraw this frame and clears them.
+
+        @return The dirty rects, an empty list if nothing has to be redrawn.
+        """
+        rects = self.__dirty
+        self.__dirty = []
+        if any(rect == self.__window_rect for rect in rects):
+            return [self.__window_rect.copy()]
+        return rects
@@ -0,0 +1,176 @@
+##
+# @file gallery.py
+#
+# @brief Defines the gallery class which renders variations of the art as a grid of thumbnails.
+
+# Imports
+import functools
+import threading
+import traceback
+
+import pygame as pg
+
+import randomize
+import render
+
+## Columns of the thumbnail grid.
+gallery_columns = 4
+## Rows of the thumbnail grid.
+gallery_rows = 4
+## Pixels between the cells of the grid.
+gallery_spacing = 6
+
+class variation:
+    """! A variation of the art shown in the gallery. The thread finishing its render sets its surface. """
+
+    def __init__(self, recipe, palette_name):
+        """! Initializes the variation.
+
+        @param recipe           The recipe of the variation at thumbnail size, see randomize.vary_recipe.
+        @param palette_name     Name of the variation's palette.
+        """
+        ## The recipe of the variation, rendered at the thumbnail size.
+        self.recipe = recipe
+        ## Name of the variation's palette.
+        self.palette_name = palette_name
+        ## The rendered thumbnail, None until it is rendered.
+        self.surface = None
+        ## True if rendering the thumbnail failed.
+        self.failed = False
+
+
+class gallery:
+    """! Renders variations of the art as a grid of thumbnails on a layer_pool.
+
+    Each thumbnail renders whole in one worker process at the size it is shown at, a small fraction of the pixels of a
+    full resolution render, so a grid renders about as fast as the workers can take them. Thumbnails are drawn as soon
+    as they are done while the others still render.
+    """
+
+    def __init__(self, pool, size, aspect_ratio, event_type=None, columns=gallery_columns, rows=gallery_rows):
+        """! Initializes the gallery, empty until it is filled.
+
+        @param pool         The layer_pool rendering the thumbnails.
+        @param size         Size of the area the grid is drawn in.
+        @param aspect_ratio Width over height of the art.
+        @param event_type   Pygame event type posted with a variation attribute whenever a thumbnail is rendered, None
+                            to post no events.
+        @param columns      Columns of the grid.
+        @param rows         Rows of the grid.
+        """
+        ## Columns of the grid.
+        self.columns = columns
+        ## Rows of the grid.
+        self.rows = rows
+        self.__cell_size = ((size[0] - (columns-1) * gallery_spacing) // columns,
+                            (size[1] - (rows-1) * gallery_spacing) // rows)
+        ## Size the thumbnails are rendered at, the largest with the art's aspect ratio that fits a cell of the grid.
+        self.thumbnail_size = (min(self.__cell_size[0], round(self.__cell_size[1] * aspect_ratio)),
+                               min(self.__cell_size[1], round(self.__cell_size[0] / aspect_ratio)))
+        self.__pool = pool
+        self.__event_type = event_type
+        self.__lock = threading.Lock()
+        self.__variations = []
+        self.__jobs = []
+
+
+    def fill(self, recipe, palette_name, palette_locks=(False, False), layer_locks=None, mutate=False):
+        """! Replaces the variations with new ones of a recipe, each with a new master seed, and starts rendering them.
+
+        @param recipe           The recipe of the current art, see render.render_surface.
+        @param palette_name     Name of the recipe's palette.
+        @param palette_locks    The palette and background locks, see randomize.vary_recipe.
+        @param layer_locks      The locked settings of each layer, see randomize.vary_recipe.
+        @param mutate           True to mutate the settings that aren't locked, False to pick them at random like
+                                Generate Randomly.
+        """
+        self.close()
+        variations = []
+        for _ in range(self.columns * self.rows):
+            variation_recipe, variation_palette = randomize.vary_recipe(recipe, render.new_seed(), palette_name,
+                                                                        palette_locks, layer_locks, mutate)
+            variation_recipe["size"] = self.thumbnail_size
+            variations.append(variation(variation_recipe, variation_palette))
+
+        jobs = [self.__pool.render(item.recipe) for item in variations]
+        with self.__lock:
+            self.__variations = variations
+            self.__jobs = jobs
+        for item, job in zip(variations, jobs):
+            job.add_done_callback(functools.partial(self.__finish, item))
+
+
+    def close(self):
+        """! Drops the variations, cancelling the renders that haven't started. """
+        with self.__lock:
+            jobs = self.__jobs
+            self.__variations = []
+            self.__jobs = []
+        for job in jobs:
+            job.cancel()
+
+
+    def is_open(self):
+        """! @return True if the gallery holds variations. """
+        return bool(self.__variations)
+
+
+    def get_variations(self):
+        """! @return The variations in grid order, left to right and top to bottom. """
+        with self.__lock:
+            return list(self.__variations)
+
+
+    def get_thumbnail_rect(self, index):
+        """! Gets where a variation's thumbnail is drawn.
+
+        @param index    Index of the variation in grid order.
+
+        @return The rect of the thumbnail relative to the grid, centered in its cell.
+        """
+        column, row = index % self.columns, index // self.columns
+        cell = pg.Rect(column * (self.__cell_size[0] + gallery_spacing), row * (self.__cell_size[1] + gallery_spacing),
+                       self.__cell_size[0], self.__cell_size[1])
+        return pg.Rect((0, 0), self.thumbnail_size).move(cell.x + (cell.width - self.thumbnail_size[0]) // 2,
+                                                         cell.y + (cell.height - self.thumbnail_size[1]) // 2)
+
+
+    def get_variation_at(self, pos):
+        """! Gets the variation whose thumbnail is at a position.
+
+        @param pos  The position relative to the grid.
+
+        @return The variation, or None if no thumbnail is there.
+        """
+        for index, item in enumerate(self.get_variations()):
+            if self.get_thumbnail_rect(index).collidepoint(pos):
+                return item
+        return None
+
+
+    def draw(self, window, pos, placeholder_color):
+        """! Draws the thumbnails, and a placeholder for each one still rendering.
+
+        @param window               The surface to draw on.
+        @param pos                  Position of the grid on the window.
+        @param placeholder_color    Color of the placeholders.
+        """
+        for index, item in enumerate(self.get_variations()):
+            rect = self.get_thumbnail_rect(index).move(pos)
+            if item.surface is not None:
+                window.blit(item.surface, rect)
+            else:
+                window.fill(placeholder_color, rect)
+
+
+    def __finish(self, item, job):
+        """! Done callback of a thumbnail render, keeps the thumbnail and posts the gallery's event. """
+        if job.cancelled():
+            return
+        try:
+            item.surface = pg.image.frombytes(job.result(), item.recipe["size"], "RGB")
+        except Exception:
+            traceback.print_exc()
+            item.failed = True
+        if self.__event_type is not None and pg.display.get_init():
+            pg.event.post(pg.event.Event(self.__event_type, variation=item))
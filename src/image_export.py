@@ -0,0 +1,433 @@
+##
+# @file image_export.py
+#
+# @brief Saves rendered art as PNG, JPEG, BMP or TGA images, with the format picked from the file extension.
+#
+# PNG images are written by an encoder here, since pygame's writer has no compression level and runs on one core. It
+# compresses pieces of the image on every core and streams them to the file. A low level saves large art several times
+# faster, level 0 stores the pixels uncompressed. JPEG images are written by Pillow when
+# it is installed, so their quality can be chosen, and by pygame at its fixed quality of 85 otherwise. BMP and TGA
+# images are uncompressed, for tools that read raw pixels fastest.
+
+# Imports
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import os
+import struct
+import sys
+import zlib
+
+import numpy as np
+import pygame as pg
+
+## Export formats by file extension.
+formats = {
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".bmp": "BMP",
+    ".tga": "TGA"
+}
+
+## Lowest and highest zlib level of PNG images.
+png_compression_range = (0, 9)
+## Lowest and highest quality of JPEG images.
+jpeg_quality_range = (1, 95)
+
+
+def _get_setting(name, default, value_range):
+    """! Reads a whole number setting from the environment.
+
+    @param name         Name of the environment variable.
+    @param default      Value used when the variable is unset or isn't a whole number.
+    @param value_range  Lowest and highest value, values outside it are clamped to it.
+
+    @return The setting.
+    """
+    try:
+        value = int(os.environ.get(name) or default)
+    except ValueError:
+        print("%s=%s isn't a whole number, using %d" % (name, os.environ[name], default), file=sys.stderr)
+        return default
+    return min(max(value, value_range[0]), value_range[1])
+
+
+## zlib level PNG images are compressed with, AAG_PNG_COMPRESSION overrides it.
+default_png_compression = _get_setting("AAG_PNG_COMPRESSION", 6, png_compression_range)
+## Quality JPEG images are saved with, AAG_JPEG_QUALITY overrides it.
+default_jpeg_quality = _get_setting("AAG_JPEG_QUALITY", 90, jpeg_quality_range)
+## Sizes save_pyramid writes by default, 4K, 1080p, 720p and a thumbnail. Each is a whole fraction of a larger one, so
+# every level is an exact box filter of another.
+pyramid_sizes = [(3840, 2160), (1920, 1080), (1280, 720), (320, 180)]
+## Rows of pixels the PNG encoder compresses as one piece, about 0.7 MB of a 4K image.
+png_rows_per_step = 64
+
+_png_signature = b"\x89PNG\r\n\x1a\n"
+## Second byte of the zlib header for each compression level.
+_zlib_level_flags = [0x01, 0x01, 0x5e, 0x5e, 0x5e, 0x5e, 0x9c, 0xda, 0xda, 0xda]
+
+
+def get_format(path):
+    """! Gets the export format of a file from its extension.
+
+    @param path     Path of the file.
+
+    @return One of the formats values, or None if the extension isn't an export format.
+    """
+    return formats.get(os.path.splitext(path)[1].lower())
+
+
+def save_image(surface, path, png_compression=default_png_compression, jpeg_quality=default_jpeg_quality,
+               progress=None, threads=None):
+    """! Saves a surface in the format of its file extension.
+
+    The image is written to a temporary file first and moved over path once it is complete, so a failed or interrupted
+    save never leaves half an image behind.
+
+    @param surface          The surface to save.
+    @param path             Path of the image, its extension picks the format, see formats.
+    @param png_compression  zlib level of PNG images, 0 to 9.
+    @param jpeg_quality     Quality of JPEG images, 1 to 95.
+    @param progress         Function called with the fraction of the image saved so far, from 0 to 1.
+    @param threads          Number of threads compressing PNG images, defaults to the number of cores.
+
+    @raise ValueError   If the extension isn't an export format, or the compression or quality is out of range.
+    @raise OSError      If the image can't be written.
+    """
+    image_format = get_format(path)
+    if image_format is None:
+        raise ValueError("Not an export format: " + path)
+    if image_format == "PNG" and not png_compression_range[0] <= png_compression <= png_compression_range[1]:
+        raise ValueError("PNG compression is from %d to %d, not %s" % (*png_compression_range, png_compression))
+    if image_format == "JPEG" and not jpeg_quality_range[0] <= jpeg_quality <= jpeg_quality_range[1]:
+        raise ValueError("JPEG quality is from %d to %d, not %s" % (*jpeg_quality_range, jpeg_quality))
+
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        with open(temp_path, "wb") as file:
+            if image_format == "PNG":
+                save_png(surface, file, png_compression, progress, threads)
+            elif image_format == "JPEG":
+                save_jpeg(surface, file, jpeg_quality)
+            elif image_format == "TGA":
+                save_tga(surface, file)
+            else:
+                save_bmp(surface, file)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if progress is not None:
+        progress(1.0)
+
+
+def downsample(surface, factor):
+    """! Shrinks a surface by a whole factor with a box filter.
+
+    Each pixel of the result is the rounded mean of the factor by factor block of pixels it covers, computed in integers
+    on views of the surfaces' buffers, so shrinking is exact and takes about one pass over the pixels. Every channel,
+    alpha included, is averaged on its own.
+
+    @param surface  The surface to shrink, its width and height must be multiples of factor.
+    @param factor   The whole factor to shrink by, 1 returns a copy.
+
+    @return A new surface with the format of surface, factor times smaller.
+
+    @raise ValueError   If factor isn't a whole divisor of the surface's width and height.
+    """
+    width, height = surface.get_size()
+    if factor < 1 or width % factor or height % factor:
+        raise ValueError("%dx%d can't be shrunk by a factor of %s" % (width, height, factor))
+    if surface.get_bytesize() != 4:
+        # Pixels are averaged in their memory layout, which is simplest with 4 bytes per pixel.
+        converted = pg.Surface((width, height), 0, 32)
+        converted.blit(surface, (0, 0))
+        surface = converted
+
+    small = pg.Surface((width // factor, height // factor), surface.get_flags() & pg.SRCALPHA, surface)
+    small_width, small_height = small.get_size()
+    src_buffer, dst_buffer = surface.get_buffer(), small.get_buffer()
+    src = np.frombuffer(src_buffer, np.uint8).reshape(height, surface.get_pitch())[:, :width * 4]
+    dst = np.frombuffer(dst_buffer, np.uint8).reshape(small_height, small.get_pitch())[:, :small_width * 4]
+    area = factor * factor
+    dtype = np.uint16 if area * 256 <= 0xffff else np.uint32
+
+    # A few rows at a time, so the sums stay small enough to sit in the cache.
+    step = max(1, png_rows_per_step // factor)
+    for top in range(0, small_height, step):
+        rows = min(step, small_height - top)
+        blocks = src[top * factor:(top + rows) * factor].reshape(rows, factor, small_width, factor, 4)
+        total = np.full((rows, small_width, 4), area // 2, dtype)
+        for y in range(factor):
+            for x in range(factor):
+                total += blocks[:, y, :, x]
+        dst[top:top + rows] = (total // area).reshape(rows, small_width * 4)
+    del src, dst, src_buffer, dst_buffer
+    return small
+
+
+def build_pyramid(surface, sizes=pyramid_sizes):
+    """! Shrinks a surface to several sizes, each built from the smallest level already built that it's a whole
+    fraction of.
+
+    With the default sizes the 1080p and 720p levels are built from the 4K surface, by factors of 2 and 3, and the
+    thumbnail from the 720p level, by a factor of 4, see downsample. Sizes that aren't a whole fraction of any level
+    are smoothscaled from the surface.
+
+    @param surface  The surface to shrink.
+    @param sizes    The (width, height) of each level, none larger than the surface. The surface's own size gives the
+                    surface itself.
+
+    @return The levels in the order of sizes.
+
+    @raise ValueError   If a size is larger than the surface.
+    """
+    levels = {surface.get_size(): surface}
+    for width, height in sorted(set(map(tuple, sizes)), key=lambda size: -size[0] * size[1]):
+        if width > surface.get_width() or height > surface.get_height():
+            raise ValueError("Can't shrink %dx%d to %dx%d" % (surface.get_width(), surface.get_height(), width, height))
+        if (width, height) in levels:
+            continue
+        exact = [(level_width // width, level) for (level_width, level_height), level in levels.items()
+                 if level_width % width == 0 and level_height % height == 0
+                 and level_width // width == level_height // height]
+        if exact:
+            factor, level = min(exact, key=lambda pair: pair[0])
+            levels[(width, height)] = downsample(level, factor)
+        else:
+            levels[(width, height)] = pg.transform.smoothscale(surface, (width, height))
+    return [levels[tuple(size)] for size in sizes]
+
+
+def get_pyramid_path(path, size):
+    """! Gets the path save_pyramid writes a level to.
+
+    @param path     Path given to save_pyramid.
+    @param size     The (width, height) of the level.
+
+    @return The path with the level's size before its extension, like art_1920x1080.png.
+    """
+    root, extension = os.path.splitext(path)
+    return "%s_%dx%d%s" % (root, size[0], size[1], extension)
+
+
+def save_pyramid(surface, path, sizes=pyramid_sizes, progress=None, **options):
+    """! Saves a surface at several sizes in one pass, see build_pyramid.
+
+    The smaller levels cost little next to encoding the largest, a 4K, 1080p, 720p and thumbnail set encodes about 40%
+    more pixels than the 4K image alone.
+
+    @param surface  The surface to save, at least as large as every size.
+    @param path     Path of the images, each level is saved to get_pyramid_path(path, size).
+    @param sizes    The (width, height) of each level.
+    @param progress Function called with the fraction of the pixels of every level saved so far, from 0 to 1.
+    @param options  Keyword arguments for save_image, like png_compression.
+
+    @return The paths of the saved levels in the order of sizes.
+
+    @raise ValueError   If the extension isn't an export format or a size is larger than the surface.
+    @raise OSError      If an image can't be written.
+    """
+    if get_format(path) is None:
+        raise ValueError("Not an export format: " + path)
+
+    total = sum(width * height for width, height in sizes)
+    done = 0
+    paths = []
+    for size, level in zip(sizes, build_pyramid(surface, sizes)):
+        share = size[0] * size[1] / total
+        level_progress = None
+        if progress is not None:
+            level_progress = lambda fraction, done=done, share=share: progress(done + fraction * share)
+        paths.append(get_pyramid_path(path, size))
+        save_image(level, paths[-1], progress=level_progress, **options)
+        done += share
+    return paths
+
+
+def _write_png_chunk(file, kind, data):
+    """! Writes a PNG chunk, its length, type, data and CRC. """
+    file.write(struct.pack(">I", len(data)) + kind)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+def _get_pixels(surface):
+    """! Gets the surface's pixels, and the order to pick their channels in for red, green, blue and, for surfaces with
+    per pixel alpha, alpha.
+
+    32 bit surfaces are read in place through their buffer, so picking the channels of a few rows only copies those
+    rows. Other surfaces are copied whole.
+
+    @param surface  The surface to read.
+
+    @return A height by width by bytes per pixel array, the list of channel indices, and the buffer keeping the surface
+            locked while it is read or None.
+    """
+    width, height = surface.get_size()
+    channels = 4 if surface.get_flags() & pg.SRCALPHA else 3
+    if surface.get_bytesize() != 4:
+        pixels = np.frombuffer(pg.image.tobytes(surface, "RGBA" if channels == 4 else "RGB"), np.uint8)
+        return pixels.reshape(height, width, channels), list(range(channels)), None
+
+    buffer = surface.get_buffer()
+    pixels = np.frombuffer(buffer, np.uint8).reshape(height, surface.get_pitch())[:, :width * 4]
+    # Byte of each channel within a pixel, from the shift of its mask.
+    order = [shift // 8 if sys.byteorder == "little" else 3 - shift // 8 for shift in surface.get_shifts()[:channels]]
+    return pixels.reshape(height, width, 4), order, buffer
+
+
+def _adler32_combine(adler1, adler2, length2):
+    """! Combines the Adler-32 checksums of two pieces of data into the checksum of them joined, like zlib's
+    adler32_combine which Python doesn't expose.
+
+    @param adler1   Checksum of the first piece.
+    @param adler2   Checksum of the second piece.
+    @param length2  Length of the second piece in bytes.
+
+    @return The checksum of both pieces one after the other.
+    """
+    base = 65521
+    sum1 = ((adler1 & 0xffff) + (adler2 & 0xffff) + base - 1) % base
+    sum2 = (length2 % base * (adler1 & 0xffff) + (adler1 >> 16) + (adler2 >> 16) + base - length2 % base) % base
+    return sum1 | (sum2 << 16)
+
+
+def _filter_rows(pixels, order, top, bottom):
+    """! @return Rows top to bottom of a PNG image as they are compressed, each starting with its filter type. """
+    rows = np.empty((bottom - top, pixels.shape[1] * len(order) + 1), np.uint8)
+    # Filter type 0 leaves the row unfiltered.
+    rows[:, 0] = 0
+    # Copying one channel at a time is several times faster than gathering the channels with fancy indexing.
+    channels = rows[:, 1:].reshape(bottom - top, pixels.shape[1], len(order))
+    for i, channel in enumerate(order):
+        channels[:, :, i] = pixels[top:bottom, :, channel]
+    return rows
+
+
+def _deflate_rows(pixels, order, top, bottom, compression_level, last):
+    """! Filters and compresses rows of a PNG image on their own, as a piece of a raw deflate stream.
+
+    Pieces end on a sync flush, which aligns them to a byte without marking the end of the stream, so they can be
+    compressed at the same time and joined in order. Only the last one finishes the stream. Each piece is primed with
+    the 32 KB of rows before it, which the decoder has just output, so it compresses almost as well as one stream.
+
+    @return The compressed piece, the Adler-32 checksum of the filtered rows and their length in bytes.
+    """
+    rows = _filter_rows(pixels, order, top, bottom)
+    if top > 0:
+        window = 1 << zlib.MAX_WBITS
+        window_rows = min(top, -(-window // rows.shape[1]))
+        dictionary = _filter_rows(pixels, order, top - window_rows, top).tobytes()[-window:]
+        compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(rows) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+    return data, zlib.adler32(rows), rows.nbytes
+
+
+def save_png(surface, file, compression_level=default_png_compression, progress=None, threads=None):
+    """! Writes a surface as a PNG image.
+
+    The rows are split into pieces that are compressed on a thread pool, zlib releases the GIL so they compress in
+    parallel, and written to the file as IDAT chunks in order as they finish. Only a few pieces are held in memory at
+    a time, and rows are read straight from the surface, so memory stays flat whatever the image size. Surfaces with
+    per pixel alpha are saved as RGBA, others as RGB.
+
+    @param surface              The surface to save.
+    @param file                 Binary file to write to.
+    @param compression_level    zlib level, 0 to 9.
+    @param progress             Function called with the fraction of the rows written so far, from 0 to 1.
+    @param threads              Number of threads compressing, defaults to the number of cores.
+    """
+    width, height = surface.get_size()
+    pixels, order, buffer = _get_pixels(surface)
+
+    file.write(_png_signature)
+    # Width, height, 8 bits per channel, truecolor with or without alpha, deflate, adaptive filtering, no interlace.
+    _write_png_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6 if len(order) == 4 else 2, 0, 0, 0))
+    # The zlib header, its level bits only describe the compression, and its check bits make it a multiple of 31.
+    _write_png_chunk(file, b"IDAT", bytes([0x78, _zlib_level_flags[compression_level]]))
+
+    threads = threads or os.cpu_count() or 1
+    adler = 1
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="png_encoder") as executor:
+        for top in range(0, height, png_rows_per_step):
+            bottom = min(top + png_rows_per_step, height)
+            pending.append((executor.submit(_deflate_rows, pixels, order, top, bottom, compression_level,
+                                            bottom == height), bottom))
+            # Pieces are written as soon as they are next in line, a couple per thread keeps every thread busy
+            # without holding the whole image.
+            while pending and (len(pending) >= 2 * threads or bottom == height):
+                piece, piece_bottom = pending.popleft()
+                data, piece_adler, length = piece.result()
+                adler = _adler32_combine(adler, piece_adler, length)
+                _write_png_chunk(file, b"IDAT", data)
+                if progress is not None:
+                    progress(piece_bottom / height)
+    del pixels, buffer
+
+    _write_png_chunk(file, b"IDAT", struct.pack(">I", adler))
+    _write_png_chunk(file, b"IEND", b"")
+
+
+def save_jpeg(surface, file, quality=default_jpeg_quality):
+    """! Writes a surface as a JPEG image.
+
+    @param surface  The surface to save.
+    @param file     Binary file to write to.
+    @param quality  Quality from 1 to 95, only used when Pillow is installed, pygame always saves at 85.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        pg.image.save(surface, file, "image.jpg")
+        return
+    image = Image.frombuffer("RGB", surface.get_size(), pg.image.tobytes(surface, "RGB"), "raw", "RGB", 0, 1)
+    image.save(file, "JPEG", quality=quality)
+
+
+def _get_bgr_rows(surface):
+    """! @return The surface's pixels as a height by width by 3 array of blue, green, red bytes. """
+    width, height = surface.get_size()
+    return np.frombuffer(pg.image.tobytes(surface, "RGB"), np.uint8).reshape(height, width, 3)[:, :, ::-1]
+
+
+def save_bmp(surface, file):
+    """! Writes a surface as an uncompressed 24 bit BMP image, alpha is dropped.
+
+    pygame's own BMP writer is only reliable when given a path, and images are written through a temporary file.
+
+    @param surface  The surface to save.
+    @param file     Binary file to write to.
+    """
+    width, height = surface.get_size()
+    stride = (width * 3 + 3) & ~3
+    rows = np.zeros((height, stride), np.uint8)
+    # Rows are stored bottom to top, each padded to a multiple of 4 bytes.
+    rows[:, :width * 3] = _get_bgr_rows(surface)[::-1].reshape(height, width * 3)
+    offset = 14 + 40
+    file.write(struct.pack("<2sIHHI", b"BM", offset + rows.nbytes, 0, 0, offset))
+    # Header size, width, height, 1 plane, 24 bits per pixel, uncompressed, image size, 72 DPI, no color table.
+    file.write(struct.pack("<IiiHHIIiiII", 40, width, height, 1, 24, 0, rows.nbytes, 2835, 2835, 0, 0))
+    file.write(rows.tobytes())
+
+
+def save_tga(surface, file):
+    """! Writes a surface as an uncompressed TGA image, with top to bottom rows.
+
+    @param surface  The surface to save.
+    @param file     Binary file to write to.
+    """
+    width, height = surface.get_size()
+    has_alpha = surface.get_flags() & pg.SRCALPHA
+    # No id or color map, uncompressed truecolor, 0x20 orders rows top to bottom, the low bits count the alpha bits.
+    file.write(struct.pack("<BBBHHBHHHHBB", 0, 0, 2, 0, 0, 0, 0, 0, width, height, 32 if has_alpha else 24,
+                           0x28 if has_alpha else 0x20))
+    if has_alpha:
+        file.write(pg.image.tobytes(surface, "BGRA"))
+    else:
+        file.write(_get_bgr_rows(surface).tobytes())
@@ -0,0 +1,180 @@
+##
+# @file layer_pool.py
+#
+# @brief Defines the layer_pool class which draws art layers in parallel worker processes.
+
+# Imports
+from concurrent.futures import ProcessPoolExecutor, wait
+import multiprocessing
+from multiprocessing import shared_memory
+
+import pygame as pg
+
+from modules.generators import generators
+import render
+
+## Generators utilities of a worker process, by (width, height, reference_size), so stamp caches stay warm between jobs.
+_worker_generators = {}
+
+
+class shared_layer:
+    """! A SRCALPHA layer surface whose pixels live in shared memory.
+
+    The surface wraps the shared memory directly, so a layer drawn by a worker process is composited without a copy.
+    """
+
+    def __init__(self, size):
+        """! Allocates the shared memory and wraps it in a cleared surface.
+
+        @param size     Size of the layer.
+        """
+        ## Size of the layer.
+        self.size = size
+        self.__memory = shared_memory.SharedMemory(create=True, size=size[0] * size[1] * 4)
+        ## The layer surface, uses the memory layout of a pg.SRCALPHA surface.
+        self.surface = pg.image.frombuffer(self.__memory.buf, size, "BGRA")
+        self.surface.fill((0, 0, 0, 0))
+
+
+    def get_name(self):
+        """! @return The shared memory name a worker process attaches to. """
+        return self.__memory.name
+
+
+    def release(self):
+        """! Drops the surface and frees the shared memory. """
+        self.surface = None
+        # Unlinked first, so the memory is freed even if a traceback still holds the surface, see _close.
+        self.__memory.unlink()
+        _close(self.__memory)
+
+
+def _attach(name, size):
+    """! Attaches to a shared layer from a worker process.
+
+    @param name     Shared memory name of the layer.
+    @param size     Size of the layer.
+
+    @return The shared memory and the surface wrapping it.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, pg.image.frombuffer(memory.buf, size, "BGRA")
+
+
+def _close(memory):
+    """! Unmaps shared memory from this process.
+
+    A surface over the memory that is still referenced, like by the traceback of a failed draw, keeps the memory
+    mapped until it is dropped. Closing is then left to the memory's finalizer rather than raising over the error.
+
+    @param memory   The shared memory to close.
+    """
+    try:
+        memory.close()
+    except BufferError:
+        pass
+
+
+def _get_generator(size, reference_size):
+    """! Gets the worker's generators utility for a canvas size. """
+    key = (size, reference_size)
+    if key not in _worker_generators:
+        _worker_generators[key] = generators(size[0], size[1], reference_size)
+    return _worker_generators[key]
+
+
+def _draw_layer_job(name, size, reference_size, settings, cp, rng):
+    """! Worker job that draws one art layer into a shared layer. """
+    memory, surface = _attach(name, size)
+    try:
+        render.draw_layer(surface, settings, cp, _get_generator(size, reference_size), rng)
+    finally:
+        del surface
+        _close(memory)
+
+
+def _draw_text_job(name, size, reference_size, settings):
+    """! Worker job that draws the text overlay into a shared layer. """
+    memory, surface = _attach(name, size)
+    try:
+        render.draw_text(surface, settings, _get_generator(size, reference_size))
+    finally:
+        del surface
+        _close(memory)
+
+
+def _render_job(recipe):
+    """! Worker job that renders a whole recipe, returning its pixels as RGB bytes. """
+    return pg.image.tobytes(render.render_surface(recipe), "RGB")
+
+
+class layer_pool:
+    """! Process pool that draws the art layers and the text overlay of a recipe at the same time.
+
+    Work scales with the number of cores instead of being bound to the one running the ui or the render worker.
+    """
+
+    def __init__(self, processes=None):
+        """! Initializes the layer pool, worker processes start on first use.
+
+        @param processes    Number of worker processes, defaults to the number of cores.
+        """
+        # Spawned rather than forked workers, the ui process has a window and background threads.
+        self.__executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+
+
+    def draw_layers(self, recipe, reference_size=None):
+        """! Draws the art layers and text overlay of a recipe in the worker processes.
+
+        @param recipe           The recipe to draw, see render.render_surface.
+        @param reference_size   Reference space size for the generators, see generators.
+
+        @return The shared_layer list in composite order. Release each once it has been composited.
+        """
+        size = tuple(recipe.get("size", render.default_size))
+        cp = render.foreground_colors(recipe)
+
+        layers = [shared_layer(size) for _ in recipe["layers"]]
+        jobs = []
+        # Most expensive layers first, so a slow layer doesn't start last while the other workers sit idle.
+        for i in sorted(range(len(layers)), key=lambda i: -render.estimate_layer_cost(recipe["layers"][i], size)):
+            jobs.append(self.__executor.submit(_draw_layer_job, layers[i].get_name(), size, reference_size,
+                                               recipe["layers"][i], cp, render.layer_stream(recipe, i)))
+
+        if recipe.get("text"):
+            layer = shared_layer(size)
+            layers.append(layer)
+            jobs.append(self.__executor.submit(_draw_text_job, layer.get_name(), size, reference_size, recipe["text"]))
+
+        wait(jobs)
+        try:
+            for job in jobs:
+                job.result()
+        except BaseException:
+            for layer in layers:
+                layer.release()
+            raise
+
+        for layer, settings in zip(layers, recipe["layers"]):
+            render.set_layer_blending(layer.surface, settings)
+
+        return layers
+
+
+    def render(self, recipe):
+        """! Renders a whole recipe in one worker process.
+
+        Small renders like thumbnails cost too little to split by layer, several of them rendering at once keeps every
+        worker busy instead.
+
+        @param recipe   The recipe to render, see render.render_surface.
+
+        @return A future of the rendered pixels as RGB bytes, pg.image.frombytes turns them into a surface of the
+                recipe size. It can be cancelled until a worker starts it.
+        """
+        return self.__executor.submit(_render_job, recipe)
+
+
+    def shutdown(self):
+        """! Stops the worker processes. """
+        self.__executor.shutdown()
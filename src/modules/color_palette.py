@@ -14,45 +14,9 @@ import pygame as pg
 
 from modules.widget import widget
 import assets
+from render_graph import render_node
+import randomize
 
-_color_palettes = {
-    "Forest" : ["#323232", "#295f4e", "#6db193", "#f4e5c2"],
-    "Futuristic" : ["#222831", "#393e46", "#00adb5", "#eeeeee"],
-    "Sunset" : ["#f9ed69", "#f08a5d", "#b83b5e", "#6a2c70"],
-    "Vintage" : ["#f85f73", "#fbe8d3", "#928a97", "#283c63"],
-    "Crimson" : ["#0f1021", "#d01257", "#fb90b7", "#ffcee4"],
-    "Vampire" : ["#34374c", "#2c2e3e", "#ee2b47", "#f6f6f6"],
-    "Lightning" : ["#f3f3f3", "#ffdd67", "#ffcd38", "#4a4a4a"],
-    "Pastel" : ["#8fcfd1", "#df5e88", "#f6ab6c", "#f6efa6"],
-    "Lava" : ["#2f2519", "#4a3f35", "#fa7d09", "#ff4301"],
-    "Neon" : ["#0c093c", "#df42d1", "#eea5f6", "#fad6d6"],
-    "Lilac" : ["#f0e3ff", "#d89cf6", "#916dd5", "#3e206d"],
-    "Soft Gray" : ["#3c4245", "#5f6769", "#719192", "#dfcdc3"],
-    "Low Saturation" : ["#333644", "#84577c", "#c65f63", "#f6e1b8"],
-    "Poison" : ["#151716", "#3e432e", "#616f39", "#a7d129"],
-    "Spring" : ["#f9f9f9", "#ffe0ac", "#ffacb7", "#6886c5"],
-    "Black & White" : ["#262626", "#595959", "#b0b0b0", "#e3e3e3"],
-    "Corruption" : ["#6f4a8e", "#221f3b", "#050505", "#ebebeb"],
-    "Ivy" : ["#1fab89", "#62d2a2", "#9df3c4", "#d7fbe8"],
-    "Ocean" : ["#73f7dd", "#2cc4cb", "#1972a4", "#2e3a87"],
-    "Royalty" : ["#fcf0c8", "#f7d098", "#911f27", "#630a10"],
-    "Transit" : ["#5BCEFA", "#F5A9B8", "#FFFFFF"],
-    "Lipstick" : ["#d52d00", "#ef7627", "#ff9a56", "#ffffff",
-    "#D162A4", "#B55690", "#A30262"],
-    "Beach" : ["#73f7dd", "#2cc4cb", "#1972a4", "#2e3a87",
-    "#fcf0c8", "#f7d098", "#911f27", "#630a10"],
-    "Rose" : ["#6f58c9", "#7e78d2", "#b6b8d6", "#bbdbd1", "#bdede0"],
-    "Rainforest": ["#00241B", "#4e878c", "#65B891", "#93E5AB", "#B5FFE1"],
-    "Spring" : ["#040926", "#251351", "#7D2E68", "#A85751", "#C97B84"],
-    "Halloween" : ["#5E503F","#A9927D","#F2F4F3","#22333B","#0A0908"],
-    "Autumn" : ["#C3E991","#DFCC74","#CB904D","#75485E","#51A3A3"],
-    "Bright" : ["#89FC00","#008BF8","#DC0073","#F5B700","#04E762"],
-    "Pistacho" : ["#3C1742","#F3FFB9","#C42021","#6C0E23","#561643"],
-    "Steal Teal" : ["#492C1D","#5B5750","#6B7F82","#7C99B4","#8EB8E5"],
-    "Violet Desert" : ["#18020C","#634B66","#9590A8","#BBCBCB","#E5FFDE"],
-    "Verve" : ["#A2666F","#F49390","#F45866","#C45AB3","#631A86"],
-    
-}
 
 class color_palette(widget):
     """! The color palette widget class.
@@ -80,9 +44,9 @@ class color_palette(widget):
         self.ui_h1_color = "#FFFFFF"
 
         ## Name of currently selected palette
-        self.palette_name = choice(list(_color_palettes.keys()))
+        self.palette_name = choice(list(randomize.palettes.keys()))
         ## Colors of currently selected palette
-        self.palette_colors = _color_palettes[self.palette_name]
+        self.palette_colors = randomize.palettes[self.palette_name]
         ## The palette color selected as the background
         self.background_index = 0
 
@@ -91,33 +55,44 @@ class color_palette(widget):
         ## 1 if radomization of the background color is locked, 0 otherwise
         self.background_lock = 0
 
+        self.__panel = render_node("color_palette.panel", self.__draw_panel)
+
 
     def draw_ui_dynamic(self):
         """! Draws the dynamic ui elements for the color palette widget.
 
-        Draws the text, lock icons, and color swatches.
+        Draws the text, lock icons, and color swatches, from a panel that is only drawn again when the theme, a lock or
+        the selected colors change.
         """
 
-        interactables_margin = self.__x + 42
-        lock_margin = self.__x + 17
+        self.__panel.set_params((self.color, self.ui_h1_color, self.palette_lock, self.background_lock,
+                                 tuple(self.palette_colors), self.background_index))
+        self.__window.blit(self.__panel.get(), (self.__x, self.__y))
 
-        pg.draw.rect(self.__window, pg.Color(self.color), (self.__x, self.__y, 252, 135))
 
-        if self.palette_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+35))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+35))
+    def __draw_panel(self, key):
+        """! Draws the background, text, lock icons and color swatches of the widget to a new panel surface.
+
+        @param key      The theme colors, locks and selected colors the panel is drawn with, see draw_ui_dynamic.
+
+        @return The panel surface, drawn at the widget position.
+        """
+
+        panel = pg.Surface((252, 135))
+        interactables_margin = 42
+        lock_margin = 17
+
+        panel.fill(pg.Color(self.color))
 
-        if self.background_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+68))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+68))
+        panel.blit(assets.lock_enabled if self.palette_lock else assets.lock_disabled, (lock_margin, 35))
+        panel.blit(assets.lock_enabled if self.background_lock else assets.lock_disabled, (lock_margin, 68))
 
-        assets.text_to_screen(window=self.__window, text="COLOR PALETTE", color=self.ui_h1_color, pos=(interactables_margin, self.__y+15), font_size=18)
+        assets.text_to_screen(window=panel, text="COLOR PALETTE", color=self.ui_h1_color, pos=(interactables_margin, 15), font_size=18)
         for i, color in enumerate(self.palette_colors):
-            pg.draw.rect(self.__window, assets.active_color if self.background_index == i else assets.inactive_color,
-                        (interactables_margin+((i%4)*50), self.__y+65+(36*(i//4)), 26, 26))
-            pg.draw.rect(self.__window, pg.Color(color), (interactables_margin+3+((i%4)*50), self.__y+68+(36*(i//4)), 20, 20))
+            pg.draw.rect(panel, assets.active_color if self.background_index == i else assets.inactive_color,
+                        (interactables_margin+((i%4)*50), 65+(36*(i//4)), 26, 26))
+            pg.draw.rect(panel, pg.Color(color), (interactables_margin+3+((i%4)*50), 68+(36*(i//4)), 20, 20))
+        return panel
 
 
     def change_colors(self):
@@ -136,7 +111,7 @@ class color_palette(widget):
 
         cp_len = len(self.palette_colors)
 
-        current_palette_dropdown = pgui.elements.UIDropDownMenu(options_list=_color_palettes.keys(),
+        current_palette_dropdown = pgui.elements.UIDropDownMenu(options_list=randomize.palettes.keys(),
                                                             starting_option=self.palette_name,
                                                             relative_rect=pg.Rect(interactables_margin, self.__y+35, 200, 22), manager=self.__ui_manager,
                                                             object_id="current_palette_dropdown")
@@ -182,18 +157,34 @@ class color_palette(widget):
                 self.background_index_buttons[i].hide()
 
 
-    def randomize(self):
-        """! Randomize the current color palette and background color. """
+    def randomize(self, rng):
+        """! Randomize the current color palette and background color.
+
+        @param rng      The random.Random stream to randomize with.
+        """
 
+        self.palette_name, self.background_index = randomize.randomize_palette(
+            rng, self.palette_name, self.background_index, self.palette_lock == 1, self.background_lock == 1)
         if self.palette_lock == 0:
-            self.palette_name = choice(list(_color_palettes.keys()))
-            self.palette_colors = _color_palettes[self.palette_name]
-            if self.background_index >= len(self.palette_colors):
-                    self.background_index = randint(0, len(self.palette_colors)-1)
+            self.palette_colors = randomize.palettes[self.palette_name]
             self.refresh_ui_static()
-        
-        if self.background_lock == 0:
-            self.background_index = randint(0, len(self.palette_colors)-1)
+
+
+    def set_palette(self, palette_name, background_index):
+        """! Sets the current color palette and background color, like a gallery variation picked.
+
+        @param palette_name     Name of the palette.
+        @param background_index Index of the background color in the palette.
+        """
+
+        self.palette_name = palette_name
+        self.palette_colors = randomize.palettes[palette_name]
+        self.background_index = background_index
+
+
+    def get_locks(self):
+        """! @return True for the palette lock and the background lock that are set, see randomize.randomize_palette. """
+        return (self.palette_lock == 1, self.background_lock == 1)
 
 
     def events(self, event):
@@ -230,7 +221,7 @@ class color_palette(widget):
         if event.user_type == pgui.UI_DROP_DOWN_MENU_CHANGED:
             if event.ui_object_id == "current_palette_dropdown":
                 self.palette_name = event.text
-                self.palette_colors = _color_palettes[self.palette_name]
+                self.palette_colors = randomize.palettes[self.palette_name]
                 if self.background_index >= len(self.palette_colors):
                     self.background_index = randint(0, len(self.palette_colors)-1)
                 self.refresh_ui_static()
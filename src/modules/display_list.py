@@ -0,0 +1,212 @@
+##
+# @file display_list.py
+#
+# @brief Defines the display_list class which stores the primitives of a layer, and its binary trace format.
+
+# Imports
+from array import array
+import struct
+import sys
+
+import pygame as pg
+
+## Primitive kinds a display list record can hold, records store the index of their kind.
+primitive_kinds = ["circle", "rect", "line", "polygon", "curve", "stamp"]
+
+## Magic bytes a trace file starts with.
+trace_magic = b"AAGT"
+## Version of the trace format written by save_trace.
+trace_version = 2
+
+class display_list:
+    """! Draw target that stores primitives as compact array-backed records instead of drawing them.
+
+    Records are kept in the generators reference space, so a display list can be rasterized at any canvas size without
+    drawing the random parameters again. Each record has a kind, a color index, an alpha, a width, and its geometry:
+    - circle, stamp: center x, center y, radius.
+    - rect: x, y, width, height.
+    - line: start x, start y, end x, end y.
+    - polygon: the x and y of every point.
+    - curve: the x and y of every point, then of every last point. A curve stores its steps as its width.
+    """
+
+    def __init__(self, reference_size, colors=()):
+        """! Initializes an empty display list.
+
+        @param reference_size   Size of the reference space the primitives are laid out in.
+        @param colors           Initial color table, as (r, g, b, a) tuples.
+        """
+        ## Size of the reference space the primitives are laid out in.
+        self.reference_size = tuple(reference_size)
+        ## Color table the records index into, as (r, g, b, a) tuples.
+        self.colors = [tuple(color) for color in colors]
+        ## Kind of each record, an index into primitive_kinds.
+        self.kinds = array("B")
+        ## Color table index of each record.
+        self.color_indices = array("H")
+        ## Alpha of each record, 255 for everything except stamps.
+        self.alphas = array("B")
+        ## Line or ring width of each record, 0 fills the shape.
+        self.widths = array("i")
+        ## Start of each record's geometry in geometry.
+        self.geometry_starts = array("I")
+        ## Geometry of every record back to back.
+        self.geometry = array("i")
+        self.__color_index = {color: i for i, color in enumerate(self.colors)}
+
+
+    def __len__(self):
+        """! @return The number of records. """
+        return len(self.kinds)
+
+
+    def __eq__(self, other):
+        """! @return True if both display lists hold the same primitives. """
+        if not isinstance(other, display_list):
+            return NotImplemented
+        return (self.reference_size == other.reference_size and self.kinds == other.kinds
+                and [self.colors[i] for i in self.color_indices] == [other.colors[i] for i in other.color_indices]
+                and self.alphas == other.alphas and self.widths == other.widths
+                and self.geometry_starts == other.geometry_starts and self.geometry == other.geometry)
+
+
+    def __add(self, kind, color, alpha, width, geometry):
+        """! Appends a record. """
+        color = tuple(pg.Color(color))
+        index = self.__color_index.get(color)
+        if index is None:
+            index = self.__color_index[color] = len(self.colors)
+            self.colors.append(color)
+
+        self.kinds.append(primitive_kinds.index(kind))
+        self.color_indices.append(index)
+        self.alphas.append(alpha)
+        self.widths.append(width)
+        self.geometry_starts.append(len(self.geometry))
+        self.geometry.extend(geometry)
+
+
+    def circle(self, color, center, rad, width=0):
+        """! Records a circle, width 0 fills it. """
+        self.__add("circle", color, 255, width, (center[0], center[1], rad))
+
+
+    def rect(self, color, rect):
+        """! Records a filled rectangle. """
+        self.__add("rect", color, 255, 0, rect)
+
+
+    def line(self, color, start, end, width):
+        """! Records a line. """
+        self.__add("line", color, 255, width, (start[0], start[1], end[0], end[1]))
+
+
+    def polygon(self, color, points, width):
+        """! Records a polygon, width 0 fills it. """
+        self.__add("polygon", color, 255, width, [c for p in points for c in p])
+
+
+    def curve(self, color, points, last_points, steps):
+        """! Records a thick bezier curve. """
+        self.__add("curve", color, 255, steps, [c for p in points + last_points for c in p])
+
+
+    def stamp(self, rad, color, width, alpha, center):
+        """! Records a translucent circle or ring. """
+        self.__add("stamp", color, alpha, width, (center[0], center[1], rad))
+
+
+    def flush(self):
+        """! Nothing is queued, primitives are recorded as they are drawn. """
+        pass
+
+
+    def rasterize(self, target):
+        """! Draws every record to a draw target, in the order they were recorded.
+
+        @param target   The draw target, like a primitives.surface_target, using the same reference space.
+        """
+        geometry = self.geometry
+        ends = self.geometry_starts[1:] + array("I", [len(geometry)])
+        colors = [pg.Color(color) for color in self.colors]
+        for i, kind in enumerate(self.kinds):
+            kind = primitive_kinds[kind]
+            g = geometry[self.geometry_starts[i]:ends[i]]
+            color = colors[self.color_indices[i]]
+            width = self.widths[i]
+
+            if kind == "circle":
+                target.circle(color, (g[0], g[1]), g[2], width)
+            elif kind == "rect":
+                target.rect(color, tuple(g))
+            elif kind == "line":
+                target.line(color, (g[0], g[1]), (g[2], g[3]), width)
+            elif kind == "polygon":
+                target.polygon(color, list(zip(g[::2], g[1::2])), width)
+            elif kind == "curve":
+                points = list(zip(g[::2], g[1::2]))
+                target.curve(color, points[:len(points)//2], points[len(points)//2:], width)
+            elif kind == "stamp":
+                target.stamp(g[2], self.colors[self.color_indices[i]], width, self.alphas[i], (g[0], g[1]))
+
+        target.flush()
+
+
+def _little_endian(values):
+    """! @return A copy of an array in little endian byte order. """
+    values = array(values.typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _read_array(file, typecode, count):
+    """! Reads a little endian array from a file. """
+    values = array(typecode)
+    values.fromfile(file, count)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def save_trace(path, lists):
+    """! Saves display lists to a binary trace file.
+
+    @param path     Path of the trace file.
+    @param lists    The display lists to save, like the art layers of a render.
+    """
+    with open(path, "wb") as file:
+        file.write(struct.pack("<4sHI", trace_magic, trace_version, len(lists)))
+        for dl in lists:
+            file.write(struct.pack("<IIIII", dl.reference_size[0], dl.reference_size[1], len(dl.colors), len(dl),
+                                   len(dl.geometry)))
+            file.write(bytes(c for color in dl.colors for c in color))
+            for values in (dl.kinds, dl.color_indices, dl.alphas, dl.widths, dl.geometry_starts, dl.geometry):
+                _little_endian(values).tofile(file)
+
+
+def load_trace(path):
+    """! Loads display lists from a binary trace file written by save_trace.
+
+    @param path     Path of the trace file.
+
+    @return The list of display lists.
+    """
+    with open(path, "rb") as file:
+        magic, version, count = struct.unpack("<4sHI", file.read(struct.calcsize("<4sHI")))
+        if magic != trace_magic or version != trace_version:
+            raise ValueError("%s is not a version %d trace file" % (path, trace_version))
+
+        lists = []
+        for _ in range(count):
+            width, height, color_count, record_count, geometry_count = struct.unpack("<IIIII", file.read(20))
+            data = file.read(color_count * 4)
+            dl = display_list((width, height), [tuple(data[i:i+4]) for i in range(0, len(data), 4)])
+            dl.kinds = _read_array(file, "B", record_count)
+            dl.color_indices = _read_array(file, "H", record_count)
+            dl.alphas = _read_array(file, "B", record_count)
+            dl.widths = _read_array(file, "i", record_count)
+            dl.geometry_starts = _read_array(file, "I", record_count)
+            dl.geometry = _read_array(file, "i", geometry_count)
+            lists.append(dl)
+        return lists
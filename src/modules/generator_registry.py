@@ -0,0 +1,161 @@
+##
+# @file generator_registry.py
+#
+# @brief Registry of the layer generators, keyed by shape and style, with their cost metadata.
+
+# Imports
+from importlib import metadata
+import traceback
+
+## Entry point group third party generators are installed under. An entry point is named "Shape/Style" and loads a
+## draw function, or a module that registers its generators when imported.
+entry_point_group = "abstract_art_generator.generators"
+
+## Backends a generator can draw to. "surface" draws through a primitives.surface_target, "display_list" only uses the
+## draw target primitives, so the layer can also be recorded, tiled and exported as SVG.
+all_backends = ("surface", "display_list")
+
+class generator_info:
+    """! A registered generator and its metadata. """
+
+    def __init__(self, shape, style, draw, cost, memory, backends):
+        """! Initializes the generator info.
+
+        @param shape    Shape the generator draws.
+        @param style    Style the generator lays the shapes out in.
+        @param draw     The draw function, called as draw(generator, layer, complexity, cp, magnitude, rng).
+        @param cost     Expected draw time in milliseconds per unit of complexity, on a 4K canvas.
+        @param memory   Working memory in bytes used besides the layer surface.
+        @param backends The all_backends entries the generator supports.
+        """
+        ## Shape the generator draws.
+        self.shape = shape
+        ## Style the generator lays the shapes out in.
+        self.style = style
+        ## The draw function.
+        self.draw = draw
+        ## Expected draw time in milliseconds per unit of complexity, on a 4K canvas.
+        self.cost = cost
+        ## Working memory in bytes used besides the layer surface.
+        self.memory = memory
+        ## The all_backends entries the generator supports.
+        self.backends = tuple(backends)
+
+
+    def estimate_cost(self, complexity, pixels=3840*2160):
+        """! Estimates the draw time of a layer.
+
+        @param complexity   Complexity of the layer.
+        @param pixels       Pixel count of the canvas.
+
+        @return The expected draw time in milliseconds.
+        """
+        return self.cost * complexity * pixels / (3840*2160)
+
+
+_generators = {}
+_shapes = []
+_styles = []
+_entry_points = None
+
+
+def add_names(shapes=(), styles=()):
+    """! Adds shape and style names to the lists, so they are listed in this order whatever order they register in.
+
+    @param shapes   Shape names.
+    @param styles   Style names.
+    """
+    _shapes.extend(s for s in shapes if s not in _shapes)
+    _styles.extend(s for s in styles if s not in _styles)
+
+
+def register(shape, style, draw, cost, memory=0, backends=all_backends):
+    """! Registers a generator, replacing any generator registered for the same shape and style.
+
+    @param shape    Shape the generator draws, new shapes are added to the shape list.
+    @param style    Style the generator lays the shapes out in, new styles are added to the style list.
+    @param draw     The draw function, see generator_info.
+    @param cost     Expected draw time in milliseconds per unit of complexity, on a 4K canvas.
+    @param memory   Working memory in bytes used besides the layer surface.
+    @param backends The all_backends entries the generator supports.
+
+    @return The generator_info.
+    """
+    info = generator_info(shape, style, draw, cost, memory, backends)
+    _generators[(shape, style)] = info
+    if shape not in _shapes:
+        _shapes.append(shape)
+    if style not in _styles:
+        _styles.append(style)
+    return info
+
+
+def register_generator(shape, style, cost, memory=0, backends=all_backends):
+    """! Decorator that registers a draw function, see register. """
+    def decorator(draw):
+        register(shape, style, draw, cost, memory, backends)
+        return draw
+    return decorator
+
+
+def get(shape, style):
+    """! Looks up a generator, loading it from its entry point the first time it is used.
+
+    @param shape    Shape of the generator.
+    @param style    Style of the generator.
+
+    @return The generator_info, or None if nothing draws that shape and style.
+    """
+    info = _generators.get((shape, style))
+    if info is None:
+        entry_point = _get_entry_points().pop("%s/%s" % (shape, style), None)
+        if entry_point is not None:
+            _load(entry_point, shape, style)
+            info = _generators.get((shape, style))
+    return info
+
+
+def get_shapes():
+    """! @return Every shape that can be drawn, including shapes of generators that haven't been loaded yet. """
+    return _with_names(_shapes, (name.split("/")[0] for name in _get_entry_points()))
+
+
+def get_styles():
+    """! @return Every style that can be drawn, including styles of generators that haven't been loaded yet. """
+    return _with_names(_styles, (name.split("/")[1] for name in _get_entry_points()))
+
+
+def _with_names(names, extra):
+    """! @return A copy of a name list with the extra names it doesn't have appended. """
+    names = list(names)
+    for name in extra:
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def _get_entry_points():
+    """! @return The installed entry points that haven't been loaded, by name. Only their metadata is read. """
+    global _entry_points
+    if _entry_points is None:
+        _entry_points = {}
+        try:
+            for entry_point in metadata.entry_points(group=entry_point_group):
+                if "/" in entry_point.name:
+                    _entry_points[entry_point.name] = entry_point
+        except Exception:
+            traceback.print_exc()
+    return _entry_points
+
+
+def _load(entry_point, shape, style):
+    """! Loads an entry point, registering the object it names as a draw function if importing didn't register it. """
+    try:
+        loaded = entry_point.load()
+    except Exception:
+        # A broken plugin shouldn't take the app down, its shape and style just draw nothing.
+        traceback.print_exc()
+        return
+    if (shape, style) not in _generators and callable(loaded):
+        register(shape, style, loaded, getattr(loaded, "cost", 1.0), getattr(loaded, "memory", 0),
+                 getattr(loaded, "backends", all_backends))
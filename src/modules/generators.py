@@ -7,10 +7,12 @@
 # - Created by Jessica Dawson on 03/17/2022.
 
 # Import
-from random import randint
-
 import pygame as pg
-import pygame.gfxdraw
+
+from modules import generator_registry
+from modules.generator_registry import register_generator
+from modules.stamp_cache import stamp_cache, default_max_bytes
+from modules.primitives import surface_target
 
 art_styles_list = [
     "Chaotic",
@@ -22,1182 +24,1657 @@ art_styles_list = [
     "Empty"
 ]
 
+art_shapes_list = [
+    "Lines",
+    "Circles",
+    "Squares",
+    "Hollow Polygons",
+    "Filled Polygons",
+    "Dots",
+    "Curves",
+    "Rings"
+]
+
+generator_registry.add_names(art_shapes_list, art_styles_list)
+
+## Height of the reference space generators lay shapes out in, a 4K canvas draws at a scale of 1.
+reference_height = 2160
+
 class generators:
-    """! Generators class that provides layer generation functionality to the layer module. """
+    """! Generators class that provides layer generation functionality to the layer module.
+
+    Shapes are laid out in a reference space reference_height pixels tall and scaled to the canvas as they are drawn,
+    so a layer looks the same and uses the same random numbers at any canvas size with the same aspect ratio.
+    """
 
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, reference_size=None):
         """! Initializes the generators utility.
 
         @param width            Width of the canvas.
         @param height           Height of the canvas.
+        @param reference_size   Size of the reference space, defaults to reference_height tall with the canvas aspect ratio.
         """
-        self.width = width
-        self.height = height
+        if reference_size is None:
+            reference_size = (round(width * reference_height / height), reference_height)
 
+        ## Width of the reference space shapes are laid out in.
+        self.width = reference_size[0]
+        ## Height of the reference space shapes are laid out in.
+        self.height = reference_size[1]
+        ## Size of the canvas shapes are drawn to.
+        self.canvas_size = (width, height)
+        self.__scale_x = width / self.width
+        self.__scale_y = height / self.height
+        ## Cache of the translucent circle and ring stamps drawn by draw_circles and draw_rings.
+        self.stamps = stamp_cache()
 
-    def draw_circles(self, layer, complexity, cp, style, magnitude):
-        """! Draws cirlces to a layer. 
-        
-        @param layer        The layer to draw to.
+
+    def scale_length(self, length):
+        """! Scales a length, like a radius or line width, from reference space to canvas pixels.
+
+        @param length   The length in reference space.
+
+        @return The length in canvas pixels, at least 1 unless length is 0.
+        """
+        if length == 0:
+            return 0
+        return max(1, round(length * self.__scale_y))
+
+
+    def scale_point(self, point):
+        """! Scales a point from reference space to canvas pixels.
+
+        @param point    The point in reference space.
+
+        @return The point in canvas pixels.
+        """
+        return (round(point[0] * self.__scale_x), round(point[1] * self.__scale_y))
+
+
+    def scale_rect(self, rect):
+        """! Scales a rectangle from reference space to canvas pixels by its corners.
+
+        @param rect     The (x, y, width, height) rectangle in reference space.
+
+        @return The rectangle in canvas pixels, at least 1 pixel wide and tall.
+        """
+        x, y = self.scale_point((rect[0], rect[1]))
+        x2, y2 = self.scale_point((rect[0] + rect[2], rect[1] + rect[3]))
+        return (x, y, max(1, x2 - x), max(1, y2 - y))
+
+
+    def draw_shape(self, layer, shape, complexity, cp, style, magnitude, rng):
+        """! Draws a shape to a layer with the generator registered for the shape and style.
+
+        Nothing is drawn if no generator draws the shape in the style.
+
+        @param layer        The layer surface or draw target, like a primitive_recorder, to draw to.
+        @param shape        The shape to draw.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
         @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+
+        if isinstance(layer, pg.Surface):
+            layer = surface_target(layer, self)
+
+        info = generator_registry.get(shape, style)
+        if info is not None:
+            info.draw(self, layer, complexity, cp, magnitude, rng)
+        layer.flush()
+
+
+    # Costs are milliseconds per unit of complexity measured on a 4K canvas with a magnitude of 51 to 200.
+    @register_generator("Circles", "Chaotic", cost=1.3, memory=default_max_bytes)
+    def draw_circles_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws circles to a layer scattered over the whole layer.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
+        fill = 0
+
+        for i in range(complexity):
+            rad = rng.randint(magnitude[0], magnitude[1])
+            if fill == 1:
+                fill_type = rng.randint(5, rad//2)
+            else:
+                fill_type = 0
+            centerX = rng.randint(-25, self.width + 25)
+            centerY = rng.randint(-25, self.height + 25)
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (centerX, centerY))
+
 
+    @register_generator("Circles", "Striped Horizontal", cost=3.1, memory=default_max_bytes)
+    def draw_circles_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws circles to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
         fill = 0
 
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity):
-                rad = randint(magnitude[0], magnitude[1])
+        row_circle_count = complexity // 2 + 2
+        point = self.width // (row_circle_count - 2)
+        row_count = self.height // point + 2
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            if i % 2 == 0:
+                current_color = color_one if current_color == color_two else color_two
+            for j in range(row_circle_count):
+                posX = j * point
+                posY = i * point
+                rad = rng.randint(magnitude[0], magnitude[1])
                 if fill == 1:
-                    fill_type = randint(5, rad//2)
+                    fill_type = rng.randint(5, rad // 2)
                 else:
                     fill_type = 0
-                centerX = randint(-25, self.width + 25)
-                centerY = randint(-25, self.height + 25)
-                current_color = cp[randint(0, len(cp) - 1)]
-                alpha_surface = pg.Surface((rad*2, rad*2))
-                alpha_surface.fill((0, 0, 0))
-                pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                alpha_surface.set_colorkey((0, 0, 0))
-                alpha_surface.set_alpha(randint(150, 255))
-                layer.blit(alpha_surface, (centerX-rad, centerY-rad))
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            row_circle_count = complexity // 2 + 2
-            point = self.width // (row_circle_count - 2)
-            row_count = self.height // point + 2
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
                 if i % 2 == 0:
-                    current_color = color_one if current_color == color_two else color_two
-                for j in range(row_circle_count):
-                    posX = j * point
-                    posY = i * point
-                    rad = randint(magnitude[0], magnitude[1])
-                    if fill == 1:
-                        fill_type = randint(5, rad // 2)
-                    else:
-                        fill_type = 0
-                    if i % 2 == 0:
-                        alpha_surface = pg.Surface((rad * 2, rad * 2))
-                        alpha_surface.fill((0, 0, 0))
-                        pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                        alpha_surface.set_colorkey((0, 0, 0))
-                        alpha_surface.set_alpha(randint(150, 255))
-                        layer.blit(alpha_surface, (posX - rad, posY - rad))
-
-        if style == art_styles_list[2]:  # Striped Vertical
-            row_circle_count = complexity // 2 + 2
-            point = self.width // (row_circle_count - 2)
-            row_count = self.height // point + 2
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
-                for j in range(row_circle_count):
-                    if (j+1) % 2 == 0:
-                        current_color = color_one if current_color == color_two else color_two
-                    posX = j * point
-                    posY = i * point
-                    rad = randint(magnitude[0], magnitude[1])
-                    if fill == 1:
-                        fill_type = randint(5, rad // 2)
-                    else:
-                        fill_type = 0
-                    if j % 2 == 0:
-                        alpha_surface = pg.Surface((rad * 2, rad * 2))
-                        alpha_surface.fill((0, 0, 0))
-                        pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                        alpha_surface.set_colorkey((0, 0, 0))
-                        alpha_surface.set_alpha(randint(150, 255))
-                        layer.blit(alpha_surface, (posX - rad, posY - rad))
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_circle_count = complexity
-            rad = self.width // row_circle_count
-            row_count = self.height // rad + 1
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_circle_count):
-                    if fill == 1:
-                        fill_type = rad//4
-                    else:
-                        fill_type = 0
-                    current_color = color_one if (i + j) % 2 == 0 else color_two
-                    posX = rad + j * (rad+1) * 2
-                    posY = rad + i * (rad+1) * 2
-                    pg.draw.circle(layer, pg.Color(current_color), (posX, posY), rad, fill_type)
-
-        if style == art_styles_list[4]:     # Cornered
-            for i in range(complexity*2):
-                current_color = cp[randint(0, len(cp)-1)]
-                corner = randint(0, 3)
-                x_area, y_area = (0, 0), (0, 0)
-                if corner == 0:
-                    x_area, y_area = (-50, self.width//3), (-50, self.height//3)
-                if corner == 1:
-                    x_area, y_area = (self.width//1.5, self.width+50), (-50, self.height//3)
-                if corner == 2:
-                    x_area, y_area = (self.width//1.5, self.width+50), (self.height//1.5, self.height+50)
-                if corner == 3:
-                    x_area, y_area = (-50, self.width//3), (self.height//1.5, self.height+50)
-
-                posX = randint(x_area[0], x_area[1])
-                posY = randint(y_area[0], y_area[1])
-                rad = randint(magnitude[0], magnitude[1])
+                    layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (posX, posY))
 
-                if fill == 1:
-                    fill_type = randint(5, rad//2)
-                else:
-                    fill_type = 0
 
-                alpha_surface = pg.Surface((rad * 2, rad * 2))
-                alpha_surface.fill((0, 0, 0))
-                pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                alpha_surface.set_colorkey((0, 0, 0))
-                alpha_surface.set_alpha(randint(150, 255))
-                layer.blit(alpha_surface, (posX - rad, posY - rad))
+    @register_generator("Circles", "Striped Vertical", cost=2.5, memory=default_max_bytes)
+    def draw_circles_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws circles to a layer in vertical stripes.
 
-        if style == art_styles_list[5]:     # Centered
-            in_x_area, in_y_area = (self.width//4, 3*self.width//4), (self.height//4, 3*self.height//4)
-            out_x_area, out_y_area = (self.width//6, 5*self.width//6), (self.height//6, 5*self.height//6)
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
 
-            for i in range(complexity):
+        row_circle_count = complexity // 2 + 2
+        point = self.width // (row_circle_count - 2)
+        row_count = self.height // point + 2
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            for j in range(row_circle_count):
+                if (j+1) % 2 == 0:
+                    current_color = color_one if current_color == color_two else color_two
+                posX = j * point
+                posY = i * point
+                rad = rng.randint(magnitude[0], magnitude[1])
                 if fill == 1:
-                    fill_type = randint(magnitude[0], magnitude[1])
+                    fill_type = rng.randint(5, rad // 2)
                 else:
                     fill_type = 0
-                random_number = randint(0, 5)
-                if random_number < 4:
-                    center_x = randint(in_x_area[0], in_x_area[1])
-                    center_y = randint(in_y_area[0], in_y_area[1])
-                else:
-                    center_x = randint(out_x_area[0], out_x_area[1])
-                    center_y = randint(out_y_area[0], out_y_area[1])
+                if j % 2 == 0:
+                    layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (posX, posY))
+
 
-                rad = randint(magnitude[0], magnitude[1])
-                current_color = cp[randint(0, len(cp)-1)]
+    @register_generator("Circles", "Mosaic", cost=0.29)
+    def draw_circles_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws circles to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
 
+        row_circle_count = complexity
+        rad = self.width // row_circle_count
+        row_count = self.height // rad + 1
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_circle_count):
                 if fill == 1:
-                    fill_type = randint(5, rad//2)
+                    fill_type = rad//4
                 else:
                     fill_type = 0
+                current_color = color_one if (i + j) % 2 == 0 else color_two
+                posX = rad + j * (rad+1) * 2
+                posY = rad + i * (rad+1) * 2
+                layer.circle(pg.Color(current_color), (posX, posY), rad, fill_type)
+
+
+    @register_generator("Circles", "Cornered", cost=1.6, memory=default_max_bytes)
+    def draw_circles_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws circles to a layer gathered in the corners.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
+
+        for i in range(complexity*2):
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            corner = rng.randint(0, 3)
+            x_area, y_area = (0, 0), (0, 0)
+            if corner == 0:
+                x_area, y_area = (-50, self.width//3), (-50, self.height//3)
+            if corner == 1:
+                x_area, y_area = (2*self.width//3, self.width+50), (-50, self.height//3)
+            if corner == 2:
+                x_area, y_area = (2*self.width//3, self.width+50), (2*self.height//3, self.height+50)
+            if corner == 3:
+                x_area, y_area = (-50, self.width//3), (2*self.height//3, self.height+50)
+
+            posX = rng.randint(x_area[0], x_area[1])
+            posY = rng.randint(y_area[0], y_area[1])
+            rad = rng.randint(magnitude[0], magnitude[1])
+
+            if fill == 1:
+                fill_type = rng.randint(5, rad//2)
+            else:
+                fill_type = 0
 
-                alpha_surface = pg.Surface((rad * 2, rad * 2))
-                alpha_surface.fill((0, 0, 0))
-                pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                alpha_surface.set_colorkey((0, 0, 0))
-                alpha_surface.set_alpha(randint(150, 255))
-                layer.blit(alpha_surface, (center_x - rad, center_y - rad))
+            layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (posX, posY))
 
-        if style == art_styles_list[6]:     # Empty
-            pass
 
+    @register_generator("Circles", "Centered", cost=1.2, memory=default_max_bytes)
+    def draw_circles_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws circles to a layer gathered around the center.
 
-    def draw_curves(self, layer, complexity, cp, style, magnitude):
-        """! Draws curves to a layer. 
-        
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
+        fill = 0
+
+        in_x_area, in_y_area = (self.width//4, 3*self.width//4), (self.height//4, 3*self.height//4)
+        out_x_area, out_y_area = (self.width//6, 5*self.width//6), (self.height//6, 5*self.height//6)
+
+        for i in range(complexity):
+            if fill == 1:
+                fill_type = rng.randint(magnitude[0], magnitude[1])
+            else:
+                fill_type = 0
+            random_number = rng.randint(0, 5)
+            if random_number < 4:
+                center_x = rng.randint(in_x_area[0], in_x_area[1])
+                center_y = rng.randint(in_y_area[0], in_y_area[1])
+            else:
+                center_x = rng.randint(out_x_area[0], out_x_area[1])
+                center_y = rng.randint(out_y_area[0], out_y_area[1])
+
+            rad = rng.randint(magnitude[0], magnitude[1])
+            current_color = cp[rng.randint(0, len(cp)-1)]
+
+            if fill == 1:
+                fill_type = rng.randint(5, rad//2)
+            else:
+                fill_type = 0
+
+            layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (center_x, center_y))
 
+
+    @register_generator("Curves", "Chaotic", cost=0.12)
+    def draw_curves_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws curves to a layer scattered over the whole layer.
+
+        A curve is stroked as the area swept between its first and last copy, multiples copies offset one pixel apart.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
         magnitude = magnitude[1]
 
-        if style == art_styles_list[0]:
-            multiples = magnitude // 5
-            for i in range(complexity//5):
-                current_color = cp[randint(0, len(cp)-1)]
-                point_count = 5
-                multiples_points = []
-                for _ in range(multiples):
-                    multiples_points.append([])
-                for j in range(point_count):
-                    x = randint(0, self.width)
-                    y = randint(0, self.height)
-                    for k in range(multiples):
-                        multiples_points[k].append((x, y+k))
-
-                for k in range(multiples):
-                    pg.gfxdraw.bezier(layer, multiples_points[k], 5, pg.Color(current_color))
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            multiples = magnitude // 5
+        multiples = magnitude // 5
+        for i in range(complexity//5):
+            current_color = cp[rng.randint(0, len(cp)-1)]
             point_count = 5
-            row_count = complexity // 2
-            interval_y = (self.height // row_count)
-            interval_x = (self.width // point_count)
-            row_color_one = cp[randint(0, len(cp)-1)]
-            row_color_two = cp[randint(0, len(cp)-1)]
+            points, last_points = [], []
+            for j in range(point_count):
+                x = rng.randint(0, self.width)
+                y = rng.randint(0, self.height)
+                points.append((x, y))
+                last_points.append((x, y+multiples-1))
 
-            for i in range(row_count):
-                current_color = row_color_one if i % 2 == 0 else row_color_two
+            if multiples > 0:
+                layer.curve(pg.Color(current_color), points, last_points, 5)
 
-                multiples_points = []
-                for k in range(multiples):
-                    multiples_points.append([])
 
-                for j in range(point_count+2):
-                    y_pos = randint(((i-2)*interval_y), ((i+2)*interval_y) )
-                    x_pos = randint((j-1)*interval_x, (j*interval_x))
-                    for k in range(multiples):
-                        multiples_points[k].append((x_pos, y_pos+k))
+    @register_generator("Curves", "Striped Horizontal", cost=0.23)
+    def draw_curves_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws curves to a layer in horizontal stripes.
 
-                for k in range(multiples):
-                    pg.gfxdraw.bezier(layer, multiples_points[k], 5, pg.Color(current_color))
+        A curve is stroked as the area swept between its first and last copy, multiples copies offset one pixel apart.
 
-        if style == art_styles_list[2]:     # Striped Vertical
-            point_count = 5
-            col_count = complexity // 2
-            multiples = magnitude // 5
-            interval_x = (self.height // col_count) * 2
-            interval_y = (self.width // point_count)
-            col_color_one = cp[randint(0, len(cp)-1)]
-            col_color_two = cp[randint(0, len(cp)-1)]
-
-            for i in range(col_count):
-                current_color = col_color_one if i % 2 == 0 else col_color_two
-
-                multiples_points = []
-                for k in range(multiples):
-                    multiples_points.append([])
-
-                for j in range(point_count+2):
-                    y_pos = randint((j-1)*interval_y, j*interval_y)
-                    x_pos = randint((i-1)*interval_x, (i+1)*interval_x)
-                    for k in range(multiples):
-                        multiples_points[k].append((x_pos+k, y_pos))
-
-                for k in range(multiples):
-                    pg.gfxdraw.bezier(layer, multiples_points[k], 5, pg.Color(current_color))
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_curve_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_curve_count
-            y_interval = self.height // row_count
-            multiples = magnitude // 5
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_curve_count):
-                    current_color = color_one if (i + j) % 2 == 0 else color_two
-                    x_area = (x_interval * j, x_interval * (j + 1))
-                    y_area = (y_interval * i, y_interval * (i + 1))
-                    point_count = 4
-                    multiples_points = []
-                    for m in range(multiples):
-                        multiples_points.append([])
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        magnitude = magnitude[1]
+
+        multiples = magnitude // 5
+        point_count = 5
+        row_count = complexity // 2
+        interval_y = (self.height // row_count)
+        interval_x = (self.width // point_count)
+        row_color_one = cp[rng.randint(0, len(cp)-1)]
+        row_color_two = cp[rng.randint(0, len(cp)-1)]
+
+        for i in range(row_count):
+            current_color = row_color_one if i % 2 == 0 else row_color_two
+
+            points, last_points = [], []
+            for j in range(point_count+2):
+                y_pos = rng.randint(((i-2)*interval_y), ((i+2)*interval_y) )
+                x_pos = rng.randint((j-1)*interval_x, (j*interval_x))
+                points.append((x_pos, y_pos))
+                last_points.append((x_pos, y_pos+multiples-1))
+
+            if multiples > 0:
+                layer.curve(pg.Color(current_color), points, last_points, 5)
+
+
+    @register_generator("Curves", "Striped Vertical", cost=0.3)
+    def draw_curves_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws curves to a layer in vertical stripes.
+
+        A curve is stroked as the area swept between its first and last copy, multiples copies offset one pixel apart.
 
-                    for k in range(point_count):
-                        x = randint(x_area[0], x_area[1])
-                        y = randint(y_area[0], y_area[1])
-                        for m in range(multiples):
-                            multiples_points[m].append((x, y+m))
-
-                    for m in range(multiples):
-                        pg.gfxdraw.bezier(layer, multiples_points[m], 5, pg.Color(current_color))
-
-        if style == art_styles_list[4]:     # Cornered
-            corner_starts = [((0, self.width//3),(-1, 0)),
-                             ((2*self.width//3, self.width),(-1, 0)),
-                             ((2*self.width//3, self.width),(self.height, self.height+1)),
-                             ((0, self.width//3),(self.height, self.height+1))]
-            corner_ends = [((-1, 0),(0, self.height//2)),
-                           ((self.width, self.width+1),(0, self.height//2)),
-                           ((self.width, self.width+1),(self.height//2, self.height)),
-                           ((-1, 0),(self.height//2, self.height))]
-            multiples = magnitude // 5
-            point_count = 2
-            x_area = [0, 0]
-            y_area = [0, 0]
-            for i in range(complexity//2):
-                corner = randint(0, 3)
-
-                if corner == 0: x_area = [0, self.width//3]; y_area = [0, self.height//2]
-                if corner == 1: x_area = [2*self.width//3, self.width]; y_area = [0, self.height//2]
-                if corner == 2: x_area = [2*self.width//3, self.width]; y_area = [self.height//2, self.height]
-                if corner == 3: x_area = [0, self.width//3]; y_area = [self.height//2, self.height]
-
-                current_color = cp[randint(0, len(cp)-1)]
-
-                multiples_points = []
-                first_point = (randint(corner_starts[corner][0][0], corner_starts[corner][0][1]),
-                               randint(corner_starts[corner][1][0], corner_starts[corner][1][1]))
-                last_point = (randint(corner_ends[corner][0][0], corner_ends[corner][0][1]),
-                              randint(corner_ends[corner][1][0], corner_ends[corner][1][1]))
-                for k in range(multiples):
-                    multiples_points.append([first_point])
-
-                for j in range(point_count):
-                    x = randint(x_area[0], x_area[1])
-                    y = randint(y_area[0], y_area[1])
-
-                    for k in range(multiples):
-                        multiples_points[k].append((x+k, y))
-                for k in range(multiples):
-                    multiples_points[k].append(last_point)
-
-                for k in range(multiples):
-                    pg.gfxdraw.bezier(layer, multiples_points[k], 5, pg.Color(current_color))
-
-        if style == art_styles_list[5]:     # Centered
-            curve_count = complexity // 5
-            multiples = magnitude // 5
-            point_count = 5
-            for i in range(curve_count):
-                side = randint(0, 3)
-                multiples_points = []
-                for k in range(multiples):
-                    multiples_points.append([(self.width//2, self.height//2)])
-
-                current_color = cp[randint(0, len(cp)-1)]
-                x, y = 0, 0
-                for j in range(point_count):
-                    if side == 0:
-                        x = randint(self.width//2+20*j, self.width)
-                        y = randint(0, self.height)
-                    elif side == 1:
-                        x = randint(0, self.width)
-                        y = randint(0, self.height // 2 - 20 * j)
-                    elif side == 2:
-                        x = randint(0, self.width//2-20*j)
-                        y = randint(0, self.height)
-                    elif side == 3:
-                        x = randint(0, self.width)
-                        y = randint(self.height // 2 + 20 * j, self.height)
-
-                    for k in range(multiples):
-                        multiples_points[k].append((x, y+k))
-
-                for k in range(multiples):
-                    pg.gfxdraw.bezier(layer, multiples_points[k], 5, pg.Color(current_color))
-
-        if style == art_styles_list[6]:     # Empty
-            pass
-
-
-    def draw_dots(self, layer, complexity, cp, style, magnitude):
-        """! Draws dots to a layer. 
-        
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
+        magnitude = magnitude[1]
 
-        
-
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity*20):
-                centerX = randint(-25, self.width + 25)
-                centerY = randint(-25, self.height + 25)
-                current_color = cp[randint(0, len(cp) - 1)]
-                pg.draw.circle(layer, pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            row_dot_count = complexity * 2
-            row_count = complexity // 2
-            interval = self.height // row_count
-            row_colour_one = cp[randint(0, len(cp) - 1)]
-            row_colour_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count+1):
-                for j in range(row_dot_count):
-                    current_color = row_colour_one if i % 2 == 0 else row_colour_two
-                    centerY = i * interval + 5
-                    centerX = randint(0, self.width)
-                    pg.draw.circle(layer, pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
-
-        if style == art_styles_list[2]:     # Striped Vertical
-            row_dot_count = complexity * 2
-            row_count = complexity // 2
-            interval = self.width // row_count
-            row_colour_one = cp[randint(0, len(cp) - 1)]
-            row_colour_two = cp[randint(0, len(cp) - 1)]
-            while row_colour_two == row_colour_one:
-                row_colour_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count+1):
-                for j in range(row_dot_count):
-                    current_color = row_colour_one if i % 2 == 0 else row_colour_two
-                    centerX = i * interval + 5
-                    centerY = randint(0, self.width)
-                    pg.draw.circle(layer, pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_dot_count = complexity * 5
-            interval = self.width // row_dot_count * 2
-            row_count = self.height // interval + 5
-            color_one = cp[randint(0, len(cp)-1)]
-            color_two = cp[randint(0, len(cp)-1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_dot_count):
-                    current_color = color_one if (i+j) % 2 == 0 else color_two
-                    centerX = 2 + j * interval
-                    centerY = 2 + i * interval
-                    pg.draw.circle(layer, pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
-
-        if style == art_styles_list[4]:     # Cornered
-            for i in range(complexity * 8):
-                current_color = cp[randint(0, len(cp) - 1)]
-                corner = randint(0, 3)
-                x_area, y_area = (0, 0), (0, 0)
-                if corner == 0:
-                    x_area, y_area = (0, self.width // 3), (0, self.height // 3)
-                if corner == 1:
-                    x_area, y_area = (self.width // 1.5, self.width), (0, self.height // 3)
-                if corner == 2:
-                    x_area, y_area = (self.width // 1.5, self.width), (self.height // 1.5, self.height)
-                if corner == 3:
-                    x_area, y_area = (0, self.width // 3), (self.height // 1.5, self.height)
-
-                posX = randint(x_area[0], x_area[1])
-                posY = randint(y_area[0], y_area[1])
-
-                pg.draw.circle(layer, pg.Color(current_color), (posX, posY), magnitude[1]//30 + 2)
-
-        if style == art_styles_list[5]:     # Centered
-            in_x_area, in_y_area = (self.width // 4, 3 * self.width // 4), (self.height // 4, 3 * self.height // 4)
-            out_x_area, out_y_area = (self.width // 6, 5 * self.width // 6), (self.height // 6, 5 * self.height // 6)
-
-            for i in range(complexity * 4):
-                random_number = randint(0, 5)
-                if random_number < 4:
-                    center_x = randint(in_x_area[0], in_x_area[1])
-                    center_y = randint(in_y_area[0], in_y_area[1])
-                else:
-                    center_x = randint(out_x_area[0], out_x_area[1])
-                    center_y = randint(out_y_area[0], out_y_area[1])
+        point_count = 5
+        col_count = complexity // 2
+        multiples = magnitude // 5
+        interval_x = (self.height // col_count) * 2
+        interval_y = (self.width // point_count)
+        col_color_one = cp[rng.randint(0, len(cp)-1)]
+        col_color_two = cp[rng.randint(0, len(cp)-1)]
 
-                current_color = cp[randint(0, len(cp) - 1)]
-                pg.draw.circle(layer, pg.Color(current_color), (center_x, center_y), magnitude[1]//30 + 2)
+        for i in range(col_count):
+            current_color = col_color_one if i % 2 == 0 else col_color_two
 
-        if style == art_styles_list[6]:     # Empty
-            pass
+            points, last_points = [], []
+            for j in range(point_count+2):
+                y_pos = rng.randint((j-1)*interval_y, j*interval_y)
+                x_pos = rng.randint((i-1)*interval_x, (i+1)*interval_x)
+                points.append((x_pos, y_pos))
+                last_points.append((x_pos+multiples-1, y_pos))
 
+            if multiples > 0:
+                layer.curve(pg.Color(current_color), points, last_points, 5)
+
+
+    @register_generator("Curves", "Mosaic", cost=0.93)
+    def draw_curves_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws curves to a layer in a checkered grid.
+
+        A curve is stroked as the area swept between its first and last copy, multiples copies offset one pixel apart.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        magnitude = magnitude[1]
+
+        row_curve_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_curve_count
+        y_interval = self.height // row_count
+        multiples = magnitude // 5
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_curve_count):
+                current_color = color_one if (i + j) % 2 == 0 else color_two
+                x_area = (x_interval * j, x_interval * (j + 1))
+                y_area = (y_interval * i, y_interval * (i + 1))
+                point_count = 4
+                points, last_points = [], []
+
+                for k in range(point_count):
+                    x = rng.randint(x_area[0], x_area[1])
+                    y = rng.randint(y_area[0], y_area[1])
+                    points.append((x, y))
+                    last_points.append((x, y+multiples-1))
+
+                if multiples > 0:
+                    layer.curve(pg.Color(current_color), points, last_points, 5)
+
+
+    @register_generator("Curves", "Cornered", cost=0.1)
+    def draw_curves_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws curves to a layer gathered in the corners.
+
+        A curve is stroked as the area swept between its first and last copy, multiples copies offset one pixel apart.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        magnitude = magnitude[1]
+
+        corner_starts = [((0, self.width//3),(-1, 0)),
+                         ((2*self.width//3, self.width),(-1, 0)),
+                         ((2*self.width//3, self.width),(self.height, self.height+1)),
+                         ((0, self.width//3),(self.height, self.height+1))]
+        corner_ends = [((-1, 0),(0, self.height//2)),
+                       ((self.width, self.width+1),(0, self.height//2)),
+                       ((self.width, self.width+1),(self.height//2, self.height)),
+                       ((-1, 0),(self.height//2, self.height))]
+        multiples = magnitude // 5
+        point_count = 2
+        x_area = [0, 0]
+        y_area = [0, 0]
+        for i in range(complexity//2):
+            corner = rng.randint(0, 3)
+
+            if corner == 0: x_area = [0, self.width//3]; y_area = [0, self.height//2]
+            if corner == 1: x_area = [2*self.width//3, self.width]; y_area = [0, self.height//2]
+            if corner == 2: x_area = [2*self.width//3, self.width]; y_area = [self.height//2, self.height]
+            if corner == 3: x_area = [0, self.width//3]; y_area = [self.height//2, self.height]
+
+            current_color = cp[rng.randint(0, len(cp)-1)]
+
+            first_point = (rng.randint(corner_starts[corner][0][0], corner_starts[corner][0][1]),
+                           rng.randint(corner_starts[corner][1][0], corner_starts[corner][1][1]))
+            last_point = (rng.randint(corner_ends[corner][0][0], corner_ends[corner][0][1]),
+                          rng.randint(corner_ends[corner][1][0], corner_ends[corner][1][1]))
+            points, last_points = [first_point], [first_point]
+
+            for j in range(point_count):
+                x = rng.randint(x_area[0], x_area[1])
+                y = rng.randint(y_area[0], y_area[1])
+                points.append((x, y))
+                last_points.append((x+multiples-1, y))
+            points.append(last_point)
+            last_points.append(last_point)
+
+            if multiples > 0:
+                layer.curve(pg.Color(current_color), points, last_points, 5)
+
+
+    @register_generator("Curves", "Centered", cost=0.092)
+    def draw_curves_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws curves to a layer gathered around the center.
+
+        A curve is stroked as the area swept between its first and last copy, multiples copies offset one pixel apart.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        magnitude = magnitude[1]
+
+        curve_count = complexity // 5
+        multiples = magnitude // 5
+        point_count = 5
+        for i in range(curve_count):
+            side = rng.randint(0, 3)
+            points, last_points = [(self.width//2, self.height//2)], [(self.width//2, self.height//2)]
+
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            x, y = 0, 0
+            for j in range(point_count):
+                if side == 0:
+                    x = rng.randint(self.width//2+20*j, self.width)
+                    y = rng.randint(0, self.height)
+                elif side == 1:
+                    x = rng.randint(0, self.width)
+                    y = rng.randint(0, self.height // 2 - 20 * j)
+                elif side == 2:
+                    x = rng.randint(0, self.width//2-20*j)
+                    y = rng.randint(0, self.height)
+                elif side == 3:
+                    x = rng.randint(0, self.width)
+                    y = rng.randint(self.height // 2 + 20 * j, self.height)
+
+                points.append((x, y))
+                last_points.append((x, y+multiples-1))
+
+            if multiples > 0:
+                layer.curve(pg.Color(current_color), points, last_points, 5)
+
+
+    @register_generator("Dots", "Chaotic", cost=0.1)
+    def draw_dots_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws dots to a layer scattered over the whole layer.
 
-    def draw_fpolygons(self, layer, complexity, cp, style, magnitude):
-        """! Draws filled polygons to a layer. 
-        
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
+        for i in range(complexity*20):
+            centerX = rng.randint(-25, self.width + 25)
+            centerY = rng.randint(-25, self.height + 25)
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            layer.circle(pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
+
+
+    @register_generator("Dots", "Striped Horizontal", cost=0.12)
+    def draw_dots_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws dots to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_dot_count = complexity * 2
+        row_count = complexity // 2
+        interval = self.height // row_count
+        row_colour_one = cp[rng.randint(0, len(cp) - 1)]
+        row_colour_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count+1):
+            for j in range(row_dot_count):
+                current_color = row_colour_one if i % 2 == 0 else row_colour_two
+                centerY = i * interval + 5
+                centerX = rng.randint(0, self.width)
+                layer.circle(pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
+
+
+    @register_generator("Dots", "Striped Vertical", cost=0.1)
+    def draw_dots_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws dots to a layer in vertical stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_dot_count = complexity * 2
+        row_count = complexity // 2
+        interval = self.width // row_count
+        row_colour_one = cp[rng.randint(0, len(cp) - 1)]
+        row_colour_two = cp[rng.randint(0, len(cp) - 1)]
+        while row_colour_two == row_colour_one:
+            row_colour_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count+1):
+            for j in range(row_dot_count):
+                current_color = row_colour_one if i % 2 == 0 else row_colour_two
+                centerX = i * interval + 5
+                centerY = rng.randint(0, self.width)
+                layer.circle(pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
+
+
+    @register_generator("Dots", "Mosaic", cost=0.7)
+    def draw_dots_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws dots to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_dot_count = complexity * 5
+        interval = self.width // row_dot_count * 2
+        row_count = self.height // interval + 5
+        color_one = cp[rng.randint(0, len(cp)-1)]
+        color_two = cp[rng.randint(0, len(cp)-1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_dot_count):
+                current_color = color_one if (i+j) % 2 == 0 else color_two
+                centerX = 2 + j * interval
+                centerY = 2 + i * interval
+                layer.circle(pg.Color(current_color), (centerX, centerY), magnitude[1]//30 + 2)
+
+
+    @register_generator("Dots", "Cornered", cost=0.062)
+    def draw_dots_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws dots to a layer gathered in the corners.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        for i in range(complexity * 8):
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            corner = rng.randint(0, 3)
+            x_area, y_area = (0, 0), (0, 0)
+            if corner == 0:
+                x_area, y_area = (0, self.width // 3), (0, self.height // 3)
+            if corner == 1:
+                x_area, y_area = (2 * self.width // 3, self.width), (0, self.height // 3)
+            if corner == 2:
+                x_area, y_area = (2 * self.width // 3, self.width), (2 * self.height // 3, self.height)
+            if corner == 3:
+                x_area, y_area = (0, self.width // 3), (2 * self.height // 3, self.height)
+
+            posX = rng.randint(x_area[0], x_area[1])
+            posY = rng.randint(y_area[0], y_area[1])
+
+            layer.circle(pg.Color(current_color), (posX, posY), magnitude[1]//30 + 2)
 
+
+    @register_generator("Dots", "Centered", cost=0.039)
+    def draw_dots_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws dots to a layer gathered around the center.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        in_x_area, in_y_area = (self.width // 4, 3 * self.width // 4), (self.height // 4, 3 * self.height // 4)
+        out_x_area, out_y_area = (self.width // 6, 5 * self.width // 6), (self.height // 6, 5 * self.height // 6)
+
+        for i in range(complexity * 4):
+            random_number = rng.randint(0, 5)
+            if random_number < 4:
+                center_x = rng.randint(in_x_area[0], in_x_area[1])
+                center_y = rng.randint(in_y_area[0], in_y_area[1])
+            else:
+                center_x = rng.randint(out_x_area[0], out_x_area[1])
+                center_y = rng.randint(out_y_area[0], out_y_area[1])
+
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            layer.circle(pg.Color(current_color), (center_x, center_y), magnitude[1]//30 + 2)
+
+
+    @register_generator("Filled Polygons", "Chaotic", cost=0.07)
+    def draw_filled_polygons_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws filled polygons to a layer scattered over the whole layer.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
+
+        for i in range(complexity//2):
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            if fill == 0:
+                fill_type = 0
+            else:
+                fill_type = rng.randint(magnitude[0]//5, magnitude[1]//5)
+            points_count = rng.randint(3, 5)
+            points = []
+            first_point = [rng.randint(0, self.width), rng.randint(0, self.height)]
+            for _ in range(points_count):
+                points.append([rng.randint(first_point[0]-magnitude[1]*2, first_point[0]+magnitude[1]*2),
+                               rng.randint(first_point[1]-magnitude[1]*2, first_point[1]+magnitude[1]*2)])
+
+            layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Filled Polygons", "Striped Horizontal", cost=0.11)
+    def draw_filled_polygons_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws filled polygons to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
         fill = 0
 
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity//2):
-                current_color = cp[randint(0, len(cp)-1)]
+        row_polygon_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_polygon_count
+        y_interval = self.height // row_count
+
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        for i in range(row_count):
+            if (i + 1) % 2 == 0:
+                current_color = color_one if current_color == color_two else color_two
+            for j in range(row_polygon_count):
                 if fill == 0:
                     fill_type = 0
                 else:
-                    fill_type = randint(magnitude[0]//5, magnitude[1]//5)
-                points_count = randint(3, 5)
+                    fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+
+                x_area = (x_interval * j, x_interval * (j + 1))
+                y_area = (y_interval * i, y_interval * (i + 1))
+                point_count = rng.randint(3, 5)
                 points = []
-                first_point = [randint(0, self.width), randint(0, self.height)]
-                for _ in range(points_count):
-                    points.append([randint(first_point[0]-magnitude[1]*2, first_point[0]+magnitude[1]*2),
-                                   randint(first_point[1]-magnitude[1]*2, first_point[1]+magnitude[1]*2)])
-
-                pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            row_polygon_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_polygon_count
-            y_interval = self.height // row_count
-
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            for i in range(row_count):
                 if (i + 1) % 2 == 0:
-                    current_color = color_one if current_color == color_two else color_two
-                for j in range(row_polygon_count):
-                    if fill == 0:
-                        fill_type = 0
-                    else:
-                        fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                    x_area = (x_interval * j, x_interval * (j + 1))
-                    y_area = (y_interval * i, y_interval * (i + 1))
-                    point_count = randint(3, 5)
-                    points = []
-                    if (i + 1) % 2 == 0:
-                        for k in range(point_count):
-                            points.append((randint(x_area[0], x_area[1]), randint(y_area[0], y_area[1])))
-                        pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[2]:     # Striped Vertical
-            row_polygon_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_polygon_count
-            y_interval = self.height // row_count
-
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            for i in range(row_count):
-                for j in range(row_polygon_count):
-                    if fill == 0:
-                        fill_type = 0
-                    else:
-                        fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                    x_area = (x_interval * j, x_interval * (j + 1))
-                    y_area = (y_interval * i, y_interval * (i + 1))
-                    point_count = randint(3, 5)
-                    points = []
-                    if j % 2 == 0:
-                        current_color = color_one if current_color == color_two else color_two
-                        for k in range(point_count):
-                            points.append((randint(x_area[0], x_area[1]), randint(y_area[0], y_area[1])))
-                        pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_polygon_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_polygon_count
-            y_interval = self.height // row_count
-
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_polygon_count):
-                    if fill == 0:
-                        fill_type = 0
-                    else:
-                        fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                    current_color = color_one if (i + j) % 2 == 0 else color_two
-                    x_area = (x_interval*j, x_interval*(j+1))
-                    y_area = (y_interval*i, y_interval*(i+1))
-                    point_count = randint(3, 5)
-                    points = []
                     for k in range(point_count):
-                        points.append((randint(x_area[0], x_area[1]), randint(y_area[0], y_area[1])))
-                    pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
+                        points.append((rng.randint(x_area[0], x_area[1]), rng.randint(y_area[0], y_area[1])))
+                    layer.polygon(pg.Color(current_color), points, fill_type)
 
-        if style == art_styles_list[4]:     # Cornered
-            x_areas = [(-100, self.width//3), (2*self.width//3, self.width+100),
-                       (2*self.width//3, self.width+100), (-100, self.width//3)]
 
-            y_areas = [(-100, self.height//2-50), (-100, self.height//2-100),
-                       (self.height//2+100, self.height+100), (self.height//2+100, self.height+100)]
+    @register_generator("Filled Polygons", "Striped Vertical", cost=0.11)
+    def draw_filled_polygons_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws filled polygons to a layer in vertical stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
 
-            point_count = randint(3, 5)
-            for i in range(complexity//2):
-                corner = randint(0, 3)
+        row_polygon_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_polygon_count
+        y_interval = self.height // row_count
+
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        for i in range(row_count):
+            for j in range(row_polygon_count):
                 if fill == 0:
                     fill_type = 0
                 else:
-                    fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-                current_color = cp[randint(0, len(cp)-1)]
+                    fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+
+                x_area = (x_interval * j, x_interval * (j + 1))
+                y_area = (y_interval * i, y_interval * (i + 1))
+                point_count = rng.randint(3, 5)
                 points = []
-                for j in range(point_count):
-                    pos = (randint(x_areas[corner][0], x_areas[corner][1]),
-                           randint(y_areas[corner][0], y_areas[corner][1]))
-                    points.append(pos)
-
-                pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[5]:     # Centered
-            x_inner_area = [self.width // 4, 3 * self.width // 4]
-            x_outer_area = [self.width // 6, 5 * self.width // 6]
-            y_area = [self.height // 4, 3 * self.height // 4]
-            for i in range(complexity // 4):
+                if j % 2 == 0:
+                    current_color = color_one if current_color == color_two else color_two
+                    for k in range(point_count):
+                        points.append((rng.randint(x_area[0], x_area[1]), rng.randint(y_area[0], y_area[1])))
+                    layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Filled Polygons", "Mosaic", cost=0.17)
+    def draw_filled_polygons_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws filled polygons to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
+
+        row_polygon_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_polygon_count
+        y_interval = self.height // row_count
+
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_polygon_count):
                 if fill == 0:
                     fill_type = 0
                 else:
-                    fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                current_color = cp[randint(0, len(cp)-1)]
+                    fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
 
-                point_count = randint(3, 4)
+                current_color = color_one if (i + j) % 2 == 0 else color_two
+                x_area = (x_interval*j, x_interval*(j+1))
+                y_area = (y_interval*i, y_interval*(i+1))
+                point_count = rng.randint(3, 5)
                 points = []
-                for j in range(point_count):
-                    if randint(0, 6) <= 4:
-                        pos = (randint(x_inner_area[0], x_inner_area[1]), randint(y_area[0], y_area[1]))
-                    else:
-                        pos = (randint(x_outer_area[0], x_outer_area[1]), randint(y_area[0], y_area[1]))
+                for k in range(point_count):
+                    points.append((rng.randint(x_area[0], x_area[1]), rng.randint(y_area[0], y_area[1])))
+                layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Filled Polygons", "Cornered", cost=0.068)
+    def draw_filled_polygons_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws filled polygons to a layer gathered in the corners.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
+
+        x_areas = [(-100, self.width//3), (2*self.width//3, self.width+100),
+                   (2*self.width//3, self.width+100), (-100, self.width//3)]
+
+        y_areas = [(-100, self.height//2-50), (-100, self.height//2-100),
+                   (self.height//2+100, self.height+100), (self.height//2+100, self.height+100)]
 
-                    points.append(pos)
-                pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
+        point_count = rng.randint(3, 5)
+        for i in range(complexity//2):
+            corner = rng.randint(0, 3)
+            if fill == 0:
+                fill_type = 0
+            else:
+                fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            points = []
+            for j in range(point_count):
+                pos = (rng.randint(x_areas[corner][0], x_areas[corner][1]),
+                       rng.randint(y_areas[corner][0], y_areas[corner][1]))
+                points.append(pos)
 
-        if style == art_styles_list[6]:     # Empty
-            pass
+            layer.polygon(pg.Color(current_color), points, fill_type)
 
 
-    def draw_hpolygons(self, layer, complexity, cp, style, magnitude):
-        """! Draws hollow polygons to a layer. 
-        
+    @register_generator("Filled Polygons", "Centered", cost=0.054)
+    def draw_filled_polygons_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws filled polygons to a layer gathered around the center.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 0
+
+        x_inner_area = [self.width // 4, 3 * self.width // 4]
+        x_outer_area = [self.width // 6, 5 * self.width // 6]
+        y_area = [self.height // 4, 3 * self.height // 4]
+        for i in range(complexity // 4):
+            if fill == 0:
+                fill_type = 0
+            else:
+                fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+
+            current_color = cp[rng.randint(0, len(cp)-1)]
+
+            point_count = rng.randint(3, 4)
+            points = []
+            for j in range(point_count):
+                if rng.randint(0, 6) <= 4:
+                    pos = (rng.randint(x_inner_area[0], x_inner_area[1]), rng.randint(y_area[0], y_area[1]))
+                else:
+                    pos = (rng.randint(x_outer_area[0], x_outer_area[1]), rng.randint(y_area[0], y_area[1]))
+
+                points.append(pos)
+            layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Hollow Polygons", "Chaotic", cost=0.094)
+    def draw_hollow_polygons_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws hollow polygons to a layer scattered over the whole layer.
+
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
+        fill = 1
+
+        for i in range(complexity//2):
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            if fill == 0:
+                fill_type = 0
+            else:
+                fill_type = rng.randint(magnitude[0]//5, magnitude[1]//5)
+            points_count = rng.randint(3, 5)
+            points = []
+            first_point = [rng.randint(0, self.width), rng.randint(0, self.height)]
+            for _ in range(points_count):
+                points.append([rng.randint(first_point[0]-magnitude[1]*2, first_point[0]+magnitude[1]*2),
+                               rng.randint(first_point[1]-magnitude[1]*2, first_point[1]+magnitude[1]*2)])
+
+            layer.polygon(pg.Color(current_color), points, fill_type)
+
 
+    @register_generator("Hollow Polygons", "Striped Horizontal", cost=0.1)
+    def draw_hollow_polygons_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws hollow polygons to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
         fill = 1
 
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity//2):
-                current_color = cp[randint(0, len(cp)-1)]
+        row_polygon_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_polygon_count
+        y_interval = self.height // row_count
+
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        for i in range(row_count):
+            if (i + 1) % 2 == 0:
+                current_color = color_one if current_color == color_two else color_two
+            for j in range(row_polygon_count):
                 if fill == 0:
                     fill_type = 0
                 else:
-                    fill_type = randint(magnitude[0]//5, magnitude[1]//5)
-                points_count = randint(3, 5)
+                    fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+
+                x_area = (x_interval * j, x_interval * (j + 1))
+                y_area = (y_interval * i, y_interval * (i + 1))
+                point_count = rng.randint(3, 5)
                 points = []
-                first_point = [randint(0, self.width), randint(0, self.height)]
-                for _ in range(points_count):
-                    points.append([randint(first_point[0]-magnitude[1]*2, first_point[0]+magnitude[1]*2),
-                                   randint(first_point[1]-magnitude[1]*2, first_point[1]+magnitude[1]*2)])
-
-                pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            row_polygon_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_polygon_count
-            y_interval = self.height // row_count
-
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            for i in range(row_count):
                 if (i + 1) % 2 == 0:
-                    current_color = color_one if current_color == color_two else color_two
-                for j in range(row_polygon_count):
-                    if fill == 0:
-                        fill_type = 0
-                    else:
-                        fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                    x_area = (x_interval * j, x_interval * (j + 1))
-                    y_area = (y_interval * i, y_interval * (i + 1))
-                    point_count = randint(3, 5)
-                    points = []
-                    if (i + 1) % 2 == 0:
-                        for k in range(point_count):
-                            points.append((randint(x_area[0], x_area[1]), randint(y_area[0], y_area[1])))
-                        pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[2]:     # Striped Vertical
-            row_polygon_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_polygon_count
-            y_interval = self.height // row_count
-
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            for i in range(row_count):
-                for j in range(row_polygon_count):
-                    if fill == 0:
-                        fill_type = 0
-                    else:
-                        fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                    x_area = (x_interval * j, x_interval * (j + 1))
-                    y_area = (y_interval * i, y_interval * (i + 1))
-                    point_count = randint(3, 5)
-                    points = []
-                    if j % 2 == 0:
-                        current_color = color_one if current_color == color_two else color_two
-                        for k in range(point_count):
-                            points.append((randint(x_area[0], x_area[1]), randint(y_area[0], y_area[1])))
-                        pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_polygon_count = int(complexity // 2)
-            row_count = complexity // 3
-            x_interval = self.width // row_polygon_count
-            y_interval = self.height // row_count
-
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_polygon_count):
-                    if fill == 0:
-                        fill_type = 0
-                    else:
-                        fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-
-                    current_color = color_one if (i + j) % 2 == 0 else color_two
-                    x_area = (x_interval*j, x_interval*(j+1))
-                    y_area = (y_interval*i, y_interval*(i+1))
-                    point_count = randint(3, 5)
-                    points = []
                     for k in range(point_count):
-                        points.append((randint(x_area[0], x_area[1]), randint(y_area[0], y_area[1])))
-                    pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
+                        points.append((rng.randint(x_area[0], x_area[1]), rng.randint(y_area[0], y_area[1])))
+                    layer.polygon(pg.Color(current_color), points, fill_type)
+
 
-        if style == art_styles_list[4]:     # Cornered
-            x_areas = [(-100, self.width//3), (2*self.width//3, self.width+100),
-                       (2*self.width//3, self.width+100), (-100, self.width//3)]
+    @register_generator("Hollow Polygons", "Striped Vertical", cost=0.1)
+    def draw_hollow_polygons_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws hollow polygons to a layer in vertical stripes.
 
-            y_areas = [(-100, self.height//2-50), (-100, self.height//2-100),
-                       (self.height//2+100, self.height+100), (self.height//2+100, self.height+100)]
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
 
-            point_count = randint(3, 5)
-            for i in range(complexity//2):
-                corner = randint(0, 3)
+        row_polygon_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_polygon_count
+        y_interval = self.height // row_count
+
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        for i in range(row_count):
+            for j in range(row_polygon_count):
                 if fill == 0:
                     fill_type = 0
                 else:
-                    fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
-                current_color = cp[randint(0, len(cp)-1)]
+                    fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+
+                x_area = (x_interval * j, x_interval * (j + 1))
+                y_area = (y_interval * i, y_interval * (i + 1))
+                point_count = rng.randint(3, 5)
                 points = []
-                for j in range(point_count):
-                    pos = (randint(x_areas[corner][0], x_areas[corner][1]),
-                           randint(y_areas[corner][0], y_areas[corner][1]))
-                    points.append(pos)
-
-                pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
-
-        if style == art_styles_list[5]:     # Centered
-            x_inner_area = [self.width // 4, 3 * self.width // 4]
-            x_outer_area = [self.width // 6, 5 * self.width // 6]
-            y_area = [self.height // 4, 3 * self.height // 4]
-            for i in range(complexity // 4):
+                if j % 2 == 0:
+                    current_color = color_one if current_color == color_two else color_two
+                    for k in range(point_count):
+                        points.append((rng.randint(x_area[0], x_area[1]), rng.randint(y_area[0], y_area[1])))
+                    layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Hollow Polygons", "Mosaic", cost=0.19)
+    def draw_hollow_polygons_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws hollow polygons to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
+
+        row_polygon_count = int(complexity // 2)
+        row_count = complexity // 3
+        x_interval = self.width // row_polygon_count
+        y_interval = self.height // row_count
+
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_polygon_count):
                 if fill == 0:
                     fill_type = 0
                 else:
-                    fill_type = randint(magnitude[0] // 10, magnitude[1] // 10)
+                    fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
 
-                current_color = cp[randint(0, len(cp)-1)]
-
-                point_count = randint(3, 4)
+                current_color = color_one if (i + j) % 2 == 0 else color_two
+                x_area = (x_interval*j, x_interval*(j+1))
+                y_area = (y_interval*i, y_interval*(i+1))
+                point_count = rng.randint(3, 5)
                 points = []
-                for j in range(point_count):
-                    if randint(0, 6) <= 4:
-                        pos = (randint(x_inner_area[0], x_inner_area[1]), randint(y_area[0], y_area[1]))
-                    else:
-                        pos = (randint(x_outer_area[0], x_outer_area[1]), randint(y_area[0], y_area[1]))
+                for k in range(point_count):
+                    points.append((rng.randint(x_area[0], x_area[1]), rng.randint(y_area[0], y_area[1])))
+                layer.polygon(pg.Color(current_color), points, fill_type)
 
-                    points.append(pos)
-                pg.draw.polygon(layer, pg.Color(current_color), points, fill_type)
 
-        if style == art_styles_list[6]:     # Empty
-            pass
+    @register_generator("Hollow Polygons", "Cornered", cost=0.044)
+    def draw_hollow_polygons_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws hollow polygons to a layer gathered in the corners.
 
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
+
+        x_areas = [(-100, self.width//3), (2*self.width//3, self.width+100),
+                   (2*self.width//3, self.width+100), (-100, self.width//3)]
+
+        y_areas = [(-100, self.height//2-50), (-100, self.height//2-100),
+                   (self.height//2+100, self.height+100), (self.height//2+100, self.height+100)]
+
+        point_count = rng.randint(3, 5)
+        for i in range(complexity//2):
+            corner = rng.randint(0, 3)
+            if fill == 0:
+                fill_type = 0
+            else:
+                fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            points = []
+            for j in range(point_count):
+                pos = (rng.randint(x_areas[corner][0], x_areas[corner][1]),
+                       rng.randint(y_areas[corner][0], y_areas[corner][1]))
+                points.append(pos)
+
+            layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Hollow Polygons", "Centered", cost=0.065)
+    def draw_hollow_polygons_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws hollow polygons to a layer gathered around the center.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
+
+        x_inner_area = [self.width // 4, 3 * self.width // 4]
+        x_outer_area = [self.width // 6, 5 * self.width // 6]
+        y_area = [self.height // 4, 3 * self.height // 4]
+        for i in range(complexity // 4):
+            if fill == 0:
+                fill_type = 0
+            else:
+                fill_type = rng.randint(magnitude[0] // 10, magnitude[1] // 10)
+
+            current_color = cp[rng.randint(0, len(cp)-1)]
+
+            point_count = rng.randint(3, 4)
+            points = []
+            for j in range(point_count):
+                if rng.randint(0, 6) <= 4:
+                    pos = (rng.randint(x_inner_area[0], x_inner_area[1]), rng.randint(y_area[0], y_area[1]))
+                else:
+                    pos = (rng.randint(x_outer_area[0], x_outer_area[1]), rng.randint(y_area[0], y_area[1]))
+
+                points.append(pos)
+            layer.polygon(pg.Color(current_color), points, fill_type)
+
+
+    @register_generator("Lines", "Chaotic", cost=0.21)
+    def draw_lines_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws lines to a layer scattered over the whole layer.
 
-    def draw_lines(self, layer, complexity, cp, style, magnitude):
-        """! Draws lines to a layer. 
-        
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity):
-                posX = (randint(-200, self.width+200), randint(0, self.width))
-                posY = (randint(-200, self.height+200), randint(0, self.height))
-                current_color = cp[randint(0, len(cp) - 1)]
-                size = randint(magnitude[0], magnitude[1])
-                pg.draw.line(layer, pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size//4)
-        elif style == art_styles_list[1]:   # Striped Horizontal
-            interval = self.height // complexity
-            for i in range(complexity):
-                posX = 0, self.width
-                posY = i * interval + randint(0, self.height//10), i * interval + randint(0, self.height//10)
-                current_color = cp[randint(0, len(cp) - 1)]
-                size = randint(magnitude[0], magnitude[1])
-                pg.draw.line(layer, pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size // 4)
-        elif style == art_styles_list[2]:   # Striped Vertical
-            interval = self.width // complexity
-            for i in range(complexity):
-                posY = 0, self.height
-                posX = i * interval + randint(0, self.width//10), i * interval + randint(0, self.width//10)
-                current_color = cp[randint(0, len(cp) - 1)]
-                size = randint(magnitude[0], magnitude[1])
-                pg.draw.line(layer, pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size // 4)
-        elif style == art_styles_list[3]:   # Mosaic
-            row_line_count = complexity // 3 + 1
-            row_count = complexity // 4 + 1
-            x_interval = self.width // (row_line_count - 1)
-            y_interval = self.height // (row_count - 1)
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_line_count):
-                    current_color = color_one if (i+j) % 2 == 0 else color_two
-                    size = randint(magnitude[0], magnitude[1]) // 4
-                    posX = ((x_interval*j), (x_interval*(j+1)))
-                    posY_u = ((y_interval*i), (y_interval*(i+1)))
-                    posY_d = ((y_interval*(i+1)), (y_interval*i))
-                    if randint(0,1) == 0:
-                        pg.draw.line(layer, pg.Color(current_color), (posX[0], posY_u[0]), (posX[1], posY_u[1]), size)
-                    else:
-                        pg.draw.line(layer, pg.Color(current_color), (posX[0], posY_d[0]), (posX[1], posY_d[1]), size)
-
-        elif style == art_styles_list[4]:   # Cornered
-            for i in range(complexity*2):
-                current_color = cp[randint(0, len(cp) - 1)]
-                size = randint(magnitude[0], magnitude[1]) // 4
-                corner = randint(0, 3)
-                first_x_area, second_x_area = 0, 0
-                first_y_area, second_y_area = 0, 0
-                if corner == 0:
-                    first_x_area, second_x_area = (-50, 100), (0, self.width//2)
-                    first_y_area, second_y_area = (-50, 100), (0, self.height//2)
-                elif corner == 1:
-                    first_x_area, second_x_area = (self.width-100, self.width+50), (self.width//2, self.width)
-                    first_y_area, second_y_area = (-50, 100), (0, self.height // 2)
-                elif corner == 2:
-                    first_x_area, second_x_area = (self.width-100, self.width+50), (self.width//2, self.width)
-                    first_y_area, second_y_area = (self.height-100, self.height+50), (self.height//2, self.height)
-                elif corner == 3:
-                    first_x_area, second_x_area = (-50, 100), (0, self.width // 2)
-                    first_y_area, second_y_area = (self.height-100, self.height+50), (self.height//2, self.height)
-
-                posX = (randint(first_x_area[0], first_x_area[1]), randint(second_x_area[0], second_x_area[1]))
-                posY = (randint(first_y_area[0], first_y_area[1]), randint(second_y_area[0], second_y_area[1]))
-
-                pg.draw.line(layer, pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size)
-        elif style == art_styles_list[5]:   # Centered
-            for i in range(complexity//2):
-                current_color = cp[randint(0, len(cp)-1)]
-                posX = (randint(2*self.width//5, 3*self.width//5), randint(0, self.width))
-                posY = (randint(2*self.height//5, 3*self.height//5), randint(0, self.height))
-                size = randint(magnitude[0], magnitude[1]) // 4
-                pg.draw.line(layer, pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size)
-        elif style == art_styles_list[6]:   # Empty, do not draw anything.
-            pass
-
-
-    def draw_rings(self, layer, complexity, cp, style, magnitude):
-        """! Draws rings to a layer. 
-        
+        for i in range(complexity):
+            posX = (rng.randint(-200, self.width+200), rng.randint(0, self.width))
+            posY = (rng.randint(-200, self.height+200), rng.randint(0, self.height))
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            size = rng.randint(magnitude[0], magnitude[1])
+            layer.line(pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size//4)
+
+
+    @register_generator("Lines", "Striped Horizontal", cost=0.77)
+    def draw_lines_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws lines to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        interval = self.height // complexity
+        for i in range(complexity):
+            posX = 0, self.width
+            posY = i * interval + rng.randint(0, self.height//10), i * interval + rng.randint(0, self.height//10)
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            size = rng.randint(magnitude[0], magnitude[1])
+            layer.line(pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size // 4)
+
+
+    @register_generator("Lines", "Striped Vertical", cost=0.17)
+    def draw_lines_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws lines to a layer in vertical stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        interval = self.width // complexity
+        for i in range(complexity):
+            posY = 0, self.height
+            posX = i * interval + rng.randint(0, self.width//10), i * interval + rng.randint(0, self.width//10)
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            size = rng.randint(magnitude[0], magnitude[1])
+            layer.line(pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size // 4)
+
+
+    @register_generator("Lines", "Mosaic", cost=0.26)
+    def draw_lines_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws lines to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_line_count = complexity // 3 + 1
+        row_count = complexity // 4 + 1
+        x_interval = self.width // (row_line_count - 1)
+        y_interval = self.height // (row_count - 1)
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_line_count):
+                current_color = color_one if (i+j) % 2 == 0 else color_two
+                size = rng.randint(magnitude[0], magnitude[1]) // 4
+                posX = ((x_interval*j), (x_interval*(j+1)))
+                posY_u = ((y_interval*i), (y_interval*(i+1)))
+                posY_d = ((y_interval*(i+1)), (y_interval*i))
+                if rng.randint(0,1) == 0:
+                    layer.line(pg.Color(current_color), (posX[0], posY_u[0]), (posX[1], posY_u[1]), size)
+                else:
+                    layer.line(pg.Color(current_color), (posX[0], posY_d[0]), (posX[1], posY_d[1]), size)
+
+
+    @register_generator("Lines", "Cornered", cost=0.41)
+    def draw_lines_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws lines to a layer gathered in the corners.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        for i in range(complexity*2):
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            size = rng.randint(magnitude[0], magnitude[1]) // 4
+            corner = rng.randint(0, 3)
+            first_x_area, second_x_area = 0, 0
+            first_y_area, second_y_area = 0, 0
+            if corner == 0:
+                first_x_area, second_x_area = (-50, 100), (0, self.width//2)
+                first_y_area, second_y_area = (-50, 100), (0, self.height//2)
+            elif corner == 1:
+                first_x_area, second_x_area = (self.width-100, self.width+50), (self.width//2, self.width)
+                first_y_area, second_y_area = (-50, 100), (0, self.height // 2)
+            elif corner == 2:
+                first_x_area, second_x_area = (self.width-100, self.width+50), (self.width//2, self.width)
+                first_y_area, second_y_area = (self.height-100, self.height+50), (self.height//2, self.height)
+            elif corner == 3:
+                first_x_area, second_x_area = (-50, 100), (0, self.width // 2)
+                first_y_area, second_y_area = (self.height-100, self.height+50), (self.height//2, self.height)
+
+            posX = (rng.randint(first_x_area[0], first_x_area[1]), rng.randint(second_x_area[0], second_x_area[1]))
+            posY = (rng.randint(first_y_area[0], first_y_area[1]), rng.randint(second_y_area[0], second_y_area[1]))
+
+            layer.line(pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size)
+
+
+    @register_generator("Lines", "Centered", cost=0.14)
+    def draw_lines_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws lines to a layer gathered around the center.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        for i in range(complexity//2):
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            posX = (rng.randint(2*self.width//5, 3*self.width//5), rng.randint(0, self.width))
+            posY = (rng.randint(2*self.height//5, 3*self.height//5), rng.randint(0, self.height))
+            size = rng.randint(magnitude[0], magnitude[1]) // 4
+            layer.line(pg.Color(current_color), (posX[0], posY[0]), (posX[1], posY[1]), size)
+
+
+    @register_generator("Rings", "Chaotic", cost=0.7, memory=default_max_bytes)
+    def draw_rings_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws rings to a layer scattered over the whole layer.
+
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
+        fill = 1
+
+        for i in range(complexity):
+            rad = rng.randint(magnitude[0], magnitude[1])
+            if fill == 1:
+                fill_type = rng.randint(5, rad//2)
+            else:
+                fill_type = 0
+            centerX = rng.randint(-25, self.width + 25)
+            centerY = rng.randint(-25, self.height + 25)
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+            layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (centerX, centerY))
+
 
+    @register_generator("Rings", "Striped Horizontal", cost=1.4, memory=default_max_bytes)
+    def draw_rings_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws rings to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
         fill = 1
 
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity):
-                rad = randint(magnitude[0], magnitude[1])
+        row_circle_count = complexity // 2 + 2
+        point = self.width // (row_circle_count - 2)
+        row_count = self.height // point + 2
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            if i % 2 == 0:
+                current_color = color_one if current_color == color_two else color_two
+            for j in range(row_circle_count):
+                posX = j * point
+                posY = i * point
+                rad = rng.randint(magnitude[0], magnitude[1])
                 if fill == 1:
-                    fill_type = randint(5, rad//2)
+                    fill_type = rng.randint(5, rad // 2)
                 else:
                     fill_type = 0
-                centerX = randint(-25, self.width + 25)
-                centerY = randint(-25, self.height + 25)
-                current_color = cp[randint(0, len(cp) - 1)]
-                alpha_surface = pg.Surface((rad*2, rad*2))
-                alpha_surface.fill((0, 0, 0))
-                pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                alpha_surface.set_colorkey((0, 0, 0))
-                alpha_surface.set_alpha(randint(150, 255))
-                layer.blit(alpha_surface, (centerX-rad, centerY-rad))
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            row_circle_count = complexity // 2 + 2
-            point = self.width // (row_circle_count - 2)
-            row_count = self.height // point + 2
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
                 if i % 2 == 0:
-                    current_color = color_one if current_color == color_two else color_two
-                for j in range(row_circle_count):
-                    posX = j * point
-                    posY = i * point
-                    rad = randint(magnitude[0], magnitude[1])
-                    if fill == 1:
-                        fill_type = randint(5, rad // 2)
-                    else:
-                        fill_type = 0
-                    if i % 2 == 0:
-                        alpha_surface = pg.Surface((rad * 2, rad * 2))
-                        alpha_surface.fill((0, 0, 0))
-                        pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                        alpha_surface.set_colorkey((0, 0, 0))
-                        alpha_surface.set_alpha(randint(150, 255))
-                        layer.blit(alpha_surface, (posX - rad, posY - rad))
-
-        if style == art_styles_list[2]:  # Striped Vertical
-            row_circle_count = complexity // 2 + 2
-            point = self.width // (row_circle_count - 2)
-            row_count = self.height // point + 2
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
-                for j in range(row_circle_count):
-                    if (j+1) % 2 == 0:
-                        current_color = color_one if current_color == color_two else color_two
-                    posX = j * point
-                    posY = i * point
-                    rad = randint(magnitude[0], magnitude[1])
-                    if fill == 1:
-                        fill_type = randint(5, rad // 2)
-                    else:
-                        fill_type = 0
-                    if j % 2 == 0:
-                        alpha_surface = pg.Surface((rad * 2, rad * 2))
-                        alpha_surface.fill((0, 0, 0))
-                        pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                        alpha_surface.set_colorkey((0, 0, 0))
-                        alpha_surface.set_alpha(randint(150, 255))
-                        layer.blit(alpha_surface, (posX - rad, posY - rad))
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_circle_count = complexity
-            rad = self.width // row_circle_count
-            row_count = self.height // rad + 1
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-            for i in range(row_count):
-                for j in range(row_circle_count):
-                    if fill == 1:
-                        fill_type = rad//4
-                    else:
-                        fill_type = 0
-                    current_color = color_one if (i + j) % 2 == 0 else color_two
-                    posX = rad + j * (rad+1) * 2
-                    posY = rad + i * (rad+1) * 2
-                    pg.draw.circle(layer, pg.Color(current_color), (posX, posY), rad, fill_type)
-
-        if style == art_styles_list[4]:     # Cornered
-            for i in range(complexity*2):
-                current_color = cp[randint(0, len(cp)-1)]
-                corner = randint(0, 3)
-                x_area, y_area = (0, 0), (0, 0)
-                if corner == 0:
-                    x_area, y_area = (-50, self.width//3), (-50, self.height//3)
-                if corner == 1:
-                    x_area, y_area = (self.width//1.5, self.width+50), (-50, self.height//3)
-                if corner == 2:
-                    x_area, y_area = (self.width//1.5, self.width+50), (self.height//1.5, self.height+50)
-                if corner == 3:
-                    x_area, y_area = (-50, self.width//3), (self.height//1.5, self.height+50)
-
-                posX = randint(x_area[0], x_area[1])
-                posY = randint(y_area[0], y_area[1])
-                rad = randint(magnitude[0], magnitude[1])
+                    layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (posX, posY))
 
-                if fill == 1:
-                    fill_type = randint(5, rad//2)
-                else:
-                    fill_type = 0
 
-                alpha_surface = pg.Surface((rad * 2, rad * 2))
-                alpha_surface.fill((0, 0, 0))
-                pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                alpha_surface.set_colorkey((0, 0, 0))
-                alpha_surface.set_alpha(randint(150, 255))
-                layer.blit(alpha_surface, (posX - rad, posY - rad))
+    @register_generator("Rings", "Striped Vertical", cost=1.7, memory=default_max_bytes)
+    def draw_rings_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws rings to a layer in vertical stripes.
 
-        if style == art_styles_list[5]:     # Centered
-            in_x_area, in_y_area = (self.width//4, 3*self.width//4), (self.height//4, 3*self.height//4)
-            out_x_area, out_y_area = (self.width//6, 5*self.width//6), (self.height//6, 5*self.height//6)
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
 
-            for i in range(complexity):
+        row_circle_count = complexity // 2 + 2
+        point = self.width // (row_circle_count - 2)
+        row_count = self.height // point + 2
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            for j in range(row_circle_count):
+                if (j+1) % 2 == 0:
+                    current_color = color_one if current_color == color_two else color_two
+                posX = j * point
+                posY = i * point
+                rad = rng.randint(magnitude[0], magnitude[1])
                 if fill == 1:
-                    fill_type = randint(magnitude[0], magnitude[1])
+                    fill_type = rng.randint(5, rad // 2)
                 else:
                     fill_type = 0
-                random_number = randint(0, 5)
-                if random_number < 4:
-                    center_x = randint(in_x_area[0], in_x_area[1])
-                    center_y = randint(in_y_area[0], in_y_area[1])
-                else:
-                    center_x = randint(out_x_area[0], out_x_area[1])
-                    center_y = randint(out_y_area[0], out_y_area[1])
+                if j % 2 == 0:
+                    layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (posX, posY))
 
-                rad = randint(magnitude[0], magnitude[1])
-                current_color = cp[randint(0, len(cp)-1)]
 
+    @register_generator("Rings", "Mosaic", cost=0.32)
+    def draw_rings_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws rings to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
+
+        row_circle_count = complexity
+        rad = self.width // row_circle_count
+        row_count = self.height // rad + 1
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+        for i in range(row_count):
+            for j in range(row_circle_count):
                 if fill == 1:
-                    fill_type = randint(5, rad//2)
+                    fill_type = rad//4
                 else:
                     fill_type = 0
+                current_color = color_one if (i + j) % 2 == 0 else color_two
+                posX = rad + j * (rad+1) * 2
+                posY = rad + i * (rad+1) * 2
+                layer.circle(pg.Color(current_color), (posX, posY), rad, fill_type)
+
+
+    @register_generator("Rings", "Cornered", cost=1.1, memory=default_max_bytes)
+    def draw_rings_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws rings to a layer gathered in the corners.
 
-                alpha_surface = pg.Surface((rad * 2, rad * 2))
-                alpha_surface.fill((0, 0, 0))
-                pg.draw.circle(alpha_surface, pg.Color(current_color), (rad, rad), rad, fill_type)
-                alpha_surface.set_colorkey((0, 0, 0))
-                alpha_surface.set_alpha(randint(150, 255))
-                layer.blit(alpha_surface, (center_x - rad, center_y - rad))
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        fill = 1
+
+        for i in range(complexity*2):
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            corner = rng.randint(0, 3)
+            x_area, y_area = (0, 0), (0, 0)
+            if corner == 0:
+                x_area, y_area = (-50, self.width//3), (-50, self.height//3)
+            if corner == 1:
+                x_area, y_area = (2*self.width//3, self.width+50), (-50, self.height//3)
+            if corner == 2:
+                x_area, y_area = (2*self.width//3, self.width+50), (2*self.height//3, self.height+50)
+            if corner == 3:
+                x_area, y_area = (-50, self.width//3), (2*self.height//3, self.height+50)
 
-        if style == art_styles_list[6]:     # Empty
-            pass
+            posX = rng.randint(x_area[0], x_area[1])
+            posY = rng.randint(y_area[0], y_area[1])
+            rad = rng.randint(magnitude[0], magnitude[1])
 
+            if fill == 1:
+                fill_type = rng.randint(5, rad//2)
+            else:
+                fill_type = 0
+
+            layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (posX, posY))
+
+
+    @register_generator("Rings", "Centered", cost=0.84, memory=default_max_bytes)
+    def draw_rings_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws rings to a layer gathered around the center.
 
-    def draw_squares(self, layer, complexity, cp, style, magnitude):
-        """! Draws squares to a layer. 
-        
         @param layer        The layer to draw to.
         @param complexity   The complexity of the layer.
         @param cp           The color palette to draw with.
-        @param style        The style of the layer.
         @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
         """
-        if style == art_styles_list[0]:     # Chaotic
-            for i in range(complexity*2):
-                size = randint(magnitude[0], magnitude[1])
-                posX = randint(-size, self.width)
-                posY = randint(-size, self.height)
-                current_color = cp[randint(0, len(cp)-1)]
-                pg.draw.rect(layer, pg.Color(current_color), (posX, posY, size, size))
-
-        if style == art_styles_list[1]:     # Striped Horizontal
-            row_square_count = complexity // 2 + 2
-            point = self.width // (row_square_count - 2)
-            row_count = self.height // point + 2
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
+        fill = 1
+
+        in_x_area, in_y_area = (self.width//4, 3*self.width//4), (self.height//4, 3*self.height//4)
+        out_x_area, out_y_area = (self.width//6, 5*self.width//6), (self.height//6, 5*self.height//6)
+
+        for i in range(complexity):
+            if fill == 1:
+                fill_type = rng.randint(magnitude[0], magnitude[1])
+            else:
+                fill_type = 0
+            random_number = rng.randint(0, 5)
+            if random_number < 4:
+                center_x = rng.randint(in_x_area[0], in_x_area[1])
+                center_y = rng.randint(in_y_area[0], in_y_area[1])
+            else:
+                center_x = rng.randint(out_x_area[0], out_x_area[1])
+                center_y = rng.randint(out_y_area[0], out_y_area[1])
+
+            rad = rng.randint(magnitude[0], magnitude[1])
+            current_color = cp[rng.randint(0, len(cp)-1)]
+
+            if fill == 1:
+                fill_type = rng.randint(5, rad//2)
+            else:
+                fill_type = 0
+
+            layer.stamp(rad, current_color, fill_type, rng.randint(150, 255), (center_x, center_y))
+
+
+    @register_generator("Squares", "Chaotic", cost=0.13)
+    def draw_squares_chaotic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws squares to a layer scattered over the whole layer.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        for i in range(complexity*2):
+            size = rng.randint(magnitude[0], magnitude[1])
+            posX = rng.randint(-size, self.width)
+            posY = rng.randint(-size, self.height)
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            layer.rect(pg.Color(current_color), (posX, posY, size, size))
+
+
+    @register_generator("Squares", "Striped Horizontal", cost=0.032)
+    def draw_squares_striped_horizontal(self, layer, complexity, cp, magnitude, rng):
+        """! Draws squares to a layer in horizontal stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_square_count = complexity // 2 + 2
+        point = self.width // (row_square_count - 2)
+        row_count = self.height // point + 2
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            if i % 2 == 0:
+                current_color = color_one if current_color == color_two else color_two
+            for j in range(row_square_count):
+                posX = j * point
+                posY = i * point
+                size = rng.randint(magnitude[0], magnitude[1])
                 if i % 2 == 0:
+                    layer.rect(pg.Color(current_color),(posX, posY, size, size))
+
+
+    @register_generator("Squares", "Striped Vertical", cost=0.13)
+    def draw_squares_striped_vertical(self, layer, complexity, cp, magnitude, rng):
+        """! Draws squares to a layer in vertical stripes.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_square_count = complexity // 2 + 2
+        point = self.width // (row_square_count - 2)
+        row_count = self.height // point + 2
+        color_one = cp[rng.randint(0, len(cp) - 1)]
+        color_two = cp[rng.randint(0, len(cp) - 1)]
+        current_color = color_one
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            for j in range(row_square_count):
+                if j % 1 == 0:
                     current_color = color_one if current_color == color_two else color_two
-                for j in range(row_square_count):
-                    posX = j * point
-                    posY = i * point
-                    size = randint(magnitude[0], magnitude[1])
-                    if i % 2 == 0:
-                        pg.draw.rect(layer, pg.Color(current_color),(posX, posY, size, size))
-
-        if style == art_styles_list[2]:     # Striped Vertical
-            row_square_count = complexity // 2 + 2
-            point = self.width // (row_square_count - 2)
-            row_count = self.height // point + 2
-            color_one = cp[randint(0, len(cp) - 1)]
-            color_two = cp[randint(0, len(cp) - 1)]
-            current_color = color_one
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
-                for j in range(row_square_count):
-                    if j % 1 == 0:
-                        current_color = color_one if current_color == color_two else color_two
-                    posX = j * point
-                    posY = i * point
-                    size = randint(magnitude[0], magnitude[1])
-                    if j % 2 == 0:
-                        pg.draw.rect(layer, pg.Color(current_color), (posX-size//2, posY-size//2, size, size))
-
-        if style == art_styles_list[3]:     # Mosaic
-            row_square_count = complexity//2 + 2
-            size = self.width // (row_square_count-2)
-            row_count = self.height // size + 2
-            color_one = cp[randint(0, len(cp)-1)]
-            color_two = cp[randint(0, len(cp)-1)]
-            while color_two == color_one:
-                color_two = cp[randint(0, len(cp) - 1)]
-
-            for i in range(row_count):
-                for j in range(row_square_count):
-                    current_color = color_one if (i + j) % 2 == 0 else color_two
-                    posX = j * size
-                    posY = i * size
-                    pg.draw.rect(layer, pg.Color(current_color), (posX+size//20, posY+size//20, size-size//10, size-size//10))
-
-        if style == art_styles_list[4]:     # Cornered
-            for corner in range(4):
-                corner_color = cp[randint(0, len(cp)-1)]
-                if corner == 0:
-                    pg.draw.rect(layer, pg.Color(corner_color), (0, 0, magnitude[1], magnitude[1]))
-                if corner == 1:
-                    pg.draw.rect(layer, pg.Color(corner_color), (self.width-magnitude[1], 0, magnitude[1], magnitude[1]))
-                if corner == 2:
-                    pg.draw.rect(layer, pg.Color(corner_color), (self.width-magnitude[1], self.height-magnitude[1], magnitude[1], magnitude[1]))
-                if corner == 3:
-                    pg.draw.rect(layer, pg.Color(corner_color), (0, self.height-magnitude[1], magnitude[1], magnitude[1]))
-
-            for i in range(complexity*3):
-                current_color = cp[randint(0, len(cp)-1)]
-                corner = randint(0, 3)
-                x_area, y_area = (0, 0), (0, 0)
-                if corner == 0:
-                    x_area, y_area = (-magnitude[1]//2, self.width//3), (-magnitude[1]//2, self.height//2-magnitude[1])
-                if corner == 1:
-                    x_area, y_area = (2*self.width//3-magnitude[1], self.width), (-magnitude[1]//2, self.height//2-magnitude[1])
-                if corner == 2:
-                    x_area, y_area = (2*self.width//3-magnitude[1], self.width), (self.height//2, self.height)
-                if corner == 3:
-                    x_area, y_area = (-magnitude[1], self.width//3), (self.height//2, self.height)
-
-                posX = randint(x_area[0], x_area[1])
-                posY = randint(y_area[0], y_area[1])
-                size = randint(magnitude[0], magnitude[1])
-
-                pg.draw.rect(layer, pg.Color(current_color), (posX, posY, size, size))
-
-        if style == art_styles_list[5]:     # Centered
-            in_x_area, in_y_area = (self.width // 4, 3 * self.width // 4), (self.height // 4, 3 * self.height // 4)
-            out_x_area, out_y_area = (self.width // 6, 5 * self.width // 6), (self.height // 6, 5 * self.height // 6)
-
-            for i in range(complexity):
-                random_number = randint(0, 5)
-                if random_number < 4:
-                    center_x = randint(in_x_area[0], in_x_area[1])
-                    center_y = randint(in_y_area[0], in_y_area[1])
-                else:
-                    center_x = randint(out_x_area[0], out_x_area[1])
-                    center_y = randint(out_y_area[0], out_y_area[1])
+                posX = j * point
+                posY = i * point
+                size = rng.randint(magnitude[0], magnitude[1])
+                if j % 2 == 0:
+                    layer.rect(pg.Color(current_color), (posX-size//2, posY-size//2, size, size))
+
+
+    @register_generator("Squares", "Mosaic", cost=0.47)
+    def draw_squares_mosaic(self, layer, complexity, cp, magnitude, rng):
+        """! Draws squares to a layer in a checkered grid.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        row_square_count = complexity//2 + 2
+        size = self.width // (row_square_count-2)
+        row_count = self.height // size + 2
+        color_one = cp[rng.randint(0, len(cp)-1)]
+        color_two = cp[rng.randint(0, len(cp)-1)]
+        while color_two == color_one:
+            color_two = cp[rng.randint(0, len(cp) - 1)]
+
+        for i in range(row_count):
+            for j in range(row_square_count):
+                current_color = color_one if (i + j) % 2 == 0 else color_two
+                posX = j * size
+                posY = i * size
+                layer.rect(pg.Color(current_color), (posX+size//20, posY+size//20, size-size//10, size-size//10))
+
+
+    @register_generator("Squares", "Cornered", cost=0.21)
+    def draw_squares_cornered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws squares to a layer gathered in the corners.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        for corner in range(4):
+            corner_color = cp[rng.randint(0, len(cp)-1)]
+            if corner == 0:
+                layer.rect(pg.Color(corner_color), (0, 0, magnitude[1], magnitude[1]))
+            if corner == 1:
+                layer.rect(pg.Color(corner_color), (self.width-magnitude[1], 0, magnitude[1], magnitude[1]))
+            if corner == 2:
+                layer.rect(pg.Color(corner_color), (self.width-magnitude[1], self.height-magnitude[1], magnitude[1], magnitude[1]))
+            if corner == 3:
+                layer.rect(pg.Color(corner_color), (0, self.height-magnitude[1], magnitude[1], magnitude[1]))
+
+        for i in range(complexity*3):
+            current_color = cp[rng.randint(0, len(cp)-1)]
+            corner = rng.randint(0, 3)
+            x_area, y_area = (0, 0), (0, 0)
+            if corner == 0:
+                x_area, y_area = (-magnitude[1]//2, self.width//3), (-magnitude[1]//2, self.height//2-magnitude[1])
+            if corner == 1:
+                x_area, y_area = (2*self.width//3-magnitude[1], self.width), (-magnitude[1]//2, self.height//2-magnitude[1])
+            if corner == 2:
+                x_area, y_area = (2*self.width//3-magnitude[1], self.width), (self.height//2, self.height)
+            if corner == 3:
+                x_area, y_area = (-magnitude[1], self.width//3), (self.height//2, self.height)
+
+            posX = rng.randint(x_area[0], x_area[1])
+            posY = rng.randint(y_area[0], y_area[1])
+            size = rng.randint(magnitude[0], magnitude[1])
+
+            layer.rect(pg.Color(current_color), (posX, posY, size, size))
+
+
+    @register_generator("Squares", "Centered", cost=0.08)
+    def draw_squares_centered(self, layer, complexity, cp, magnitude, rng):
+        """! Draws squares to a layer gathered around the center.
+
+        @param layer        The layer to draw to.
+        @param complexity   The complexity of the layer.
+        @param cp           The color palette to draw with.
+        @param magnitude    The magnitude of the layer.
+        @param rng          The random.Random stream to draw with.
+        """
+        in_x_area, in_y_area = (self.width // 4, 3 * self.width // 4), (self.height // 4, 3 * self.height // 4)
+        out_x_area, out_y_area = (self.width // 6, 5 * self.width // 6), (self.height // 6, 5 * self.height // 6)
+
+        for i in range(complexity):
+            random_number = rng.randint(0, 5)
+            if random_number < 4:
+                center_x = rng.randint(in_x_area[0], in_x_area[1])
+                center_y = rng.randint(in_y_area[0], in_y_area[1])
+            else:
+                center_x = rng.randint(out_x_area[0], out_x_area[1])
+                center_y = rng.randint(out_y_area[0], out_y_area[1])
+
+            size = rng.randint(magnitude[0], magnitude[1])
+            current_color = cp[rng.randint(0, len(cp) - 1)]
+
+            layer.rect(pg.Color(current_color), (center_x-size//2, center_y-size//2, size, size))
+
+
+def draw_empty(generator, layer, complexity, cp, magnitude, rng):
+    """! Draws nothing, the generator of the Empty style. """
+    pass
+
+
+def _register_empty():
+    """! Registers draw_empty as the Empty style of every shape. """
+    for shape in art_shapes_list:
+        generator_registry.register(shape, "Empty", draw_empty, cost=0)
 
-                size = randint(magnitude[0], magnitude[1])
-                current_color = cp[randint(0, len(cp) - 1)]
 
-                pg.draw.rect(layer, pg.Color(current_color), (center_x-size//2, center_y-size//2, size, size))
-        if style == art_styles_list[6]:     # Empty
-            pass
\ No newline at end of file
+_register_empty()
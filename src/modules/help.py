@@ -12,6 +12,7 @@ import pygame as pg
 
 from modules.widget import widget
 import assets
+from render_graph import render_node
 
 class help(widget):
     """! The help widget class.
@@ -44,6 +45,8 @@ class help(widget):
         ## Theme color for background
         self.bg_color = "#2B2834"
 
+        self.__panel = render_node("help.panel", self.__draw_panel)
+
 
     def draw_ui_dynamic(self):
         """! Draws the dynamic ui elements for the help widget.
@@ -52,75 +55,82 @@ class help(widget):
         """
         if self.help_opt == 0:
             return
-        
-        # if self.__help_left:
-        #     pg.draw.rect(self.__window, pg.Color("#2B2834"), (self.__x - 510, self.__y, 510, 380))
-        #     p = [self.__x - 500, self.__y+10]
-        # else:
-        #     pg.draw.rect(self.__window, pg.Color("#2B2834"), (self.__x+100, 90, 510, 380))
-        #     p = [self.__x + 110, self.__y+10]
-
-        pg.draw.rect(self.__window, pg.Color(self.bg_color), (self.__x+100, self.__y, 510, 420))
-        p = [self.__x + 110, self.__y+10] # Position
+
+        # The dialog is only drawn again when the theme changes.
+        self.__panel.set_params((self.bg_color, self.font_color, self.font_color_emph))
+        self.__window.blit(self.__panel.get(), (self.__x+100, self.__y))
+
+
+    def __draw_panel(self, key):
+        """! Draws the instructions dialog to a new panel surface.
+
+        @param key      The theme colors the panel is drawn with, see draw_ui_dynamic.
+
+        @return The panel surface, drawn right of the help button.
+        """
+        panel = pg.Surface((510, 420))
+        panel.fill(pg.Color(self.bg_color))
+        p = [10, 10] # Position
         c = self.font_color # Color
         s = 12 # Font-size
         ri = 12     # Row interval
-        assets.text_to_screen(self.__window, "Thanks for trying out our program! Let us help you with how the program works.", c, p, s)
+        assets.text_to_screen(panel, "Thanks for trying out our program! Let us help you with how the program works.", c, p, s)
         p = [p[0], p[1]+ri+10]
-        assets.text_to_screen(self.__window, "The left side contains the art generation options, we have three layers that can be in different", c, p, s)
+        assets.text_to_screen(panel, "The left side contains the art generation options, we have three layers that can be in different", c, p, s)
         p = [p[0], p[1]+ri]
-        assets.text_to_screen(self.__window, "styles, different shapes, different complexities, different sizes, and different transparencies. For", c, p, s)
+        assets.text_to_screen(panel, "styles, different shapes, different complexities, different sizes, and different transparencies. For", c, p, s)
         p = [p[0], p[1]+ri]
-        assets.text_to_screen(self.__window, "example, a layer with 'Cornered' 'Circles' options, will generate circles that are roughly cornered.", c, p, s)
+        assets.text_to_screen(panel, "example, a layer with 'Cornered' 'Circles' options, will generate circles that are roughly cornered.", c, p, s)
         p = [p[0], p[1]+ri+10]
-        assets.text_to_screen(self.__window, "Random values have a big part in our program by making the possibilities endless.", c, p, s)
+        assets.text_to_screen(panel, "Random values have a big part in our program by making the possibilities endless.", c, p, s)
         p = [p[0], p[1]+ri]
-        assets.text_to_screen(self.__window, "You can click on the small buttons next to an option to 'Lock' it. This allows you to keep certain", c, p, s)
+        assets.text_to_screen(panel, "You can click on the small buttons next to an option to 'Lock' it. This allows you to keep certain", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "settings constant while allowing the rest of the settings to be randomly generated.", c, p, s)
+        assets.text_to_screen(panel, "settings constant while allowing the rest of the settings to be randomly generated.", c, p, s)
         p = [p[0], p[1] + ri+10]
         c = self.font_color_emph
-        assets.text_to_screen(self.__window, "Generate Button: Generates art with the options specified in the options panel.", c, p, s)
+        assets.text_to_screen(panel, "Generate Button: Generates art with the options specified in the options panel.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Generate Randomly Button: Generates art by randomizing the options on the left.", c, p, s)
+        assets.text_to_screen(panel, "Generate Randomly Button: Generates art by randomizing the options on the left.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Export Button: Opens a file dialog and let's you export a PNG of your art in 4k quality.", c, p, s)
+        assets.text_to_screen(panel, "Export Button: Opens a file dialog and let's you export a PNG of your art in 4k quality.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Theme Button: Changes the theme of the program from dark mode to light mode, and vice versa.", c, p, s)
+        assets.text_to_screen(panel, "Theme Button: Changes the theme of the program from dark mode to light mode, and vice versa.", c, p, s)
         p = [p[0], p[1] + ri+10]
         c = self.font_color
-        assets.text_to_screen(self.__window, "Overlay options don't change by randomizing or generating new art.", c, p, s)
+        assets.text_to_screen(panel, "Overlay options don't change by randomizing or generating new art.", c, p, s)
         p = [p[0], p[1] + ri+10]
-        assets.text_to_screen(self.__window, "There are 32 unique color palettes. For each layer, there are seven style options with eight", c, p, s)
+        assets.text_to_screen(panel, "There are 32 unique color palettes. For each layer, there are seven style options with eight", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "shape options. Shapes are self explanatory, but let's take a look at the styles:", c, p, s)
+        assets.text_to_screen(panel, "shape options. Shapes are self explanatory, but let's take a look at the styles:", c, p, s)
         p = [p[0], p[1] + ri+5]
         c = self.font_color_emph
-        assets.text_to_screen(self.__window, "Chaotic - The most randomized option.", c, p, s)
+        assets.text_to_screen(panel, "Chaotic - The most randomized option.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Striped Horizontal - Whatever the shape is, the shapes roughly line up in horizontal lines", c, p, s)
+        assets.text_to_screen(panel, "Striped Horizontal - Whatever the shape is, the shapes roughly line up in horizontal lines", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Striped Vertical - Same with striped horizontal but it's vertical.", c, p, s)
+        assets.text_to_screen(panel, "Striped Vertical - Same with striped horizontal but it's vertical.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Mosaic - The selected shape will cover the canvas with equal amount of spacing between them.", c, p, s)
+        assets.text_to_screen(panel, "Mosaic - The selected shape will cover the canvas with equal amount of spacing between them.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Cornered - Forces the randomizer to make the shapes appear roughly on the corners.", c, p, s)
+        assets.text_to_screen(panel, "Cornered - Forces the randomizer to make the shapes appear roughly on the corners.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Centered - Forces the randomizer to make the shapes appear roughlt on the center.", c, p, s)
+        assets.text_to_screen(panel, "Centered - Forces the randomizer to make the shapes appear roughlt on the center.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Empty - Doesn't draw any shapes to the layer. Sometimes one shape is enough for the art.", c, p, s)
+        assets.text_to_screen(panel, "Empty - Doesn't draw any shapes to the layer. Sometimes one shape is enough for the art.", c, p, s)
         p = [p[0], p[1] + ri+10]
         c = self.font_color
-        assets.text_to_screen(self.__window, "Complexity adjusts how many shapes will be drawn. Size adjusts how large the shapes can be.", c, p, s)
+        assets.text_to_screen(panel, "Complexity adjusts how many shapes will be drawn. Size adjusts how large the shapes can be.", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "Transparency adjusts how translucent the shapes are.", c, p, s)
+        assets.text_to_screen(panel, "Transparency adjusts how translucent the shapes are.", c, p, s)
         p = [p[0], p[1] + ri+10]
-        assets.text_to_screen(self.__window, "The Text Overlay feature allows you to put text on top of the generated art. The font size and", c, p, s)
+        assets.text_to_screen(panel, "The Text Overlay feature allows you to put text on top of the generated art. The font size and", c, p, s)
         p = [p[0], p[1] + ri]
-        assets.text_to_screen(self.__window, "text position can be adjusted using the appropriate sliders.", c, p, s)
+        assets.text_to_screen(panel, "text position can be adjusted using the appropriate sliders.", c, p, s)
         p = [p[0], p[1] + ri+10]
         c = self.font_color_emph
-        assets.text_to_screen(self.__window, "ENJOY! :D", c, p, s)
+        assets.text_to_screen(panel, "ENJOY! :D", c, p, s)
+        return panel
 
 
     def draw_ui_static(self):
@@ -14,27 +14,12 @@ from random import randint, choice
 from modules.widget import widget
 from widget_storage import widgets
 import assets
-
-_art_styles_list = [
-    "Chaotic",
-    "Striped Horizontal",
-    "Striped Vertical",
-    "Mosaic",
-    "Cornered",
-    "Centered",
-    "Empty"
-]
-
-_art_shapes_list = [
-    "Lines",
-    "Circles",
-    "Squares",
-    "Hollow Polygons",
-    "Filled Polygons",
-    "Dots",
-    "Curves",
-    "Rings"
-]
+import profiler
+import render
+from render_graph import render_node
+from modules import generator_registry
+from modules.sparse_layer import sparse_layer
+import randomize
 
 
 class layer(widget):
@@ -43,17 +28,19 @@ class layer(widget):
     Provides a ui and functionality to specify a drawing algorithm and draw to a pygame surface.
     """
     
-    def __init__(self, x, y, window, ui_manager, layer_num):
+    def __init__(self, x, y, window, ui_manager, layer_num, canvas_size):
         """! Initializes the layer widget.
 
         @param x                Horizontal position to draw the widget at on the ui.
         @param y                Vertical position to draw the widget at on the ui.
         @param window           Ui window to draw the widget to.
         @param ui_manager       Pygame_gui element manager to tie pygame_gui elements to.
+        @param layer_num        Name of the layer number shown in the ui, like "ONE".
+        @param canvas_size      Size of the canvas the layer is drawn to.
         """
 
-        ## The pygame surface the layer draws to.
-        self.layer = pg.Surface((3840, 2160), pg.SRCALPHA)
+        ## The drawn part of the layer, a sparse_layer that holds no pixels until the layer is drawn.
+        self.layer = sparse_layer(canvas_size)
         self.__x = x
         self.__y = y
         self.__window = window
@@ -67,9 +54,9 @@ class layer(widget):
 
         #starting options for dropdown menus
         ## The style or pattern the layer draws in
-        self.style = choice(_art_styles_list)
+        self.style = choice(generator_registry.get_styles())
         ## The shape the layer draws
-        self.shape = choice(_art_shapes_list)
+        self.shape = choice(generator_registry.get_shapes())
         ## The complexity of the layer's drawing
         self.complexity = randint(10,30)#15
         ## The size of the drawn shapes
@@ -89,6 +76,11 @@ class layer(widget):
         ## 1 if radomization of the transparency is locked, 0 otherwise
         self.transparency_lock = 0
 
+        ## Master seed the layer was last drawn from, kept by Generate while every lock is set
+        self.seed = None
+
+        self.__panel = render_node("layer_%s.panel" % layer_num.lower(), self.__draw_panel)
+
 
     def change_colors(self):
         """! Change the theme colors. """
@@ -99,44 +91,37 @@ class layer(widget):
     def draw_ui_dynamic(self):
         """! Draws the dynamic ui elements for the layer widget.
         
-        Draws the text and lock icons.
+        Draws the text and lock icons, from a panel that is only drawn again when the theme or a lock changes.
         """
 
-        interactables_margin = self.__x + 42
-        lock_margin = self.__x + 17
+        self.__panel.set_params((self.color, self.u1_h1_color, self.style_lock, self.shape_lock, self.complexity_lock,
+                                 self.size_lock, self.transparency_lock))
+        self.__window.blit(self.__panel.get(), (self.__x, self.__y))
 
-        # pg.draw.rect(self.__window, pg.Color("#2B2834"), (self.__x, self.__y, 252, 220))
-        pg.draw.rect(self.__window, pg.Color(self.color), (self.__x, self.__y, 252, 220))
-        
-        if self.style_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+30))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+30))
-
-        if self.shape_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+55))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+55))
-
-        if self.complexity_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+100))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+100))
-
-        if self.size_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+145))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+145))
-        
-        if self.transparency_lock == 0:
-            self.__window.blit(assets.lock_disabled, (lock_margin, self.__y+190))
-        else:
-            self.__window.blit(assets.lock_enabled, (lock_margin, self.__y+190))
 
-        assets.text_to_screen(window=self.__window, text="LAYER " + self.__layer_num + " STYLE", color=self.u1_h1_color, pos=(interactables_margin, self.__y+10), font_size=18)
-        assets.text_to_screen(window=self.__window, text="LAYER " + self.__layer_num + " COMPLEXITY", color=self.u1_h1_color, pos=(interactables_margin, self.__y+85), font_size=14)
-        assets.text_to_screen(window=self.__window, text="LAYER " + self.__layer_num + " SHAPE SIZE", color=self.u1_h1_color, pos=(interactables_margin, self.__y+130), font_size=14)
-        assets.text_to_screen(window=self.__window, text="LAYER " + self.__layer_num + " TRANSPARENCY", color=self.u1_h1_color, pos=(interactables_margin, self.__y+175), font_size=14)
+    def __draw_panel(self, key):
+        """! Draws the background, text and lock icons of the widget to a new panel surface.
+
+        @param key      The theme colors and locks the panel is drawn with, see draw_ui_dynamic.
+
+        @return The panel surface, drawn at the widget position.
+        """
+
+        panel = pg.Surface((252, 220))
+        interactables_margin = 42
+        lock_margin = 17
+
+        panel.fill(pg.Color(self.color))
+
+        locks = [self.style_lock, self.shape_lock, self.complexity_lock, self.size_lock, self.transparency_lock]
+        for lock, y in zip(locks, [30, 55, 100, 145, 190]):
+            panel.blit(assets.lock_enabled if lock else assets.lock_disabled, (lock_margin, y))
+
+        assets.text_to_screen(window=panel, text="LAYER " + self.__layer_num + " STYLE", color=self.u1_h1_color, pos=(interactables_margin, 10), font_size=18)
+        assets.text_to_screen(window=panel, text="LAYER " + self.__layer_num + " COMPLEXITY", color=self.u1_h1_color, pos=(interactables_margin, 85), font_size=14)
+        assets.text_to_screen(window=panel, text="LAYER " + self.__layer_num + " SHAPE SIZE", color=self.u1_h1_color, pos=(interactables_margin, 130), font_size=14)
+        assets.text_to_screen(window=panel, text="LAYER " + self.__layer_num + " TRANSPARENCY", color=self.u1_h1_color, pos=(interactables_margin, 175), font_size=14)
+        return panel
 
 
     def draw_ui_static(self):
@@ -149,12 +134,12 @@ class layer(widget):
         lock_margin = self.__x + 6
         num_of_layer = self.__layer_num.lower()
 
-        style_dropdown = pgui.elements.UIDropDownMenu(options_list=_art_styles_list,
+        style_dropdown = pgui.elements.UIDropDownMenu(options_list=generator_registry.get_styles(),
                                                                 starting_option=self.style,
                                                                 relative_rect=pg.Rect(interactables_margin, self.__y+30, 200, 22), manager=self.__ui_manager,
                                                                 object_id="layer_"+num_of_layer+"_style_dropdown")
 
-        shape_dropdown = pgui.elements.UIDropDownMenu(options_list=_art_shapes_list,
+        shape_dropdown = pgui.elements.UIDropDownMenu(options_list=generator_registry.get_shapes(),
                                                                 starting_option=self.shape,
                                                                 relative_rect=pg.Rect(interactables_margin, self.__y+55, 200, 22), manager=self.__ui_manager,
                                                                 object_id="layer_"+num_of_layer+"_shape_dropdown")
@@ -187,19 +172,28 @@ class layer(widget):
                                                 object_id="layer_"+num_of_layer+"_transparency_lock_button")
 
 
-    def randomize(self):
-        """! Randomize the shape, style, complexity, and size of the layer drawing algorithm. """
+    def randomize(self, rng):
+        """! Randomize the shape, style, complexity, and size of the layer drawing algorithm.
+
+        @param rng      The random.Random stream to randomize with.
+        """
 
-        if self.style_lock == 0:
-            self.style = choice(_art_styles_list)
-        if self.shape_lock == 0:
-            self.shape = choice(_art_shapes_list)
-        if self.complexity_lock == 0:
-            self.complexity = randint(10,30)
-        if self.size_lock == 0:
-            self.size[1] = randint(51, 400)
-        if self.transparency_lock == 0:
-            self.transparency = randint(0, 255)
+        self.set_settings(randomize.randomize_layer(rng, self.get_settings(), self.get_locks()))
+
+
+    def set_settings(self, settings):
+        """! Sets the layer settings, the seed included when settings has one.
+
+        @param settings     Layer settings as returned by get_settings.
+        """
+
+        self.style = settings["style"]
+        self.shape = settings["shape"]
+        self.complexity = settings["complexity"]
+        self.size = list(settings["size"])
+        self.transparency = settings["transparency"]
+        if "seed" in settings:
+            self.seed = settings["seed"]
 
 
     def events(self, event):
@@ -241,44 +235,22 @@ class layer(widget):
         return 0
 
 
-    def draw_canvas(self):
-        """! Draw the layer to self.layer based on the current widget settings. """
-
-        self.clean_layer()
-        self.layer.set_colorkey((0, 0, 0))
-
-        color_palette = widgets.color_palette.get_foreground_colors()
+    def draw_canvas(self, rng):
+        """! Draw the layer to self.layer based on the current widget settings.
 
-        if _art_shapes_list[0] == self.shape:
-            widgets.generators.draw_lines(self.layer, self.complexity, color_palette, self.style, self.size)
-
-        if _art_shapes_list[1] == self.shape:
-            widgets.generators.draw_circles(self.layer, self.complexity, color_palette, self.style, self.size)
-
-        if _art_shapes_list[2] == self.shape:
-            widgets.generators.draw_squares(self.layer, self.complexity, color_palette, self.style, self.size)
-
-        if _art_shapes_list[3] == self.shape:
-            widgets.generators.draw_hpolygons(self.layer, self.complexity, color_palette, self.style, self.size)
-
-        if _art_shapes_list[4] == self.shape:
-            widgets.generators.draw_fpolygons(self.layer, self.complexity, color_palette, self.style, self.size)
-
-        if _art_shapes_list[5] == self.shape:
-            widgets.generators.draw_dots(self.layer, self.complexity, color_palette, self.style, self.size)
-
-        if _art_shapes_list[6] == self.shape:
-            widgets.generators.draw_curves(self.layer, self.complexity, color_palette, self.style, self.size)
+        @param rng      The random.Random stream to draw with.
+        """
 
-        if _art_shapes_list[7] == self.shape:
-            widgets.generators.draw_rings(self.layer, self.complexity, color_palette, self.style, self.size)
+        with profiler.span("layer_%s.draw_canvas" % self.__layer_num.lower()):
+            color_palette = widgets.color_palette.get_foreground_colors()
 
-        self.layer.set_alpha(self.transparency)
+            self.layer = render.draw_trimmed(self.layer.size, lambda surface: render.draw_layer(
+                surface, self.get_settings(), color_palette, widgets.generators, rng))
 
 
     def clean_layer(self):
         """! Clean the layer by setting it to be blank and see-through. """
-        self.layer.fill((0, 0, 0, 0))
+        self.layer = sparse_layer(self.layer.size)
 
     def get_layer_style(self):
         """! @return The layer style. """
@@ -295,3 +267,20 @@ class layer(widget):
     def get_layer_transparency(self):
         """! @return The layer transparency"""
         return self.transparency
+    def is_locked(self):
+        """! @return True if randomization of every layer setting is locked. """
+        return (self.style_lock == 1 and self.shape_lock == 1 and self.complexity_lock == 1 and self.size_lock == 1
+                and self.transparency_lock == 1)
+    def get_locks(self):
+        """! @return The names of the locked layer settings, see randomize.layer_settings. """
+        return [name for name in randomize.layer_settings if getattr(self, name + "_lock") == 1]
+    def get_settings(self):
+        """! @return The layer settings as used by render.draw_layer, with the seed the layer was drawn from. """
+        return {
+            "style": self.style,
+            "shape": self.shape,
+            "complexity": self.complexity,
+            "size": list(self.size),
+            "transparency": self.transparency,
+            "seed": self.seed
+        }
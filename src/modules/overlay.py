@@ -15,18 +15,9 @@ from random import randint, choice
 from modules.widget import widget
 from widget_storage import widgets
 import assets
-
-_overlays = [
-    "assets/overlay1.png",
-    "assets/overlay2.png",
-    "assets/overlay3.png",
-    "assets/overlay4.png",
-    "assets/overlay5.png",
-    "assets/overlay6.png",
-    "assets/border7.png",
-    "assets/border8.png",
-    "assets/border9.png"
-]
+import render
+from render_graph import render_node
+from modules.sparse_layer import sparse_layer
 
 class overlay(widget):
     """! The overlay widget class.
@@ -34,17 +25,18 @@ class overlay(widget):
     Provides a ui and functionality to specify an overlay and draw to a pygame surface.
     """
     
-    def __init__(self, x, y, window, ui_manager):
+    def __init__(self, x, y, window, ui_manager, canvas_size):
         """! Initializes the overlay widget.
 
         @param x                Horizontal position to draw the widget at on the ui.
         @param y                Vertical position to draw the widget at on the ui.
         @param window           Ui window to draw the widget to.
         @param ui_manager       Pygame_gui element manager to tie pygame_gui elements to.
+        @param canvas_size      Size of the canvas the overlay is drawn to.
         """
 
-        ## The pygame surface the overlay draws to.
-        self.overlay_layer = pg.Surface((3840, 2160), pg.SRCALPHA)
+        ## The drawn part of the overlay, a sparse_layer that holds no pixels while no overlay is selected.
+        self.overlay_layer = sparse_layer(canvas_size)
         self.__x = x
         self.__y = y
         self.__window = window
@@ -61,41 +53,45 @@ class overlay(widget):
         self.__active_color = assets.active_color
         self.__inactive_color = assets.inactive_color
 
-        self.__overlays = [pg.image.load(o).convert_alpha() for o in _overlays]
+        # Only the small thumbnails are loaded up front, the full images are mapped when they are selected.
+        self.__thumbnails = [assets.load_overlay_thumbnail(i) for i in range(len(assets.overlay_paths))]
+
+        self.__panel = render_node("overlay.panel", self.__draw_panel)
 
 
     def draw_ui_dynamic(self):
         """! Draws the dynamic ui elements for the overlay widget.
         
-        Draws the text and overlay thumbnails.
+        Draws the text and overlay thumbnails, from a panel that is only drawn again when the theme or the selected
+        overlay changes.
         """
-        
-        pg.draw.rect(self.__window, pg.Color(self.color), (self.__x, self.__y, 252, 350))
-
-        assets.text_to_screen(window=self.__window, text="OVERLAY/BORDER", color=self.ui_h1_color, pos=(self.__x+15, self.__y+12), font_size=18)
-
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 1 else self.__inactive_color, (self.__x+13+20, self.__y+33, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 2 else self.__inactive_color, (self.__x+113+40, self.__y+33, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 3 else self.__inactive_color, (self.__x+13+20, self.__y+98, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 4 else self.__inactive_color, (self.__x+113+40, self.__y+98, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 5 else self.__inactive_color, (self.__x+13+20, self.__y+163, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 6 else self.__inactive_color, (self.__x+113+40, self.__y+163, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 7 else self.__inactive_color, (self.__x+13+20, self.__y+228, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 8 else self.__inactive_color, (self.__x+113+40, self.__y+228, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 9 else self.__inactive_color, (self.__x+13+20, self.__y+293, 84, 49), 1)
-        pg.draw.rect(self.__window, self.__active_color if self.active_overlay == 0 else self.__inactive_color, (self.__x+113+40, self.__y+293, 84, 49), 1)
-        #pg.draw.rect(self.__window, self.__active_color, (self.__x+63, self.__y+293, 84, 49), 1)
-
-        self.__window.blit(pg.transform.scale(self.__overlays[0], (80, 45)), (self.__x+15+20, self.__y+35))
-        self.__window.blit(pg.transform.scale(self.__overlays[1], (80, 45)), (self.__x+115+40, self.__y+35))
-        self.__window.blit(pg.transform.scale(self.__overlays[2], (80, 45)), (self.__x+15+20, self.__y+100))
-        self.__window.blit(pg.transform.scale(self.__overlays[3], (80, 45)), (self.__x+115+40, self.__y+100))
-        self.__window.blit(pg.transform.scale(self.__overlays[4], (80, 45)), (self.__x+15+20, self.__y+165))
-        self.__window.blit(pg.transform.scale(self.__overlays[5], (80, 45)), (self.__x+115+40, self.__y+165))
-        self.__window.blit(pg.transform.scale(self.__overlays[6], (80, 45)), (self.__x+15+20, self.__y+230))
-        self.__window.blit(pg.transform.scale(self.__overlays[7], (80, 45)), (self.__x+115+40, self.__y+230))
-        self.__window.blit(pg.transform.scale(self.__overlays[8], (80, 45)), (self.__x+15+20, self.__y+295))
 
+        self.__panel.set_params((self.color, self.ui_h1_color, self.active_overlay))
+        self.__window.blit(self.__panel.get(), (self.__x, self.__y))
+
+
+    def __draw_panel(self, key):
+        """! Draws the background, text, thumbnails and selection frames of the widget to a new panel surface.
+
+        @param key      The theme colors and selected overlay the panel is drawn with, see draw_ui_dynamic.
+
+        @return The panel surface, drawn at the widget position.
+        """
+
+        panel = pg.Surface((252, 350))
+        panel.fill(pg.Color(self.color))
+
+        assets.text_to_screen(window=panel, text="OVERLAY/BORDER", color=self.ui_h1_color, pos=(15, 12), font_size=18)
+
+        # Overlays 1 to 9 fill two columns row by row, the last cell is no overlay.
+        for i in range(len(self.__thumbnails) + 1):
+            x = 13+20 if i % 2 == 0 else 113+40
+            y = 33 + 65*(i//2)
+            overlay_number = i+1 if i < len(self.__thumbnails) else 0
+            pg.draw.rect(panel, self.__active_color if self.active_overlay == overlay_number else self.__inactive_color, (x, y, 84, 49), 1)
+            if i < len(self.__thumbnails):
+                panel.blit(self.__thumbnails[i], (x+2, y+2))
+        return panel
 
 
     def change_colors(self):
@@ -144,57 +140,50 @@ class overlay(widget):
         if event.user_type == pgui.UI_BUTTON_PRESSED:
             if event.ui_object_id == "overlay1_button":
                 self.active_overlay = 1
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "overlay2_button":
                 self.active_overlay = 2
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "overlay3_button":
                 self.active_overlay = 3
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "overlay4_button":
                 self.active_overlay = 4
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "overlay5_button":
                 self.active_overlay = 5
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "overlay6_button":
                 self.active_overlay = 6
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "border7_button":
                 self.active_overlay = 7
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "border8_button":
                 self.active_overlay = 8
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "border9_button":
                 self.active_overlay = 9
-                self.draw_canvas()
                 r = 1
             if event.ui_object_id == "no_overlay_button":
                 self.active_overlay = 0
-                self.clean_layer()
                 r = 1
 
         return r
 
 
     def draw_canvas(self):
-        """! Draw the currently selected overlay image to self.overlay_layer. """
-        self.clean_layer()
-        self.overlay_layer.blit(self.__overlays[self.active_overlay-1], (0, 0))
+        """! Draw the currently selected overlay image to self.overlay_layer, or clear it when no overlay is selected. """
+        if self.active_overlay == 0:
+            self.clean_layer()
+            return
+        self.overlay_layer = render.draw_trimmed(self.overlay_layer.size, lambda surface: render.draw_overlay(
+            surface, assets.load_overlay(self.active_overlay-1)))
 
 
     def clean_layer(self):
         """! Clean the overlay by setting it to be blank and see-through. """
-        self.overlay_layer.fill((0, 0, 0, 0))
+        self.overlay_layer = sparse_layer(self.overlay_layer.size)
     
     def get_active_overlay(self):
         """! @return The active overlay. """
@@ -0,0 +1,213 @@
+##
+# @file primitives.py
+#
+# @brief Defines the draw targets the generators draw their primitives to.
+
+# Imports
+import pygame as pg
+
+from modules.curves import draw_curves
+from modules.stamp_cache import stamp_batch
+
+class surface_target:
+    """! Draw target that draws primitives straight to a pygame surface.
+
+    Draw targets take coordinates and lengths in the generators reference space and scale them to the canvas.
+    """
+
+    def __init__(self, surface, generator):
+        """! Initializes the surface target.
+
+        @param surface      The surface to draw to.
+        @param generator    The generators utility that scales reference space to the surface.
+        """
+        ## The surface primitives are drawn to.
+        self.surface = surface
+        self.__generator = generator
+        self.__stamps = stamp_batch(surface, generator.stamps)
+        self.__curves = []
+
+
+    def circle(self, color, center, rad, width=0):
+        """! Draws a circle, width 0 fills it. """
+        g = self.__generator
+        pg.draw.circle(self.surface, color, g.scale_point(center), g.scale_length(rad), g.scale_length(width))
+
+
+    def rect(self, color, rect):
+        """! Fills a rectangle. """
+        pg.draw.rect(self.surface, color, self.__generator.scale_rect(rect))
+
+
+    def line(self, color, start, end, width):
+        """! Draws a line. """
+        g = self.__generator
+        pg.draw.line(self.surface, color, g.scale_point(start), g.scale_point(end), g.scale_length(width))
+
+
+    def polygon(self, color, points, width):
+        """! Draws a polygon, width 0 fills it. """
+        g = self.__generator
+        pg.draw.polygon(self.surface, color, [g.scale_point(p) for p in points], g.scale_length(width))
+
+
+    def curve(self, color, points, last_points, steps):
+        """! Queues a thick bezier curve, stroked between the curves through points and last_points. """
+        g = self.__generator
+        self.__curves.append((color, [g.scale_point(p) for p in points], [g.scale_point(p) for p in last_points], steps))
+
+
+    def stamp(self, rad, color, width, alpha, center):
+        """! Queues a translucent circle or ring from the stamp cache, see stamp_batch.add. """
+        g = self.__generator
+        self.__stamps.add(g.scale_length(rad), color, g.scale_length(width), alpha, g.scale_point(center))
+
+
+    def flush(self):
+        """! Draws the queued stamps and curves, the curves are evaluated in one batch. """
+        self.__stamps.flush()
+        if self.__curves:
+            draw_curves(self.surface, self.__curves)
+        self.__curves = []
+
+
+class primitive_recorder:
+    """! Draw target that records primitives with their canvas bounding boxes instead of drawing them.
+
+    A recorded layer can be replayed to any part of the canvas, like a single tile, by translating every primitive.
+    """
+
+    def __init__(self, generator):
+        """! Initializes an empty recording.
+
+        @param generator    The generators utility that scales reference space to the canvas.
+        """
+        ## Recorded primitives in draw order, (kind, bounding pg.Rect, arguments) tuples in canvas pixels.
+        self.primitives = []
+        self.__generator = generator
+
+
+    def circle(self, color, center, rad, width=0):
+        """! Records a circle, width 0 fills it. """
+        g = self.__generator
+        center, rad, width = g.scale_point(center), g.scale_length(rad), g.scale_length(width)
+        bounds = pg.Rect(center[0] - rad, center[1] - rad, rad*2 + 1, rad*2 + 1)
+        self.primitives.append(("circle", bounds, (pg.Color(color), center, rad, width)))
+
+
+    def rect(self, color, rect):
+        """! Records a filled rectangle. """
+        rect = pg.Rect(self.__generator.scale_rect(rect))
+        self.primitives.append(("rect", rect, (pg.Color(color), rect)))
+
+
+    def line(self, color, start, end, width):
+        """! Records a line. """
+        g = self.__generator
+        start, end, width = g.scale_point(start), g.scale_point(end), g.scale_length(width)
+        bounds = _point_bounds((start, end)).inflate(width*2 + 2, width*2 + 2)
+        self.primitives.append(("line", bounds, (pg.Color(color), start, end, width)))
+
+
+    def polygon(self, color, points, width):
+        """! Records a polygon, width 0 fills it. """
+        g = self.__generator
+        points, width = [g.scale_point(p) for p in points], g.scale_length(width)
+        bounds = _point_bounds(points).inflate(width*2 + 2, width*2 + 2)
+        self.primitives.append(("polygon", bounds, (pg.Color(color), points, width)))
+
+
+    def curve(self, color, points, last_points, steps):
+        """! Records a thick bezier curve, it never leaves the bounding box of its control points. """
+        g = self.__generator
+        points, last_points = [g.scale_point(p) for p in points], [g.scale_point(p) for p in last_points]
+        bounds = _point_bounds(points + last_points).inflate(2, 2)
+        self.primitives.append(("curve", bounds, (pg.Color(color), points, last_points, steps)))
+
+
+    def stamp(self, rad, color, width, alpha, center):
+        """! Records a translucent circle or ring drawn from the stamp cache. """
+        g = self.__generator
+        rad, width, center = g.scale_length(rad), g.scale_length(width), g.scale_point(center)
+        bounds = pg.Rect(center[0] - rad, center[1] - rad, rad*2, rad*2)
+        self.primitives.append(("stamp", bounds, (g.stamps, rad, color, width, alpha)))
+
+
+    def flush(self):
+        """! Nothing is queued, stamps are recorded as they are drawn. """
+        pass
+
+
+    def bin(self, tile_size, canvas_size):
+        """! Sorts the recorded primitives into the square tiles their bounding boxes touch.
+
+        Primitives entirely off the canvas are dropped.
+
+        @param tile_size    Width and height of a tile.
+        @param canvas_size  Size of the canvas the tiles cover.
+
+        @return A dict from (column, row) to the list of primitives touching that tile, in draw order.
+        """
+        canvas = pg.Rect((0, 0), canvas_size)
+        bins = {}
+        for primitive in self.primitives:
+            bounds = primitive[1].clip(canvas)
+            if bounds.width == 0 or bounds.height == 0:
+                continue
+            for row in range(bounds.top // tile_size, (bounds.bottom - 1) // tile_size + 1):
+                for column in range(bounds.left // tile_size, (bounds.right - 1) // tile_size + 1):
+                    bins.setdefault((column, row), []).append(primitive)
+        return bins
+
+
+def _point_bounds(points):
+    """! @return The pg.Rect covering every pixel of a list of points. """
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return pg.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+
+
+def replay(surface, primitives, offset):
+    """! Draws recorded primitives to a surface covering part of the canvas.
+
+    @param surface      The surface to draw to.
+    @param primitives   Recorded primitives, see primitive_recorder.
+    @param offset       Canvas position of the surface's top left corner.
+    """
+    ox, oy = offset
+    stamps = []
+    curves = []
+    for kind, bounds, args in primitives:
+        # Consecutive stamps go through one Surface.blits call and consecutive curves are evaluated in one batch.
+        if kind == "stamp":
+            cache, rad, color, width, alpha = args
+            stamps.append((cache.get(rad, color, width, alpha), (bounds.x - ox, bounds.y - oy)))
+            continue
+        if kind == "curve":
+            color, points, last_points, steps = args
+            curves.append((color, [(x - ox, y - oy) for x, y in points], [(x - ox, y - oy) for x, y in last_points], steps))
+            continue
+        if stamps:
+            surface.blits(stamps, doreturn=False)
+            stamps = []
+        if curves:
+            draw_curves(surface, curves)
+            curves = []
+
+        if kind == "circle":
+            color, center, rad, width = args
+            pg.draw.circle(surface, color, (center[0] - ox, center[1] - oy), rad, width)
+        elif kind == "rect":
+            color, rect = args
+            pg.draw.rect(surface, color, rect.move(-ox, -oy))
+        elif kind == "line":
+            color, start, end, width = args
+            pg.draw.line(surface, color, (start[0] - ox, start[1] - oy), (end[0] - ox, end[1] - oy), width)
+        elif kind == "polygon":
+            color, points, width = args
+            pg.draw.polygon(surface, color, [(x - ox, y - oy) for x, y in points], width)
+
+    if stamps:
+        surface.blits(stamps, doreturn=False)
+    if curves:
+        draw_curves(surface, curves)
@@ -0,0 +1,72 @@
+##
+# @file sparse_layer.py
+#
+# @brief Defines the sparse_layer class, a canvas layer that only stores the parts that were drawn on.
+
+# Imports
+import pygame as pg
+
+## Width and height of the tiles a layer is split into when it is trimmed.
+default_tile_size = 256
+
+class sparse_layer:
+    """! A canvas sized layer stored as the drawn parts of its tiles.
+
+    Styles like Cornered or Centered, and short text, leave most of a layer transparent. A trimmed layer keeps one
+    piece per tile something was drawn on, each cut down to the bounding box of what was drawn in the tile, so empty
+    areas cost nothing wherever they are. An empty layer stores no pixels at all.
+    """
+
+    def __init__(self, size, pieces=()):
+        """! Initializes the sparse layer.
+
+        @param size     Size of the canvas the layer covers.
+        @param pieces   The drawn parts of the layer, as (surface, position on the canvas) pairs.
+        """
+        ## Size of the canvas the layer covers.
+        self.size = tuple(size)
+        ## The drawn parts of the layer, as (surface, position on the canvas) pairs that don't overlap.
+        self.pieces = list(pieces)
+
+
+    @staticmethod
+    def trim(surface, tile_size=default_tile_size):
+        """! Copies the drawn parts of a full canvas layer.
+
+        Pixels that are fully transparent or match the colorkey are left out. The pieces keep the colorkey and surface
+        alpha, so they composite exactly like the full layer.
+
+        @param surface      The full canvas layer.
+        @param tile_size    Width and height of the tiles the layer is split into.
+
+        @return A new sparse_layer, the surface can be reused afterwards.
+        """
+        bounds = surface.get_bounding_rect()
+        colorkey = surface.get_colorkey()
+        alpha = surface.get_alpha()
+
+        pieces = []
+        for y in range(bounds.top - bounds.top % tile_size, bounds.bottom, tile_size):
+            for x in range(bounds.left - bounds.left % tile_size, bounds.right, tile_size):
+                tile = pg.Rect(x, y, tile_size, tile_size).clip(bounds)
+                drawn = surface.subsurface(tile).get_bounding_rect().move(tile.topleft)
+                if drawn.width == 0 or drawn.height == 0:
+                    continue
+                piece = surface.subsurface(drawn).copy()
+                piece.set_colorkey(colorkey)
+                piece.set_alpha(alpha)
+                pieces.append((piece, drawn.topleft))
+        return sparse_layer(surface.get_size(), pieces)
+
+
+    def get_rect(self):
+        """! @return The canvas area holding every drawn part, an empty rect for an empty layer. """
+        if not self.pieces:
+            return pg.Rect(0, 0, 0, 0)
+        return pg.Rect(self.pieces[0][1], self.pieces[0][0].get_size()).unionall(
+            [pg.Rect(position, piece.get_size()) for piece, position in self.pieces[1:]])
+
+
+    def get_bytes(self):
+        """! @return Memory used by the layer's pixels. """
+        return sum(piece.get_height() * piece.get_pitch() for piece, _ in self.pieces)
@@ -0,0 +1,131 @@
+##
+# @file stamp_cache.py
+#
+# @brief Defines the stamp_cache and stamp_batch classes used to draw translucent circles and rings.
+
+# Imports
+from collections import OrderedDict
+import threading
+
+import pygame as pg
+
+## Default memory cap of a stamp_cache, in bytes.
+default_max_bytes = 64*1024*1024
+
+class stamp_cache:
+    """! Least recently used cache of pre-rendered circle and ring stamps.
+
+    A stamp is a colorkeyed surface holding one circle or ring at one alpha. Surface alpha is state on the surface,
+    so the alpha is part of the key alongside the radius, color and ring width.
+    """
+
+    def __init__(self, max_bytes=default_max_bytes):
+        """! Initializes the stamp cache.
+
+        @param max_bytes    Memory cap for the cached stamp pixels, least recently used stamps are evicted past it.
+        """
+        ## Memory cap for the cached stamp pixels.
+        self.max_bytes = max_bytes
+        self.__stamps = OrderedDict()
+        self.__bytes = 0
+        # Tiles replaying recorded stamps share the cache between threads.
+        self.__lock = threading.Lock()
+
+
+    def get(self, rad, color, width, alpha):
+        """! Gets a stamp, rendering and caching it if needed.
+
+        @param rad      Radius of the circle.
+        @param color    Color of the circle.
+        @param width    Ring width, 0 for a filled circle.
+        @param alpha    Surface alpha of the stamp.
+
+        @return The stamp surface, the circle is centered at (rad, rad).
+        """
+        with self.__lock:
+            return self.__get((rad, color, width, alpha))
+
+
+    def __get(self, key):
+        """! Gets a stamp by key, see get. """
+        rad, color, width, alpha = key
+        stamp = self.__stamps.get(key)
+        if stamp is not None:
+            self.__stamps.move_to_end(key)
+            return stamp
+
+        stamp = pg.Surface((rad*2, rad*2))
+        stamp.fill((0, 0, 0))
+        pg.draw.circle(stamp, pg.Color(color), (rad, rad), rad, width)
+        stamp.set_colorkey((0, 0, 0))
+        stamp.set_alpha(alpha)
+
+        size = stamp_bytes(stamp)
+        if size <= self.max_bytes:
+            while self.__bytes + size > self.max_bytes:
+                self.__bytes -= stamp_bytes(self.__stamps.popitem(last=False)[1])
+            self.__stamps[key] = stamp
+            self.__bytes += size
+
+        return stamp
+
+
+    def clear(self):
+        """! Drops every cached stamp. """
+        with self.__lock:
+            self.__stamps.clear()
+            self.__bytes = 0
+
+
+    def get_bytes(self):
+        """! @return The memory used by the cached stamp pixels. """
+        return self.__bytes
+
+
+class stamp_batch:
+    """! Collects stamp blits for one layer and submits them together through Surface.blits.
+
+    Blits keep the order they were added in, so overlapping shapes draw the same as blitting them one at a time.
+    """
+
+    def __init__(self, layer, cache):
+        """! Initializes the stamp batch.
+
+        @param layer    The layer the stamps are blitted to.
+        @param cache    The stamp_cache to take stamps from.
+        """
+        self.__layer = layer
+        self.__cache = cache
+        self.__pending = []
+        self.__pending_bytes = 0
+
+
+    def add(self, rad, color, width, alpha, center):
+        """! Queues a circle or ring.
+
+        @param rad      Radius of the circle.
+        @param color    Color of the circle.
+        @param width    Ring width, 0 for a filled circle.
+        @param alpha    Alpha of the circle.
+        @param center   Center of the circle on the layer.
+        """
+        stamp = self.__cache.get(rad, color, width, alpha)
+        self.__pending.append((stamp, (center[0]-rad, center[1]-rad)))
+
+        # Queued stamps stay alive even once evicted, flush early so they can't pile up past the cache's memory cap.
+        self.__pending_bytes += stamp_bytes(stamp)
+        if self.__pending_bytes > self.__cache.max_bytes:
+            self.flush()
+
+
+    def flush(self):
+        """! Blits every queued stamp to the layer. """
+        if self.__pending:
+            self.__layer.blits(self.__pending, doreturn=False)
+        self.__pending = []
+        self.__pending_bytes = 0
+
+
+def stamp_bytes(stamp):
+    """! @return The memory used by a stamp's pixels. """
+    return stamp.get_width() * stamp.get_height() * stamp.get_bytesize()
@@ -0,0 +1,87 @@
+##
+# @file surface_pool.py
+#
+# @brief Defines the surface_pool class which lends out reusable scratch surfaces.
+
+# Imports
+import threading
+
+import pygame as pg
+
+## Default memory cap of the surfaces a surface_pool keeps, two 4K SRCALPHA layers.
+default_max_bytes = 2*3840*2160*4
+
+class surface_pool:
+    """! Pool of scratch surfaces, so layers are drawn into reused memory instead of a new full canvas each time.
+
+    Surfaces are lent out with acquire and given back with release. A released surface is kept for the next acquire of
+    the same size and flags while the pool is under its memory cap, and freed otherwise.
+    """
+
+    def __init__(self, max_bytes=default_max_bytes):
+        """! Initializes an empty surface pool.
+
+        @param max_bytes    Memory cap for the pixels of the surfaces kept between uses.
+        """
+        ## Memory cap for the pixels of the surfaces kept between uses.
+        self.max_bytes = max_bytes
+        self.__free = {}
+        self.__bytes = 0
+        # The ui and the render worker thread draw from the same pool.
+        self.__lock = threading.Lock()
+
+
+    def acquire(self, size, flags=pg.SRCALPHA):
+        """! Borrows a cleared surface.
+
+        @param size     Size of the surface.
+        @param flags    pg.SRCALPHA for a surface with per pixel alpha, 0 for one without.
+
+        @return A surface filled with transparent black, without a colorkey and with an opaque surface alpha.
+        """
+        key = (tuple(size), flags & pg.SRCALPHA)
+        with self.__lock:
+            free = self.__free.get(key)
+            surface = free.pop() if free else None
+            if surface is not None:
+                self.__bytes -= _surface_bytes(surface)
+
+        if surface is None:
+            return pg.Surface(size, flags)
+        surface.set_colorkey(None)
+        # set_alpha(None) would also turn off per pixel alpha blending of a SRCALPHA surface.
+        surface.set_alpha(255)
+        surface.fill((0, 0, 0, 0))
+        return surface
+
+
+    def release(self, surface):
+        """! Gives a borrowed surface back, it must not be used afterwards.
+
+        @param surface  The surface from acquire.
+        """
+        with self.__lock:
+            if self.__bytes + _surface_bytes(surface) <= self.max_bytes:
+                self.__free.setdefault((surface.get_size(), surface.get_flags() & pg.SRCALPHA), []).append(surface)
+                self.__bytes += _surface_bytes(surface)
+
+
+    def clear(self):
+        """! Frees every surface kept by the pool. """
+        with self.__lock:
+            self.__free.clear()
+            self.__bytes = 0
+
+
+    def get_bytes(self):
+        """! @return Memory used by the pixels of the surfaces kept by the pool. """
+        return self.__bytes
+
+
+def _surface_bytes(surface):
+    """! @return Memory used by a surface's pixels. """
+    return surface.get_height() * surface.get_pitch()
+
+
+## Pool shared by the canvas and the headless renderer.
+shared_pool = surface_pool()
@@ -14,6 +14,10 @@ from random import randint, choice
 from modules.widget import widget
 from widget_storage import widgets
 import assets
+import profiler
+import render
+from render_graph import render_node
+from modules.sparse_layer import sparse_layer
 
 _fonts = [
     "Basic",
@@ -31,17 +35,18 @@ class text_overlay(widget):
     Provides a ui and functionality to specify text to be drawn to a pygame surface.
     """
     
-    def __init__(self, x, y, window, ui_manager):
+    def __init__(self, x, y, window, ui_manager, canvas_size):
         """! Initializes the text overlay widget.
 
         @param x                Horizontal position to draw the widget at on the ui.
         @param y                Vertical position to draw the widget at on the ui.
         @param window           Ui window to draw the widget to.
         @param ui_manager       Pygame_gui element manager to tie pygame_gui elements to.
+        @param canvas_size      Size of the canvas the text is drawn to.
         """
 
-        ## The pygame surface the text overlay draws to.
-        self.layer = pg.Surface((3840, 2160), pg.SRCALPHA)
+        ## The drawn part of the text overlay, a sparse_layer that holds no pixels until text is drawn.
+        self.layer = sparse_layer(canvas_size)
         self.__x = x
         self.__y = y
         self.__window = window
@@ -59,29 +64,45 @@ class text_overlay(widget):
         self.font = choice(_fonts)
         ## The size of the text
         self.size = randint(75, 600)
-        ## The x and y position of the text on the canvas
-        self.pos = [randint(0,3840), randint(0, 2160)]
+        ## The x and y position of the text on the canvas, in the generators reference space
+        self.pos = [randint(0, widgets.generators.width), randint(0, widgets.generators.height)]
         ## The color to draw the text with
         self.color = choice(widgets.color_palette.get_foreground_colors())
         ## The text to draw
         self.text = ""
 
+        self.__panel = render_node("text_overlay.panel", self.__draw_panel)
+
 
     def draw_ui_dynamic(self):
         """! Draws the dynamic ui elements for the text overlay widget.
         
-        Draws the text.
+        Draws the text, from a panel that is only drawn again when the theme changes.
         """
 
-        interactables_margin = self.__x + 42
-        lock_margin = self.__x + 30
+        self.__panel.set_params((self.bg_color, self.ui_h1_color, self.ui_color))
+        self.__window.blit(self.__panel.get(), (self.__x, self.__y))
+
+
+    def __draw_panel(self, key):
+        """! Draws the background and text of the widget to a new panel surface.
+
+        @param key      The theme colors the panel is drawn with, see draw_ui_dynamic.
+
+        @return The panel surface, drawn at the widget position.
+        """
+
+        panel = pg.Surface((252, 190))
+        interactables_margin = 42
+        lock_margin = 30
 
-        pg.draw.rect(self.__window, pg.Color(self.bg_color), (self.__x, self.__y, 252, 190))
+        panel.fill(pg.Color(self.bg_color))
 
-        assets.text_to_screen(window=self.__window, text="TEXT OVERLAY", color=self.ui_h1_color, pos=(interactables_margin, self.__y+15), font_size=18)
-        assets.text_to_screen(window=self.__window, text="TEXT SIZE", color=self.ui_color, pos=(interactables_margin, self.__y+60), font_size=14)
-        assets.text_to_screen(window=self.__window, text="X", color=self.ui_color, pos=(lock_margin, self.__y+105), font_size=14)
-        assets.text_to_screen(window=self.__window, text="Y", color=self.ui_color, pos=(lock_margin, self.__y+130), font_size=14)
+        assets.text_to_screen(window=panel, text="TEXT OVERLAY", color=self.ui_h1_color, pos=(interactables_margin, 15), font_size=18)
+        assets.text_to_screen(window=panel, text="TEXT SIZE", color=self.ui_color, pos=(interactables_margin, 60), font_size=14)
+        assets.text_to_screen(window=panel, text="X", color=self.ui_color, pos=(lock_margin, 105), font_size=14)
+        assets.text_to_screen(window=panel, text="Y", color=self.ui_color, pos=(lock_margin, 130), font_size=14)
+        return panel
 
     def change_colors(self):
         """! Change the theme colors. """
@@ -109,11 +130,11 @@ class text_overlay(widget):
 
         x_slider = pgui.elements.UIHorizontalSlider(relative_rect=pg.Rect(interactables_margin, self.__y+100, 200, 22),
                                                                     start_value=self.pos[0],
-                                                                    value_range=(0,3840), manager=self.__ui_manager,
+                                                                    value_range=(0, widgets.generators.width), manager=self.__ui_manager,
                                                                     object_id="x_slider")
 
         y_slider = pgui.elements.UIHorizontalSlider(relative_rect=pg.Rect(interactables_margin, self.__y+125, 200, 22),
-                                                                start_value=self.pos[1], value_range=(0, 2160),
+                                                                start_value=self.pos[1], value_range=(0, widgets.generators.height),
                                                                 manager=self.__ui_manager, object_id="y_slider")
 
         text_entry = pgui.elements.UITextEntryLine(relative_rect=pg.Rect(interactables_margin, self.__y+150, 200, 30), manager=self.__ui_manager,
@@ -133,21 +154,17 @@ class text_overlay(widget):
         if event.user_type == pgui.UI_DROP_DOWN_MENU_CHANGED:
             if event.ui_object_id == "font_dropdown":
                 self.font = event.text
-                self.text_to_canvas()
                 r = 1
 
         if event.user_type == pgui.UI_HORIZONTAL_SLIDER_MOVED:
             if event.ui_object_id == "size_slider":
                 self.size = event.value
-                self.text_to_canvas()
                 r = 1
             if event.ui_object_id == "x_slider":
                 self.pos[0] = event.value
-                self.text_to_canvas()
                 r = 1
             if event.ui_object_id == "y_slider":
                 self.pos[1] = event.value
-                self.text_to_canvas()
                 r = 1
 
         if event.user_type == pgui.UI_TEXT_ENTRY_CHANGED:
@@ -156,27 +173,36 @@ class text_overlay(widget):
 
         if event.user_type == pgui.UI_TEXT_ENTRY_FINISHED:
             if event.ui_object_id == "text_entry":
-                self.draw_canvas()
                 r = 1
 
         return r
 
 
-    def draw_canvas(self):
-        """! Randomizes the text color and draws text to self.layer based on the current widget settings. """
+    def randomize_color(self, rng):
+        """! Randomizes the text color, the canvas draws the text again when it is next drawn.
 
-        self.color = choice(widgets.color_palette.get_foreground_colors())
-        self.text_to_canvas()
+        @param rng      The random.Random stream to pick the color with.
+        """
+
+        self.color = rng.choice(widgets.color_palette.get_foreground_colors())
 
 
     def text_to_canvas(self):
         """! Draws text to self.layer based on the current widget settings. """
-        self.clean_layer()
-        
-        font_used = pg.freetype.Font("fonts/" + self.font + ".ttf", self.size)
-        font_used.render_to(self.layer, self.pos, self.text, self.color)
+        with profiler.span("text_overlay.text_to_canvas"):
+            self.layer = render.text_layer(self.get_settings(), widgets.generators)
 
 
     def clean_layer(self):
         """! Clean the layer by setting it to be blank and see-through. """
-        self.layer.fill((0, 0, 0, 0))
+        self.layer = sparse_layer(self.layer.size)
+
+    def get_settings(self):
+        """! @return The text settings as used by render.draw_text. """
+        return {
+            "text": self.text,
+            "font": self.font,
+            "size": self.size,
+            "pos": list(self.pos),
+            "color": self.color
+        }
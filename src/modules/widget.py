@@ -50,13 +50,19 @@ class widget(ABC):
         pass
 
 
-    def randomize(self):
-        """! Randomize the widget settings. """
+    def randomize(self, rng):
+        """! Randomize the widget settings.
+
+        @param rng      The random.Random stream to randomize with.
+        """
         pass
 
 
-    def draw_canvas(self):
-        """! Draw to the canvas. """
+    def draw_canvas(self, rng):
+        """! Draw to the canvas.
+
+        @param rng      The random.Random stream to draw with.
+        """
         pass
 
 
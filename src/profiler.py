@@ -0,0 +1,198 @@
+##
+# @file profiler.py
+#
+# @brief Timing spans around the render and frame phases, shown in an on-screen HUD and saved as a Chrome trace.
+#
+# Profiling is switched on from the environment, so sessions can be profiled without changing the code:
+# - AAG_PROFILE=1 records spans and shows the HUD, F3 hides and shows it.
+# - AAG_PROFILE_TRACE=path records spans and saves them to path when the program exits. The file opens in
+#   chrome://tracing or https://ui.perfetto.dev.
+#
+# When AAG_PROFILE is unset or 0 and AAG_PROFILE_TRACE is unset, span returns a shared no-op context and nothing is
+# recorded.
+
+# Imports
+import atexit
+from collections import deque
+import json
+import os
+import threading
+import time
+
+import pygame as pg
+
+import assets
+
+## Path the Chrome trace is saved to at exit, None to not save one.
+trace_path = os.environ.get("AAG_PROFILE_TRACE") or None
+## True if spans are recorded.
+enabled = os.environ.get("AAG_PROFILE", "") not in ("", "0") or trace_path is not None
+## True if the HUD is drawn, F3 toggles it.
+hud_visible = os.environ.get("AAG_PROFILE", "") not in ("", "0")
+
+## Most events kept for the trace, the oldest are dropped first so long sessions don't grow without bound.
+max_events = 1000000
+## Number of frames the HUD averages the frame time over.
+hud_frames = 60
+## Categories the HUD lists the last span durations of, in order, with their headings.
+hud_categories = [("frame", "FRAME"), ("render", "LAST RENDER")]
+## Top left of the HUD on the window.
+hud_pos = (10, 10)
+
+_start_ns = time.perf_counter_ns()
+_events = deque(maxlen=max_events)
+_thread_names = {}
+_last = {}
+_frame_times = deque(maxlen=hud_frames)
+_lock = threading.Lock()
+
+
+class _span:
+    """! Context manager that records the time between entering and leaving it as a trace event. """
+
+    __slots__ = ("name", "category", "args", "start")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        thread = threading.current_thread()
+        event = {"name": self.name, "cat": self.category, "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+                 "ts": (self.start - _start_ns) / 1000, "dur": (end - self.start) / 1000}
+        if self.args:
+            event["args"] = self.args
+        with _lock:
+            _events.append(event)
+            _thread_names.setdefault(thread.ident, thread.name)
+            _last.setdefault(self.category, {})[self.name] = (end - self.start) / 1e6
+            if self.name == "frame":
+                _frame_times.append((end - self.start) / 1e6)
+        return False
+
+
+class _null_span:
+    """! Context manager that does nothing, used while profiling is off. """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        return False
+
+
+_null = _null_span()
+
+
+def span(name, category="render", **args):
+    """! Times a block of code.
+
+    Used as a context manager, `with profiler.span("canvas.draw_layers"):`. Spans can nest and can be used from any
+    thread.
+
+    @param name         Name of the span, shown in the HUD and the trace.
+    @param category     Category of the span, "frame" for main loop phases and "render" for drawing.
+    @param args         Extra values saved with the trace event.
+
+    @return The context manager.
+    """
+    if not enabled:
+        return _null
+    return _span(name, category, args)
+
+
+def get_trace():
+    """! @return The recorded spans as a Chrome trace event format dict. """
+    with _lock:
+        events = list(_events)
+        names = dict(_thread_names)
+    pid = os.getpid()
+    metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in names.items()]
+    return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+
+def save_trace(path):
+    """! Saves the recorded spans as a Chrome trace JSON file.
+
+    @param path     Path of the JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(get_trace(), file)
+
+
+def toggle_hud(event):
+    """! Shows or hides the HUD when F3 is pressed, while profiling is on.
+
+    @param event    A pygame event.
+
+    @return True if the event toggled the HUD.
+    """
+    global hud_visible
+    if enabled and event.type == pg.KEYDOWN and event.key == pg.K_F3:
+        hud_visible = not hud_visible
+        return True
+    return False
+
+
+def render_hud():
+    """! Renders the HUD panel, the frame time and the last duration of every frame phase and render span.
+
+    @return The panel surface, or None while the HUD isn't shown.
+    """
+    if not (enabled and hud_visible):
+        return None
+
+    with _lock:
+        frame_times = list(_frame_times)
+        last = {category: dict(spans) for category, spans in _last.items()}
+
+    lines = []
+    if frame_times:
+        average = sum(frame_times) / len(frame_times)
+        lines.append("FRAME %.1f MS  AVG %.1f MS  %.0f FPS" % (frame_times[-1], average, 1000 / average if average else 0))
+    for category, heading in hud_categories:
+        spans = last.get(category)
+        if spans:
+            lines.append(heading)
+            lines.extend("  %s %.1f MS" % (name, ms) for name, ms in spans.items() if name != "frame")
+
+    line_height = assets.xs_font.get_sized_height() + 2
+    width = max((assets.xs_font.get_rect(line).width for line in lines), default=0) + 12
+    panel = pg.Surface((width, line_height * len(lines) + 8), pg.SRCALPHA)
+    panel.fill((0, 0, 0, 180))
+    for i, line in enumerate(lines):
+        assets.xs_font.render_to(panel, (6, 4 + i * line_height), line, (250, 250, 250))
+    return panel
+
+
+def draw_hud(window, pos=hud_pos, panel=None):
+    """! Draws the HUD, see render_hud.
+
+    @param window   Ui window to draw to.
+    @param pos      Top left of the HUD.
+    @param panel    The panel from render_hud, rendered here if None.
+
+    @return The window area drawn to, None while the HUD isn't shown.
+    """
+    if panel is None:
+        panel = render_hud()
+    if panel is None:
+        return None
+    return window.blit(panel, pos)
+
+
+if trace_path is not None:
+    atexit.register(save_trace, trace_path)
@@ -0,0 +1,242 @@
+##
+# @file randomize.py
+#
+# @brief Picks random art settings the way the Generate Randomly button does, without the ui.
+#
+# The palette and layer widgets randomize through these functions, and so do the batch generator and the gallery, so
+# they pick settings the same way from the same seed streams. Given the same starting settings, the same seed and locks
+# give the same art. The batch starts from fixed settings rather than the widgets', so its backgrounds can differ from
+# the app's for the same seed, see random_recipe.
+
+# Imports
+from modules import generator_registry
+import render
+
+## Color palettes by name, each a list of hex colors.
+palettes = {
+    "Forest" : ["#323232", "#295f4e", "#6db193", "#f4e5c2"],
+    "Futuristic" : ["#222831", "#393e46", "#00adb5", "#eeeeee"],
+    "Sunset" : ["#f9ed69", "#f08a5d", "#b83b5e", "#6a2c70"],
+    "Vintage" : ["#f85f73", "#fbe8d3", "#928a97", "#283c63"],
+    "Crimson" : ["#0f1021", "#d01257", "#fb90b7", "#ffcee4"],
+    "Vampire" : ["#34374c", "#2c2e3e", "#ee2b47", "#f6f6f6"],
+    "Lightning" : ["#f3f3f3", "#ffdd67", "#ffcd38", "#4a4a4a"],
+    "Pastel" : ["#8fcfd1", "#df5e88", "#f6ab6c", "#f6efa6"],
+    "Lava" : ["#2f2519", "#4a3f35", "#fa7d09", "#ff4301"],
+    "Neon" : ["#0c093c", "#df42d1", "#eea5f6", "#fad6d6"],
+    "Lilac" : ["#f0e3ff", "#d89cf6", "#916dd5", "#3e206d"],
+    "Soft Gray" : ["#3c4245", "#5f6769", "#719192", "#dfcdc3"],
+    "Low Saturation" : ["#333644", "#84577c", "#c65f63", "#f6e1b8"],
+    "Poison" : ["#151716", "#3e432e", "#616f39", "#a7d129"],
+    "Spring" : ["#f9f9f9", "#ffe0ac", "#ffacb7", "#6886c5"],
+    "Black & White" : ["#262626", "#595959", "#b0b0b0", "#e3e3e3"],
+    "Corruption" : ["#6f4a8e", "#221f3b", "#050505", "#ebebeb"],
+    "Ivy" : ["#1fab89", "#62d2a2", "#9df3c4", "#d7fbe8"],
+    "Ocean" : ["#73f7dd", "#2cc4cb", "#1972a4", "#2e3a87"],
+    "Royalty" : ["#fcf0c8", "#f7d098", "#911f27", "#630a10"],
+    "Transit" : ["#5BCEFA", "#F5A9B8", "#FFFFFF"],
+    "Lipstick" : ["#d52d00", "#ef7627", "#ff9a56", "#ffffff",
+    "#D162A4", "#B55690", "#A30262"],
+    "Beach" : ["#73f7dd", "#2cc4cb", "#1972a4", "#2e3a87",
+    "#fcf0c8", "#f7d098", "#911f27", "#630a10"],
+    "Rose" : ["#6f58c9", "#7e78d2", "#b6b8d6", "#bbdbd1", "#bdede0"],
+    "Rainforest": ["#00241B", "#4e878c", "#65B891", "#93E5AB", "#B5FFE1"],
+    "Spring" : ["#040926", "#251351", "#7D2E68", "#A85751", "#C97B84"],
+    "Halloween" : ["#5E503F","#A9927D","#F2F4F3","#22333B","#0A0908"],
+    "Autumn" : ["#C3E991","#DFCC74","#CB904D","#75485E","#51A3A3"],
+    "Bright" : ["#89FC00","#008BF8","#DC0073","#F5B700","#04E762"],
+    "Pistacho" : ["#3C1742","#F3FFB9","#C42021","#6C0E23","#561643"],
+    "Steal Teal" : ["#492C1D","#5B5750","#6B7F82","#7C99B4","#8EB8E5"],
+    "Violet Desert" : ["#18020C","#634B66","#9590A8","#BBCBCB","#E5FFDE"],
+    "Verve" : ["#A2666F","#F49390","#F45866","#C45AB3","#631A86"],
+    
+}
+
+## Layer settings randomize_layer picks, in the order they are picked, and the name of their lock.
+layer_settings = ["style", "shape", "complexity", "size", "transparency"]
+## Number of art layers in a recipe, one per layer widget.
+layer_count = 3
+## Chance that a mutation changes the palette, background color, style or shape when it isn't locked.
+mutation_rate = 0.3
+## Smallest and largest complexity, largest shape size and transparency, the ranges randomize_layer picks them from.
+layer_setting_ranges = {"complexity": (10, 30), "size": (51, 400), "transparency": (0, 255)}
+## Largest change a mutation makes to the complexity, largest shape size and transparency.
+mutation_steps = {"complexity": 4, "size": 60, "transparency": 48}
+
+
+def randomize_palette(rng, palette_name, background_index, palette_lock=False, background_lock=False):
+    """! Picks a random palette and background color, see color_palette.randomize.
+
+    @param rng              The random.Random stream to randomize with.
+    @param palette_name     Name of the current palette, one of the palettes keys.
+    @param background_index Index of the current background color in the palette.
+    @param palette_lock     True to keep the palette.
+    @param background_lock  True to keep the background color, unless the new palette has too few colors for it.
+
+    @return The palette name and background index.
+    """
+    if not palette_lock:
+        palette_name = rng.choice(list(palettes.keys()))
+        if background_index >= len(palettes[palette_name]):
+            background_index = rng.randint(0, len(palettes[palette_name])-1)
+
+    if not background_lock:
+        background_index = rng.randint(0, len(palettes[palette_name])-1)
+    return palette_name, background_index
+
+
+def randomize_layer(rng, settings, locks=()):
+    """! Picks random layer settings, see layer.randomize.
+
+    @param rng          The random.Random stream to randomize with.
+    @param settings     The current layer settings, see render.draw_layer.
+    @param locks        The layer_settings names that are kept.
+
+    @return New layer settings, the settings that aren't locked picked at random.
+    """
+    settings = dict(settings)
+    settings["size"] = list(settings["size"])
+    if "style" not in locks:
+        settings["style"] = rng.choice(generator_registry.get_styles())
+    if "shape" not in locks:
+        settings["shape"] = rng.choice(generator_registry.get_shapes())
+    if "complexity" not in locks:
+        settings["complexity"] = rng.randint(10,30)
+    if "size" not in locks:
+        settings["size"][1] = rng.randint(51, 400)
+    if "transparency" not in locks:
+        settings["transparency"] = rng.randint(0, 255)
+    return settings
+
+
+def mutate_palette(rng, palette_name, background_index, palette_lock=False, background_lock=False):
+    """! Sometimes picks another palette or background color, see randomize_palette.
+
+    @param rng              The random.Random stream to mutate with.
+    @param palette_name     Name of the current palette, one of the palettes keys.
+    @param background_index Index of the current background color in the palette.
+    @param palette_lock     True to keep the palette.
+    @param background_lock  True to keep the background color, unless the new palette has too few colors for it.
+
+    @return The palette name and background index.
+    """
+    if not palette_lock and rng.random() < mutation_rate:
+        palette_name = rng.choice(list(palettes.keys()))
+    if background_index >= len(palettes[palette_name]) or (not background_lock and rng.random() < mutation_rate):
+        background_index = rng.randint(0, len(palettes[palette_name])-1)
+    return palette_name, background_index
+
+
+def mutate_layer(rng, settings, locks=()):
+    """! Nudges layer settings, see randomize_layer.
+
+    The style and shape sometimes change, and the complexity, shape size and transparency move a little from their
+    current values, so the variations stay close to the current art.
+
+    @param rng          The random.Random stream to mutate with.
+    @param settings     The current layer settings, see render.draw_layer.
+    @param locks        The layer_settings names that are kept.
+
+    @return New layer settings.
+    """
+    settings = dict(settings)
+    settings["size"] = list(settings["size"])
+    if "style" not in locks and rng.random() < mutation_rate:
+        settings["style"] = rng.choice(generator_registry.get_styles())
+    if "shape" not in locks and rng.random() < mutation_rate:
+        settings["shape"] = rng.choice(generator_registry.get_shapes())
+    for name, step in mutation_steps.items():
+        low, high = layer_setting_ranges[name]
+        if name not in locks:
+            value = settings[name][1] if name == "size" else settings[name]
+            value = min(max(value + rng.randint(-step, step), low), high)
+            if name == "size":
+                settings[name][1] = value
+            else:
+                settings[name] = value
+    return settings
+
+
+def vary_recipe(recipe, seed, palette_name, palette_locks=(False, False), layer_locks=None, mutate=False):
+    """! Makes a variation of a recipe from a new master seed.
+
+    Without mutate the settings that aren't locked are picked from the seed's streams exactly like Generate Randomly
+    picks them, otherwise they are mutated from the recipe's settings. The layers' seeds and the text color are then
+    settled like canvas.draw_layers settles them, so generating the variation's seed with its settings in the app
+    draws the same art.
+
+    @param recipe           The recipe to vary, see render.render_surface.
+    @param seed             The master seed of the variation.
+    @param palette_name     Name of the recipe's palette, one of the palettes keys.
+    @param palette_locks    True for the palette lock and the background lock that are set.
+    @param layer_locks      The locked layer_settings names of each layer, None for no locks.
+    @param mutate           True to mutate the settings, False to pick them at random.
+
+    @return The variation's recipe and palette name.
+    """
+    pick_palette = mutate_palette if mutate else randomize_palette
+    pick_layer = mutate_layer if mutate else randomize_layer
+
+    palette_name, background_index = pick_palette(render.seed_stream(seed, "randomize palette"), palette_name,
+                                                  recipe.get("background_index", 0), *palette_locks)
+    layers = []
+    for i, settings in enumerate(recipe["layers"]):
+        locks = layer_locks[i] if layer_locks else ()
+        layer = pick_layer(render.seed_stream(seed, "randomize " + render.layer_stream_name(i)), settings, locks)
+        # A layer with every setting locked keeps the seed it was drawn with.
+        if settings.get("seed") is None or len(set(locks)) < len(layer_settings):
+            layer["seed"] = seed
+        layers.append(layer)
+
+    variation = dict(recipe, palette=list(palettes[palette_name]), background_index=background_index, layers=layers,
+                     seed=seed)
+    if variation.get("text"):
+        variation["text"] = dict(variation["text"],
+                                 color=render.seed_stream(seed, "text").choice(render.foreground_colors(variation)))
+    return variation, palette_name
+
+
+def default_layer_settings():
+    """! @return The settings a layer starts with before it is randomized, every setting is picked by randomize_layer
+    unless it is locked. """
+    return {"style": generator_registry.get_styles()[0], "shape": generator_registry.get_shapes()[0],
+            "complexity": 10, "size": [51, 51], "transparency": 255}
+
+
+def random_recipe(seed, palette_name=None, background_index=None, layers=None, overlay=0, size=render.default_size):
+    """! Randomizes a recipe from a master seed like Generate Randomly, with the given settings locked.
+
+    The palette, background color and each layer draw from the same seed streams the widgets randomize with. A recipe
+    starts from the first palette and background 0 rather than from the widgets' current settings. So its layers and
+    palette match what Generate Randomly picks for the same seed, but its background color can differ. The widget
+    draws the background again when the new palette is too short for the current one, and that extra draw moves the
+    stream the background is picked from.
+
+    @param seed             The master seed.
+    @param palette_name     Palette to keep, None to pick one.
+    @param background_index Background color index to keep, None to pick one.
+    @param layers           List of layer_count dicts of the layer settings to keep, by layer_settings name, or None
+                            to pick every setting. A kept "size" is the [minimum, maximum] shape size.
+    @param overlay          Overlay number, 0 for no overlay.
+    @param size             The (width, height) to render the art at.
+
+    @return A recipe for render.render_surface.
+    """
+    rng = render.seed_stream(seed, "randomize palette")
+    palette_name, background_index = randomize_palette(rng, palette_name or next(iter(palettes)),
+                                                       background_index or 0, palette_name is not None,
+                                                       background_index is not None)
+    recipe_layers = []
+    for i in range(layer_count):
+        locked = (layers or [{}] * layer_count)[i]
+        recipe_layers.append(randomize_layer(render.seed_stream(seed, "randomize " + render.layer_stream_name(i)),
+                                             dict(default_layer_settings(), **locked), locked.keys()))
+    return {
+        "palette": list(palettes[palette_name]),
+        "background_index": background_index,
+        "layers": recipe_layers,
+        "text": None,
+        "overlay": overlay,
+        "seed": seed,
+        "size": tuple(size)
+    }
@@ -0,0 +1,301 @@
+##
+# @file render.py
+#
+# @brief Headless rendering entry point that turns a recipe into pixels without a ui.
+
+# Imports
+import random
+
+import pygame as pg
+
+from modules import generator_registry
+from modules.generators import generators
+from modules.display_list import display_list
+from modules.primitives import surface_target
+from modules.sparse_layer import sparse_layer
+from modules.surface_pool import shared_pool
+import assets
+
+## Canvas size used when a recipe does not give one.
+default_size = (3840, 2160)
+
+
+def new_seed():
+    """! @return A new random master seed. """
+    return random.randrange(1 << 32)
+
+
+def seed_stream(seed, name):
+    """! Derives an independent random stream from a master seed.
+
+    Every randomized part of the art draws from its own stream, so the same master seed and settings always give
+    the same pixels, and parts can be drawn in any order or on other workers.
+
+    @param seed     The master seed.
+    @param name     Name of the stream, like "layer 1" or "randomize palette".
+
+    @return A seeded random.Random instance.
+    """
+    return random.Random("%d:%s" % (seed, name))
+
+
+def layer_stream_name(index):
+    """! @return The seed_stream name a layer draws with, from its index starting at 0. """
+    return "layer %d" % (index+1)
+
+
+def layer_stream(recipe, index):
+    """! Gets the random stream an art layer of a recipe draws with.
+
+    A layer draws from its own "seed" when it has one, like a layer kept as it was by its locks, and from the master
+    seed otherwise.
+
+    @param recipe   The recipe, see render_surface.
+    @param index    Index of the layer, starting at 0.
+
+    @return A seeded random.Random instance.
+    """
+    seed = recipe["layers"][index].get("seed")
+    return seed_stream(recipe.get("seed", 0) if seed is None else seed, layer_stream_name(index))
+
+
+def composite(target, layers):
+    """! Blits canvas sized layers onto a target surface in order.
+
+    @param target   The surface to draw to.
+    @param layers   The layers, bottom first, as full canvas surfaces or sparse_layers.
+    """
+    blits = []
+    for layer in layers:
+        if isinstance(layer, sparse_layer):
+            blits.extend(layer.pieces)
+        else:
+            blits.append((layer, (0, 0)))
+    target.blits(blits, doreturn=False)
+
+
+def draw_trimmed(size, draw, pool=shared_pool):
+    """! Draws a layer into a pooled scratch surface and keeps only the part that was drawn.
+
+    @param size     Size of the canvas.
+    @param draw     Function called with the cleared SRCALPHA scratch surface, like a draw_layer call.
+    @param pool     The surface_pool to borrow the scratch surface from.
+
+    @return The sparse_layer.
+    """
+    scratch = pool.acquire(size)
+    try:
+        draw(scratch)
+        return sparse_layer.trim(scratch)
+    finally:
+        pool.release(scratch)
+
+
+def draw_layer(surface, settings, cp, generator, rng):
+    """! Draws one art layer to a surface.
+
+    @param surface      The SRCALPHA surface to draw to, it is cleared first.
+    @param settings     Layer settings, a dict with "style", "shape", "complexity", "size" and "transparency".
+    @param cp           The foreground colors to draw with.
+    @param generator    The generators utility to draw with.
+    @param rng          The random.Random stream to draw with.
+    """
+    surface.fill((0, 0, 0, 0))
+
+    generator.draw_shape(surface, settings["shape"], settings["complexity"], cp, settings["style"], settings["size"], rng)
+
+    set_layer_blending(surface, settings)
+
+
+def estimate_layer_cost(settings, size=default_size):
+    """! Estimates the draw time of an art layer from the cost its generator declares.
+
+    @param settings     Layer settings, see draw_layer.
+    @param size         Size of the canvas.
+
+    @return The expected draw time in milliseconds, 0 if no generator draws the layer.
+    """
+    info = generator_registry.get(settings["shape"], settings["style"])
+    if info is None:
+        return 0
+    return info.estimate_cost(settings["complexity"], size[0] * size[1])
+
+
+def draw_display_list(surface, settings, dl, generator):
+    """! Draws one art layer from a recorded display list instead of drawing its random parameters again.
+
+    @param surface      The SRCALPHA surface to draw to, it is cleared first.
+    @param settings     Layer settings, see draw_layer.
+    @param dl           The display_list of the layer, see record_layers.
+    @param generator    The generators utility of the canvas, in the reference space of the display list.
+    """
+    surface.fill((0, 0, 0, 0))
+    dl.rasterize(surface_target(surface, generator))
+    set_layer_blending(surface, settings)
+
+
+def set_layer_blending(surface, settings):
+    """! Sets the colorkey and transparency an art layer is composited with.
+
+    @param surface      The layer surface.
+    @param settings     Layer settings, see draw_layer.
+    """
+    surface.set_colorkey((0, 0, 0))
+    surface.set_alpha(settings["transparency"])
+
+
+def draw_text(surface, settings, generator):
+    """! Draws the text overlay to a surface.
+
+    @param surface      The SRCALPHA surface to draw to, it is cleared first.
+    @param settings     Text settings, a dict with "text", "font", "size", "pos" and "color". Size and position are in
+                        the generators reference space.
+    @param generator    The generators utility of the canvas, used to scale the text to the surface.
+    """
+    surface.fill((0, 0, 0, 0))
+    assets.text_to_surface(surface, settings["text"], settings["color"], generator.scale_point(settings["pos"]),
+                           settings["font"], generator.scale_length(settings["size"]))
+
+
+def text_layer(settings, generator):
+    """! Gets the text overlay as a sparse layer holding only the rendered text.
+
+    The text is rendered once per text, font, size and color, moving it only moves the piece, see assets.render_text.
+
+    @param settings     Text settings, see draw_text.
+    @param generator    The generators utility of the canvas, used to scale the text to the canvas.
+
+    @return The sparse_layer, with the same pixels draw_text draws.
+    """
+    raster = assets.render_text(settings["text"], settings["font"], generator.scale_length(settings["size"]),
+                                settings["color"])
+    if raster is None:
+        return sparse_layer(generator.canvas_size)
+    return sparse_layer(generator.canvas_size, [(raster, generator.scale_point(settings["pos"]))])
+
+
+def draw_overlay(surface, image):
+    """! Draws an overlay image to a surface, stretching it to the surface size.
+
+    @param surface      The SRCALPHA surface to draw to, it is cleared first.
+    @param image        The overlay image, None for no overlay.
+    """
+    surface.fill((0, 0, 0, 0))
+    if image is not None:
+        if image.get_size() != surface.get_size():
+            image = pg.transform.smoothscale(image, surface.get_size())
+        surface.blit(image, (0, 0))
+
+
+def foreground_colors(recipe):
+    """! Gets the colors layers draw with.
+
+    @param recipe   The recipe to read the palette from.
+
+    @return The palette colors excluding the background color.
+    """
+    palette = recipe["palette"]
+    background = palette[recipe.get("background_index", 0)]
+    return [c for c in palette if c != background]
+
+
+def record_layers(recipe):
+    """! Records the art layers of a recipe as display lists, without drawing any pixels.
+
+    The display lists can be rasterized at any size with render_surface, or saved with display_list.save_trace.
+
+    @param recipe   The recipe to record, see render_surface.
+
+    @return A display_list per art layer.
+    """
+    width, height = recipe.get("size", default_size)
+    generator = generators(width, height)
+    cp = foreground_colors(recipe)
+
+    lists = []
+    for i, settings in enumerate(recipe["layers"]):
+        info = generator_registry.get(settings["shape"], settings["style"])
+        if info is not None and "display_list" not in info.backends:
+            raise ValueError("%s %s layers can only be drawn to a surface" % (settings["style"], settings["shape"]))
+        dl = display_list((generator.width, generator.height))
+        generator.draw_shape(dl, settings["shape"], settings["complexity"], cp, settings["style"], settings["size"],
+                             layer_stream(recipe, i))
+        lists.append(dl)
+    return lists
+
+
+def render_surface(recipe, pool=None, display_lists=None):
+    """! Renders a recipe to a new surface.
+
+    A recipe is a dict with the keys:
+    - "palette": list of hex colors.
+    - "background_index": index of the background color in the palette, defaults to 0.
+    - "layers": list of layer settings, see draw_layer. A layer can also have a "seed" it draws from instead of the
+      master seed, see layer_stream.
+    - "text": text settings, see draw_text, or None for no text.
+    - "overlay": overlay number, 0 or missing for no overlay.
+    - "seed": master seed the layers draw from, defaults to 0.
+    - "size": (width, height) of the result, defaults to default_size. Everything is drawn natively at this size,
+      text settings and shape geometry are scaled from the 4K sized generators reference space.
+
+    @param recipe           The recipe to render.
+    @param pool             A layer_pool to draw the layers and text in parallel with, None to draw them one after
+                            another.
+    @param display_lists    Display lists of the art layers from record_layers, drawn instead of the layers' random
+                            parameters. They are drawn one after another.
+
+    @return The rendered pygame surface.
+    """
+    width, height = recipe.get("size", default_size)
+    if display_lists:
+        generator = generators(width, height, display_lists[0].reference_size)
+    else:
+        generator = generators(width, height)
+    cp = foreground_colors(recipe)
+
+    result = pg.Surface((width, height))
+    result.fill(pg.Color(recipe["palette"][recipe.get("background_index", 0)]))
+
+    shared_layers = []
+    if pool is not None and display_lists is None:
+        shared_layers = pool.draw_layers(recipe)
+        layers = [layer.surface for layer in shared_layers]
+    else:
+        # Layers are drawn one at a time into the same scratch surface, and only what they drew is kept.
+        layers = []
+        for i, settings in enumerate(recipe["layers"]):
+            if display_lists is None:
+                layers.append(draw_trimmed((width, height), lambda surface: draw_layer(
+                    surface, settings, cp, generator, layer_stream(recipe, i))))
+            else:
+                layers.append(draw_trimmed((width, height), lambda surface: draw_display_list(
+                    surface, settings, display_lists[i], generator)))
+
+        if recipe.get("text"):
+            layers.append(text_layer(recipe["text"], generator))
+
+    try:
+        if recipe.get("overlay", 0) > 0:
+            layers.append(draw_trimmed((width, height), lambda surface: draw_overlay(
+                surface, assets.load_overlay(recipe["overlay"]-1))))
+
+        composite(result, layers)
+    finally:
+        # Shared layers are freed even if the overlay or compositing fails, or every failed render would leak them.
+        layers = None
+        for layer in shared_layers:
+            layer.release()
+
+    return result
+
+
+def render(recipe, pool=None):
+    """! Renders a recipe without opening a window.
+
+    @param recipe   The recipe to render, see render_surface.
+    @param pool     A layer_pool to draw with, see render_surface.
+
+    @return A pygame BufferProxy over the rendered pixels. It exposes the buffer protocol and a (width, height, 3) array
+            interface, so numpy.asarray(render(recipe)) is a NumPy view with no copy.
+    """
+    return render_surface(recipe, pool).get_view("3")
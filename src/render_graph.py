@@ -0,0 +1,77 @@
+##
+# @file render_graph.py
+#
+# @brief Defines the render_node class, a lazily computed and cached step of a render pipeline.
+
+# Imports
+import profiler
+
+class render_node:
+    """! A node of a render graph that caches its output until its parameters or inputs change.
+
+    Nodes are pulled rather than pushed: get computes the node's inputs first, then recomputes the node only if it was
+    invalidated or an input produced a new output since the node last ran. Each computation bumps the node's version,
+    which is how the nodes using it notice. Outputs are often surfaces updated in place, so the version, not the output,
+    tells whether something changed.
+    """
+
+    def __init__(self, name, compute, inputs=(), params=None):
+        """! Initializes the node, it is computed on the first get.
+
+        @param name     Name of the node, its profiler span is named after it.
+        @param compute  Function called as compute(params, *input outputs) that returns the node's output.
+        @param inputs   The render_nodes the node reads from.
+        @param params   Initial parameters of the node.
+        """
+        ## Name of the node.
+        self.name = name
+        ## The render_nodes the node reads from.
+        self.inputs = list(inputs)
+        ## Parameters the node was computed with, or will be on the next get.
+        self.params = params
+        ## Number of times the node has been computed.
+        self.version = 0
+        self.__compute = compute
+        self.__output = None
+        self.__valid = False
+        self.__input_versions = None
+
+
+    def set_params(self, params):
+        """! Sets the node's parameters, invalidating it if they changed.
+
+        @param params   The new parameters, compared with == to the current ones.
+
+        @return True if the node was invalidated.
+        """
+        if self.__valid and params == self.params:
+            return False
+        self.params = params
+        self.__valid = False
+        return True
+
+
+    def invalidate(self):
+        """! Makes the node compute again on the next get, even if nothing it depends on changed. """
+        self.__valid = False
+
+
+    def is_valid(self):
+        """! @return True if the node's cached output is up to date, not counting its inputs. """
+        return self.__valid
+
+
+    def get(self):
+        """! Gets the node's output, computing it and its inputs only where something changed.
+
+        @return The output of the node's compute function.
+        """
+        outputs = [node.get() for node in self.inputs]
+        input_versions = tuple(node.version for node in self.inputs)
+        if not self.__valid or input_versions != self.__input_versions:
+            with profiler.span("render_graph." + self.name):
+                self.__output = self.__compute(self.params, *outputs)
+            self.__valid = True
+            self.__input_versions = input_versions
+            self.version += 1
+        return self.__output
@@ -0,0 +1,111 @@
+##
+# @file render_worker.py
+#
+# @brief Defines the render_worker class which renders full resolution art in the background.
+
+# Imports
+import copy
+import threading
+import time
+import traceback
+
+import profiler
+import render
+
+class render_worker:
+    """! Renders recipes on a background thread once they stop changing.
+
+    The ui draws a low resolution preview and requests the full resolution render here. Requests are debounced so
+    dragging a slider doesn't start a render per event, and only the latest result is kept.
+    """
+
+    def __init__(self, delay, pool=None):
+        """! Initializes the render worker and starts its thread.
+
+        @param delay    Seconds a request has to stay the latest one before it is rendered.
+        @param pool     A layer_pool to draw layers in parallel with, see render.render_surface.
+        """
+        self.__delay = delay
+        self.__pool = pool
+        self.__condition = threading.Condition()
+        self.__pending = None
+        self.__due = 0
+        self.__rendering = None
+        self.__done_recipe = None
+        self.__done_surface = None
+
+        self.__thread = threading.Thread(target=self.__run, name="render_worker", daemon=True)
+        self.__thread.start()
+
+
+    def request(self, recipe):
+        """! Requests a background render, replacing any request that hasn't started.
+
+        @param recipe   The recipe to render, see render.render_surface.
+        """
+        with self.__condition:
+            self.__pending = copy.deepcopy(recipe)
+            self.__due = time.monotonic() + self.__delay
+            self.__condition.notify_all()
+
+
+    def peek(self, recipe):
+        """! Gets the finished background render of a recipe without waiting for it.
+
+        @param recipe   The recipe to look up, see render.render_surface.
+
+        @return The rendered pygame surface, or None if that recipe isn't the latest finished render.
+        """
+        with self.__condition:
+            if self.__done_recipe == recipe:
+                return self.__done_surface
+        return None
+
+
+    def result(self, recipe):
+        """! Gets the render of a recipe.
+
+        Returns the background result when it matches, waits for it when that recipe is queued or rendering, and
+        otherwise renders the recipe on the calling thread.
+
+        @param recipe   The recipe to render, see render.render_surface.
+
+        @return The rendered pygame surface.
+        """
+        with self.__condition:
+            if self.__pending == recipe:
+                self.__due = 0
+                self.__condition.notify_all()
+            while self.__pending == recipe or self.__rendering == recipe:
+                self.__condition.wait()
+            if self.__done_recipe == recipe:
+                return self.__done_surface
+
+        with profiler.span("render_worker.render_surface"):
+            return render.render_surface(recipe, self.__pool)
+
+
+    def __run(self):
+        """! Worker thread loop, renders the pending request once it is due. """
+        while True:
+            with self.__condition:
+                while self.__pending is None or time.monotonic() < self.__due:
+                    self.__condition.wait(None if self.__pending is None else self.__due - time.monotonic())
+                recipe = self.__pending
+                self.__pending = None
+                self.__rendering = recipe
+
+            try:
+                with profiler.span("render_worker.render_surface"):
+                    surface = render.render_surface(recipe, self.__pool)
+            except Exception:
+                # Keep the worker alive, callers waiting on this recipe fall back to rendering it themselves.
+                traceback.print_exc()
+                surface = None
+
+            with self.__condition:
+                self.__rendering = None
+                if surface is not None:
+                    self.__done_recipe = recipe
+                    self.__done_surface = surface
+                self.__condition.notify_all()
@@ -0,0 +1,133 @@
+##
+# @file startup_report.py
+#
+# @brief Breaks the time to the first frame down by import and asset load.
+#
+# Set AAG_STARTUP_REPORT=1 before starting the app to print the report when the first frame is shown. Imports are timed
+# from when this module is imported, which ui_controller does first, so the interpreter's own startup isn't counted.
+
+# Imports
+import os
+import sys
+import threading
+import time
+
+## True if the startup is timed and the report printed.
+enabled = os.environ.get("AAG_STARTUP_REPORT", "") not in ("", "0")
+## Number of the slowest imports and assets listed in the report.
+report_rows = 25
+
+_start = time.perf_counter()
+_entries = []
+_stack = []
+_reported = False
+_local = threading.local()
+
+
+def record(kind, name, seconds, self_seconds=None):
+    """! Records a timed startup step.
+
+    @param kind         Kind of the step, like "import" or "asset".
+    @param name         Name of the step, like the module name or asset name.
+    @param seconds      Time the step took, including the steps it started.
+    @param self_seconds Time the step took on its own, defaults to seconds.
+    """
+    if enabled and not _reported:
+        _entries.append((kind, name, seconds, seconds if self_seconds is None else self_seconds))
+
+
+class timed:
+    """! Context manager that records the time spent in it as a startup step, see record. """
+
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+
+    def __exit__(self, *exc):
+        record(self.kind, self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _timed_loader:
+    """! Wraps a module loader to time executing the module, not counting the imports it times itself. """
+
+    def __init__(self, loader):
+        self.__loader = loader
+
+
+    def __getattr__(self, name):
+        return getattr(self.__loader, name)
+
+
+    def create_module(self, spec):
+        return self.__loader.create_module(spec)
+
+
+    def exec_module(self, module):
+        stack = _stack if threading.current_thread() is threading.main_thread() else None
+        start = time.perf_counter()
+        if stack is not None:
+            stack.append(0.0)
+        try:
+            self.__loader.exec_module(module)
+        finally:
+            seconds = time.perf_counter() - start
+            if stack is not None:
+                children = stack.pop()
+                if stack:
+                    stack[-1] += seconds
+                record("import", module.__name__, seconds, seconds - children)
+
+
+class _timing_finder:
+    """! Meta path finder that finds modules with the other finders and wraps their loaders in a _timed_loader. """
+
+    def find_spec(self, name, path=None, target=None):
+        if getattr(_local, "finding", False):
+            return None
+        _local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _timed_loader(spec.loader)
+                    return spec
+            return None
+        finally:
+            _local.finding = False
+
+
+def install():
+    """! Starts timing imports if the report is enabled. """
+    if enabled and not any(isinstance(finder, _timing_finder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _timing_finder())
+
+
+def get_report():
+    """! @return The report text, the slowest imports and assets by their own time. """
+    total = time.perf_counter() - _start
+    lines = ["startup report: %.3f s to first frame" % total]
+    for kind in ("import", "asset"):
+        entries = [entry for entry in _entries if entry[0] == kind]
+        lines.append("%ss: %.3f s in %d" % (kind, sum(entry[3] for entry in entries), len(entries)))
+        for _, name, seconds, self_seconds in sorted(entries, key=lambda entry: -entry[3])[:report_rows]:
+            lines.append("  %8.1f ms  %8.1f ms total  %s" % (self_seconds * 1000, seconds * 1000, name))
+    return "\n".join(lines)
+
+
+def first_frame():
+    """! Prints the report the first time a frame is shown, if the report is enabled. """
+    global _reported
+    if enabled and not _reported:
+        print(get_report(), file=sys.stderr)
+        _reported = True
+        sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, _timing_finder)]
@@ -0,0 +1,213 @@
+##
+# @file svg_export.py
+#
+# @brief Exports art as an SVG vector image, streaming each shape to the file as it is drawn.
+
+# Imports
+import base64
+import io
+from xml.sax.saxutils import escape, quoteattr
+
+import pygame as pg
+
+from modules import generator_registry
+from modules.curves import evaluate_curves
+from modules.generators import generators
+import assets
+import render
+
+class svg_target:
+    """! Draw target that writes primitives to an SVG file as elements in reference space.
+
+    Nothing is kept in memory, each primitive is written as it is drawn. Black pixels of a layer are transparent on the
+    raster canvas, so black primitives are left out the same way.
+    """
+
+    def __init__(self, file):
+        """! Initializes the SVG target.
+
+        @param file     Text file object to write the elements to.
+        """
+        self.__file = file
+
+
+    def circle(self, color, center, rad, width=0):
+        """! Writes a circle, width 0 fills it. """
+        self.__circle(color, center, rad, width, "")
+
+
+    def rect(self, color, rect):
+        """! Writes a filled rectangle. """
+        if _is_keyed(color):
+            return
+        self.__file.write('<rect x="%d" y="%d" width="%d" height="%d" fill="%s"/>\n'
+                          % (rect[0], rect[1], rect[2], rect[3], _hex(color)))
+
+
+    def line(self, color, start, end, width):
+        """! Writes a line, pygame draws nothing narrower than 1. """
+        if _is_keyed(color) or width < 1:
+            return
+        self.__file.write('<line x1="%d" y1="%d" x2="%d" y2="%d" stroke="%s" stroke-width="%d"/>\n'
+                          % (start[0], start[1], end[0], end[1], _hex(color), width))
+
+
+    def polygon(self, color, points, width):
+        """! Writes a polygon, width 0 fills it. """
+        if _is_keyed(color):
+            return
+        paint = 'fill="%s"' % _hex(color) if width == 0 else 'fill="none" stroke="%s" stroke-width="%d"' % (_hex(color), width)
+        self.__file.write('<polygon points="%s" %s/>\n' % (_points(points), paint))
+
+
+    def curve(self, color, points, last_points, steps):
+        """! Writes a thick bezier curve as a polyline along the middle of its stroke. """
+        if _is_keyed(color):
+            return
+        middle = [((x1 + x2) / 2, (y1 + y2) / 2) for (x1, y1), (x2, y2) in zip(points, last_points)]
+        thickness = max(abs(x2 - x1) + abs(y2 - y1) for (x1, y1), (x2, y2) in zip(points, last_points)) + 1
+        self.__file.write('<polyline points="%s" fill="none" stroke="%s" stroke-width="%d" stroke-linejoin="round"/>\n'
+                          % (_points(evaluate_curves([middle], steps)[0].tolist()), _hex(color), thickness))
+
+
+    def stamp(self, rad, color, width, alpha, center):
+        """! Writes a translucent circle or ring. """
+        self.__circle(color, center, rad, width, ' opacity="%.3f"' % (alpha / 255))
+
+
+    def flush(self):
+        """! Nothing is queued, primitives are written as they are drawn. """
+        pass
+
+
+    def __circle(self, color, center, rad, width, attributes):
+        """! Writes a filled circle or a ring covering rad-width to rad, like pg.draw.circle. """
+        if _is_keyed(color):
+            return
+        if width == 0 or width >= rad:
+            self.__file.write('<circle cx="%d" cy="%d" r="%d" fill="%s"%s/>\n'
+                              % (center[0], center[1], rad, _hex(color), attributes))
+        else:
+            self.__file.write('<circle cx="%d" cy="%d" r="%g" fill="none" stroke="%s" stroke-width="%d"%s/>\n'
+                              % (center[0], center[1], rad - width/2, _hex(color), width, attributes))
+
+
+def _is_keyed(color):
+    """! @return True if a color is the colorkey layers are drawn with, black. """
+    color = pg.Color(color)
+    return color.r == 0 and color.g == 0 and color.b == 0
+
+
+def _hex(color):
+    """! @return A color as an SVG #rrggbb string. """
+    color = pg.Color(color)
+    return "#%02x%02x%02x" % (color.r, color.g, color.b)
+
+
+def _points(points):
+    """! @return Points as an SVG points attribute. """
+    return " ".join("%g,%g" % (round(x, 1), round(y, 1)) for x, y in points)
+
+
+def write_svg(file, recipe, display_lists=None):
+    """! Writes a recipe as an SVG image.
+
+    Shapes are laid out in the generators reference space and the image is sized to the recipe size, so it prints at any
+    size. The background, art layers, text and overlay are written in the same order they are composited.
+
+    @param file             Text file object to write to.
+    @param recipe           The recipe to write, see render.render_surface.
+    @param display_lists    Display lists of the art layers, see render.render_surface.
+    """
+    width, height = recipe.get("size", render.default_size)
+    if display_lists:
+        generator = generators(width, height, display_lists[0].reference_size)
+    else:
+        generator = generators(width, height)
+    view_width, view_height = generator.width, generator.height
+    cp = render.foreground_colors(recipe)
+    target = svg_target(file)
+
+    file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    file.write('<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="0 0 %d %d">\n'
+               % (width, height, view_width, view_height))
+    file.write('<rect width="100%%" height="100%%" fill="%s"/>\n' % _hex(recipe["palette"][recipe.get("background_index", 0)]))
+
+    for i, settings in enumerate(recipe["layers"]):
+        file.write('<g opacity="%.3f">\n' % (settings["transparency"] / 255))
+        info = generator_registry.get(settings["shape"], settings["style"])
+        if display_lists is None and info is not None and "display_list" not in info.backends:
+            write_raster_layer(file, recipe, i, generator)
+        elif display_lists is None:
+            generator.draw_shape(target, settings["shape"], settings["complexity"], cp, settings["style"],
+                                 settings["size"], render.layer_stream(recipe, i))
+        else:
+            display_lists[i].rasterize(target)
+        file.write('</g>\n')
+
+    text = recipe.get("text")
+    if text and text["text"]:
+        write_text(file, text)
+
+    if recipe.get("overlay", 0) > 0:
+        with open(assets.asset_path(assets.overlay_paths[recipe["overlay"]-1]), "rb") as image:
+            data = base64.b64encode(image.read()).decode("ascii")
+        file.write('<image width="%d" height="%d" preserveAspectRatio="none" href="data:image/png;base64,%s"/>\n'
+                   % (view_width, view_height, data))
+
+    file.write('</svg>\n')
+
+
+def write_raster_layer(file, recipe, index, generator):
+    """! Writes an art layer whose generator can only draw to a surface as an embedded PNG image.
+
+    @param file         Text file object to write to.
+    @param recipe       The recipe the layer is part of.
+    @param index        Index of the layer in the recipe.
+    @param generator    The generators utility of the image.
+    """
+    layer = pg.Surface(generator.canvas_size, pg.SRCALPHA)
+    render.draw_layer(layer, recipe["layers"][index], render.foreground_colors(recipe), generator,
+                      render.layer_stream(recipe, index))
+    # The layer's black colorkey doesn't survive saving, clear the keyed pixels' alpha instead.
+    layer.set_colorkey(None)
+    layer.set_alpha(None)
+    pixels = pg.surfarray.pixels3d(layer)
+    alpha = pg.surfarray.pixels_alpha(layer)
+    alpha[(pixels == 0).all(axis=2)] = 0
+    del pixels, alpha
+
+    data = io.BytesIO()
+    pg.image.save(layer, data, "layer.png")
+    file.write('<image width="%d" height="%d" preserveAspectRatio="none" href="data:image/png;base64,%s"/>\n'
+               % (generator.width, generator.height, base64.b64encode(data.getvalue()).decode("ascii")))
+
+
+def write_text(file, settings):
+    """! Writes the text overlay, embedding its font so the image looks the same without the font installed.
+
+    @param file         Text file object to write to.
+    @param settings     Text settings in reference space, see render.draw_text.
+    """
+    font_path = assets.asset_path("fonts/" + settings["font"] + ".ttf")
+    with open(font_path, "rb") as font_file:
+        data = base64.b64encode(font_file.read()).decode("ascii")
+    family = "text-" + settings["font"]
+    file.write('<style>@font-face { font-family: "%s"; src: url(data:font/ttf;base64,%s); }</style>\n' % (family, data))
+
+    # pygame draws the top left of the text's ink at pos, SVG text is placed by its origin on the baseline.
+    bounds = assets.get_font(settings["font"], settings["size"]).get_rect(settings["text"])
+    file.write('<text x="%d" y="%d" font-family=%s font-size="%d" fill="%s" xml:space="preserve">%s</text>\n'
+               % (settings["pos"][0] - bounds.x, settings["pos"][1] + bounds.y, quoteattr(family), settings["size"],
+                  _hex(settings["color"]), escape(settings["text"])))
+
+
+def export_svg(path, recipe, display_lists=None):
+    """! Exports a recipe to an SVG file.
+
+    @param path             Path of the SVG file.
+    @param recipe           The recipe to export, see render.render_surface.
+    @param display_lists    Display lists of the art layers, see render.render_surface.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        write_svg(file, recipe, display_lists)
@@ -0,0 +1,27 @@
+##
+# @file conftest.py
+#
+# @brief Pytest setup, the tests import the program modules from the src directory and run without a window.
+#
+# Run from the src directory:
+#
+#     python -m pytest -q tests
+
+# Imports
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame as pg
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_init():
+    """! Starts pygame once for the tests, the text layers need its font module. """
+    pg.init()
+    yield
+    pg.quit()
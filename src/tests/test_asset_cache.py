@@ -0,0 +1,62 @@
+##
+# @file test_asset_cache.py
+#
+# @brief Tests of the raw image cache.
+
+# Imports
+import os
+
+import pygame as pg
+import pytest
+
+import asset_cache
+
+## Size of the test source image.
+source_size = (32, 18)
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """! A small translucent source image, with the cache in a temporary directory. """
+    monkeypatch.setattr(asset_cache, "cache_dir", str(tmp_path / "cache"))
+    image = pg.Surface(source_size, pg.SRCALPHA)
+    for x in range(source_size[0]):
+        image.fill((x * 8, 255 - x * 8, 90, 128 + x * 4), pg.Rect(x, 0, 1, source_size[1] // 2))
+    path = str(tmp_path / "overlay.png")
+    pg.image.save(image, path)
+    return path
+
+
+def test_raw_round_trip(source):
+    """! A converted image maps back with the pixels of its source, and its thumbnail at the thumbnail size. """
+    assert asset_cache.open_raw(source) is None
+    asset_cache.convert(source)
+
+    raw = asset_cache.open_raw(source)
+    decoded = pg.image.load(source)
+    assert raw.get_size() == source_size
+    assert pg.image.tobytes(raw, "RGBA") == pg.image.tobytes(decoded, "RGBA")
+    assert asset_cache.open_raw(source, asset_cache.thumbnail_size).get_size() == asset_cache.thumbnail_size
+
+
+def test_changed_source_is_converted_again(source):
+    """! A raw image older than its source isn't used, and convert_all converts only what changed. """
+    asset_cache.convert(source)
+    assert asset_cache.convert_all([source]) == []
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert asset_cache.open_raw(source) is None
+    assert asset_cache.convert_all([source]) == [source]
+    assert asset_cache.open_raw(source) is not None
+
+
+def test_truncated_raw_is_ignored(source):
+    """! A raw image cut short isn't mapped, and load converts the source again. """
+    asset_cache.convert(source)
+    path = asset_cache.get_raw_path(source)
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 4)
+    assert asset_cache.open_raw(source) is None
+    assert asset_cache.load(source).get_size() == source_size
+    assert asset_cache.open_raw(source) is not None
@@ -0,0 +1,76 @@
+##
+# @file test_batch.py
+#
+# @brief Tests of the layer setting options of the batch command line.
+
+# Imports
+import argparse
+
+import pytest
+
+import batch
+import randomize
+
+
+def get_args(**options):
+    """! @return Parsed arguments with the given layer setting options, the others left unset. """
+    return argparse.Namespace(**dict({name: None for name in randomize.layer_settings}, **options))
+
+
+def test_no_locks():
+    """! Without options every setting of every layer is random. """
+    assert batch.get_layer_locks(get_args()) == [{}] * randomize.layer_count
+
+
+def test_one_value_locks_every_layer():
+    """! One value is kept for every layer, numbers are converted and a size is the shape size range. """
+    locks = batch.get_layer_locks(get_args(shape=["Circles"], complexity=["12"], size=["200"]))
+    assert locks == [{"shape": "Circles", "complexity": 12, "size": [51, 200]}] * randomize.layer_count
+
+
+def test_values_per_layer():
+    """! One value per layer, unlocked leaves that layer's setting random. """
+    locks = batch.get_layer_locks(get_args(transparency=["0", batch.unlocked, "255"]))
+    assert locks == [{"transparency": 0}, {}, {"transparency": 255}]
+
+
+@pytest.mark.parametrize("options", [
+    {"shape": ["Circles", "Circles"]},
+    {"style": ["Nonexistent"]},
+    {"complexity": ["many"]},
+    {"complexity": ["9"]},
+    {"size": ["401"]},
+    {"transparency": ["-1"]},
+    {"transparency": ["1.5"]},
+])
+def test_invalid_values(options):
+    """! A wrong number of values, an unknown choice or a number out of its range is refused. """
+    with pytest.raises(ValueError):
+        batch.get_layer_locks(get_args(**options))
+
+
+@pytest.mark.parametrize("options", [
+    ["--background", "-1"],
+    ["--palette", "Lava", "--background", "99"],
+    ["--overlay", "-1"],
+    ["--overlay", "10"],
+    ["--complexity", "31"],
+    ["--png-compression", "10"],
+    ["--png-compression", "-1"],
+    ["--resolution", "0", "36"],
+    ["--resolution", "64", "-36"],
+    ["--processes", "0"],
+])
+def test_main_rejects_options(tmp_path, options):
+    """! Out of range options stop the batch with a usage error before anything is rendered. """
+    out = tmp_path / "batch"
+    with pytest.raises(SystemExit) as exit_info:
+        batch.main(["1", "--out", str(out)] + options)
+    assert exit_info.value.code == 2
+    assert not out.exists()
+
+
+def test_main_rejects_negative_count(tmp_path):
+    """! A negative image count is a usage error. """
+    with pytest.raises(SystemExit):
+        batch.main(["--out", str(tmp_path), "--", "-1"])
@@ -0,0 +1,45 @@
+##
+# @file test_benchmark.py
+#
+# @brief Tests of the generator benchmark's runs, regression checks and baselines.
+
+# Imports
+import benchmark
+
+
+def test_run_suite():
+    """! Every combination gets a result with a time and a peak memory. """
+    results = benchmark.run_suite(["Circles", "Lines"], ["Chaotic"], [10], [50, 100], size=(192, 108), repeat=1)
+    assert sorted(results) == sorted(benchmark.case_name(shape, "Chaotic", 10, magnitude)
+                                     for shape in ("Circles", "Lines") for magnitude in (50, 100))
+    for result in results.values():
+        assert result["ms"] >= 0
+        assert result["peak"] >= 0
+
+
+def test_compare():
+    """! Growth over the threshold and the noise floors is a regression, other growth and missing cases aren't. """
+    baseline = {"a": {"ms": 10.0, "peak": 1 << 20}, "b": {"ms": 1.0, "peak": 1000}, "c": {"ms": 10.0, "peak": 0}}
+    results = {
+        "a": {"ms": 20.0, "peak": 2 << 20},
+        # Over the threshold, but by less than the noise floors.
+        "b": {"ms": 1.9, "peak": 2000},
+        "d": {"ms": 100.0, "peak": 1 << 30},
+    }
+    assert benchmark.compare(results, baseline) == [("a", "ms", 10.0, 20.0), ("a", "peak", 1 << 20, 2 << 20)]
+    assert benchmark.compare(results, baseline, threshold=2) == []
+
+
+def test_baseline_settings(tmp_path):
+    """! A saved baseline loads back and compares with the same settings, not with another size, repeat or machine. """
+    path = str(tmp_path / "benchmarks" / "machine.json")
+    assert benchmark.load_baseline(path) is None
+    results = {"Circles/Chaotic/c10/m50": {"ms": 1.5, "peak": 4096}}
+    benchmark.save_baseline(path, results, (192, 108), 2)
+
+    baseline = benchmark.load_baseline(path)
+    assert baseline["results"] == results
+    assert benchmark.get_mismatches(baseline, (192, 108), 2) == []
+    assert len(benchmark.get_mismatches(baseline, (3840, 2160), 2)) == 1
+    assert len(benchmark.get_mismatches(baseline, (192, 108), 3)) == 1
+    assert len(benchmark.get_mismatches(baseline, (192, 108), 2, tag="other-machine")) == 1
@@ -0,0 +1,40 @@
+##
+# @file test_display_list.py
+#
+# @brief Tests of display lists and their binary trace files.
+
+# Imports
+import pytest
+
+from modules import display_list
+import render
+from test_render import get_hash, get_recipe
+
+
+def test_trace_round_trip(tmp_path):
+    """! Display lists loaded from a trace file equal the saved ones and rasterize to the pixels of a direct render. """
+    recipe = get_recipe(7)
+    lists = render.record_layers(recipe)
+    path = str(tmp_path / "art.trace")
+    display_list.save_trace(path, lists)
+
+    loaded = display_list.load_trace(path)
+    assert loaded == lists
+    assert [len(dl) for dl in loaded] == [len(dl) for dl in lists]
+    assert get_hash(render.render_surface(recipe, display_lists=loaded)) == get_hash(render.render_surface(recipe))
+
+
+def test_empty_trace_round_trip(tmp_path):
+    """! A trace of no display lists, or of an empty one, loads back the same. """
+    path = str(tmp_path / "empty.trace")
+    for lists in ([], [display_list.display_list((3840, 2160))]):
+        display_list.save_trace(path, lists)
+        assert display_list.load_trace(path) == lists
+
+
+def test_load_trace_rejects_other_files(tmp_path):
+    """! A file that isn't a trace of the current version isn't read. """
+    path = tmp_path / "art.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(16))
+    with pytest.raises(ValueError):
+        display_list.load_trace(str(path))
@@ -0,0 +1,135 @@
+##
+# @file test_image_export.py
+#
+# @brief Tests of the PNG encoder and the downsampling of image_export.
+
+# Imports
+import io
+import random
+import zlib
+
+import numpy as np
+import pygame as pg
+import pytest
+
+import image_export
+
+
+def make_surface(size, alpha, depth=32):
+    """! @return A surface of random pixels, with per pixel alpha or without. """
+    rng = random.Random(size[0] * size[1])
+    surface = pg.Surface(size, pg.SRCALPHA, 32) if alpha else pg.Surface(size, 0, depth)
+    pixels = bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 4))
+    surface.blit(pg.image.frombytes(pixels, size, "RGBA"), (0, 0))
+    # Flat areas as well as noise, so the compressed pieces aren't all stored blocks.
+    surface.fill((200, 40, 90, 255), pg.Rect(0, 0, size[0], size[1] // 3))
+    return surface
+
+
+def get_pixels(surface):
+    """! @return The pixels of a surface as a (height, width, channels) array, RGBA with per pixel alpha, else RGB. """
+    mode = "RGBA" if surface.get_flags() & pg.SRCALPHA else "RGB"
+    return np.frombuffer(pg.image.tobytes(surface, mode), np.uint8).reshape(surface.get_height(), surface.get_width(),
+                                                                            len(mode))
+
+
+def box_filter(surface, factor):
+    """! @return The rounded means of the factor by factor blocks of a surface's pixels, one channel at a time. """
+    blocks = get_pixels(surface).reshape(surface.get_height() // factor, factor, surface.get_width() // factor, factor,
+                                         -1)
+    return (blocks.sum(axis=(1, 3), dtype=np.uint32) + factor * factor // 2) // (factor * factor)
+
+
+@pytest.mark.parametrize("level", [0, 6, 9])
+@pytest.mark.parametrize("alpha", [False, True])
+def test_save_png_round_trip(level, alpha):
+    """! A saved PNG decodes to the pixels of the surface, over several compressed pieces on several threads. """
+    size = (37, 3 * image_export.png_rows_per_step + 5)
+    surface = make_surface(size, alpha)
+    file = io.BytesIO()
+    image_export.save_png(surface, file, compression_level=level, threads=2)
+
+    file.seek(0)
+    loaded = pg.image.load(file, "art.png")
+    assert loaded.get_size() == size
+    mode = "RGBA" if alpha else "RGB"
+    assert pg.image.tobytes(loaded, mode) == pg.image.tobytes(surface, mode)
+
+
+def test_save_png_progress():
+    """! Progress rises to 1 as the pieces are written. """
+    fractions = []
+    image_export.save_png(make_surface((8, 2 * image_export.png_rows_per_step + 1), False), io.BytesIO(),
+                          progress=fractions.append, threads=1)
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == 1
+
+
+@pytest.mark.parametrize("length1, length2", [(0, 0), (0, 10), (10, 0), (1, 1), (5000, 70000), (65521, 65522)])
+def test_adler32_combine(length1, length2):
+    """! Combining the checksums of two pieces gives zlib's checksum of them joined. """
+    rng = random.Random(length1 + length2)
+    data1 = bytes(rng.randrange(256) for _ in range(length1))
+    data2 = bytes(rng.randrange(256) for _ in range(length2))
+    combined = image_export._adler32_combine(zlib.adler32(data1), zlib.adler32(data2), len(data2))
+    assert combined == zlib.adler32(data1 + data2)
+
+
+@pytest.mark.parametrize("factor", [1, 2, 3, 4])
+@pytest.mark.parametrize("alpha, depth", [(False, 24), (False, 32), (True, 32)])
+def test_downsample_is_exact(factor, alpha, depth):
+    """! Each pixel of a downsampled surface is the rounded mean of the block it covers, alpha included. """
+    surface = make_surface((48, 24), alpha, depth)
+    small = image_export.downsample(surface, factor)
+    assert small.get_size() == (48 // factor, 24 // factor)
+    assert bool(small.get_flags() & pg.SRCALPHA) == alpha
+    assert np.array_equal(get_pixels(small), box_filter(surface, factor))
+
+
+@pytest.mark.parametrize("factor", [0, 5, 7])
+def test_downsample_needs_a_whole_divisor(factor):
+    """! A factor that doesn't divide the width and height is refused. """
+    with pytest.raises(ValueError):
+        image_export.downsample(make_surface((48, 24), False), factor)
+
+
+def test_build_pyramid():
+    """! Whole fractions of a larger level are box filtered from the nearest one, other sizes are smoothscaled. """
+    surface = make_surface((96, 54), True)
+    full, half, third, sixth, other = image_export.build_pyramid(surface, [(96, 54), (48, 27), (32, 18), (16, 9),
+                                                                           (40, 20)])
+    assert full is surface
+    assert np.array_equal(get_pixels(half), box_filter(surface, 2))
+    assert np.array_equal(get_pixels(third), box_filter(surface, 3))
+    assert np.array_equal(get_pixels(sixth), box_filter(third, 2))
+    assert np.array_equal(get_pixels(other), get_pixels(pg.transform.smoothscale(surface, (40, 20))))
+    with pytest.raises(ValueError):
+        image_export.build_pyramid(surface, [(192, 108)])
+
+
+def test_save_pyramid(tmp_path):
+    """! Every level is saved next to the path with its size in the name. """
+    path = str(tmp_path / "art.png")
+    sizes = [(96, 54), (32, 18)]
+    paths = image_export.save_pyramid(make_surface((96, 54), False), path, sizes)
+    assert paths == [str(tmp_path / "art_96x54.png"), str(tmp_path / "art_32x18.png")]
+    assert [pg.image.load(level_path).get_size() for level_path in paths] == sizes
+
+
+@pytest.mark.parametrize("name, options", [("art.png", {"png_compression": 10}), ("art.png", {"png_compression": -1}),
+                                           ("art.jpg", {"jpeg_quality": 0}), ("art.jpg", {"jpeg_quality": 96})])
+def test_save_image_rejects_out_of_range_options(tmp_path, name, options):
+    """! A compression level or quality out of range is refused before anything is written. """
+    with pytest.raises(ValueError):
+        image_export.save_image(make_surface((8, 8), False), str(tmp_path / name), **options)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("value, expected", [(None, 6), ("", 6), ("3", 3), ("12", 9), ("-1", 0), ("fast", 6)])
+def test_get_setting(monkeypatch, value, expected):
+    """! Environment settings fall back to the default when unset or not a number, and are clamped to their range. """
+    if value is None:
+        monkeypatch.delenv("AAG_TEST_SETTING", raising=False)
+    else:
+        monkeypatch.setenv("AAG_TEST_SETTING", value)
+    assert image_export._get_setting("AAG_TEST_SETTING", 6, image_export.png_compression_range) == expected
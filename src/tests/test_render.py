@@ -0,0 +1,104 @@
+##
+# @file test_render.py
+#
+# @brief Tests that rendering a recipe is reproducible, one layer after another or on a layer_pool.
+
+# Imports
+import hashlib
+import os
+
+import pygame as pg
+import pytest
+
+import assets
+import layer_pool
+import render
+
+## Small size the test recipes render at.
+test_size = (192, 108)
+## Palette of the test recipes.
+test_palette = ["#f9ed69", "#f08a5d", "#b83b5e", "#6a2c70"]
+
+
+def get_recipe(seed):
+    """! @return A recipe of circles, curves and polygons with text, drawn from a master seed. """
+    return {
+        "palette": test_palette,
+        "background_index": 3,
+        "layers": [
+            {"style": "Chaotic", "shape": "Circles", "complexity": 20, "size": [51, 200], "transparency": 255},
+            {"style": "Striped Vertical", "shape": "Curves", "complexity": 15, "size": [51, 150], "transparency": 180},
+            {"style": "Mosaic", "shape": "Filled Polygons", "complexity": 10, "size": [51, 100], "transparency": 120},
+        ],
+        "text": {"text": "Abstract", "font": "Basic", "size": 600, "color": test_palette[0], "pos": (200, 200)},
+        "seed": seed,
+        "size": test_size,
+    }
+
+
+def get_hash(surface):
+    """! @return The md5 of a surface's pixels. """
+    return hashlib.md5(pg.image.tobytes(surface, "RGB")).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """! A layer_pool with two workers, shut down after the module's tests. """
+    pool = layer_pool.layer_pool(2)
+    yield pool
+    pool.shutdown()
+
+
+def test_seed_streams():
+    """! A stream gives the same numbers for the same master seed and name, and others for another seed or name. """
+    first = [render.seed_stream(1, "layer 1").random() for _ in range(3)]
+    assert first == [render.seed_stream(1, "layer 1").random() for _ in range(3)]
+    assert render.seed_stream(1, "layer 1").random() != render.seed_stream(2, "layer 1").random()
+    assert render.seed_stream(1, "layer 1").random() != render.seed_stream(1, "layer 2").random()
+
+
+@pytest.mark.parametrize("seed", [1, 2024, 4294967295])
+def test_render_surface_is_stable(seed):
+    """! The same recipe renders the same pixels every time, and another master seed renders other pixels. """
+    recipe = get_recipe(seed)
+    first = get_hash(render.render_surface(recipe))
+    assert get_hash(render.render_surface(recipe)) == first
+    assert get_hash(render.render_surface(get_recipe(seed + 1))) != first
+
+
+@pytest.mark.parametrize("seed", [1, 2024])
+def test_layer_pool_matches_serial(pool, seed):
+    """! Drawing the layers on a layer_pool renders the same pixels as drawing them one after another. """
+    recipe = get_recipe(seed)
+    assert get_hash(render.render_surface(recipe, pool)) == get_hash(render.render_surface(recipe))
+
+
+def test_layer_pool_render_matches_serial(pool):
+    """! A whole recipe rendered in a worker process gives the pixels of a render in this one. """
+    recipe = get_recipe(7)
+    assert pool.render(recipe).result() == pg.image.tobytes(render.render_surface(recipe), "RGB")
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="lists shared memory in /dev/shm")
+def test_failed_render_frees_shared_layers(pool, monkeypatch):
+    """! A render on a layer_pool that fails after the layers are drawn leaves no shared memory behind. """
+    def fail(index):
+        raise OSError("overlay %d is missing" % index)
+    monkeypatch.setattr(assets, "load_overlay", fail)
+    before = set(os.listdir("/dev/shm"))
+    with pytest.raises(OSError):
+        render.render_surface(dict(get_recipe(1), overlay=1), pool)
+    assert set(os.listdir("/dev/shm")) <= before
+
+
+def test_failed_layer_job_keeps_its_error(monkeypatch):
+    """! A worker's failed draw raises its own error rather than one from detaching the shared layer it drew on. """
+    def fail(surface, *args):
+        raise RuntimeError("draw failed")
+    monkeypatch.setattr(render, "draw_layer", fail)
+    layer = layer_pool.shared_layer(test_size)
+    try:
+        with pytest.raises(RuntimeError):
+            layer_pool._draw_layer_job(layer.get_name(), test_size, None, {}, [], None)
+    finally:
+        layer.release()
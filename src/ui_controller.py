@@ -9,10 +9,13 @@
 # - Modified by Aamina Hussain on 03/17/2022.
 
 # Imports
+import startup_report
+startup_report.install()
+
+import os
+
 import pygame as pg
 import pygame_gui as pgui
-from tkinter import *
-from tkinter.filedialog import asksaveasfilename
 
 from canvas import canvas
 from widget_storage import widgets
@@ -24,6 +27,13 @@ from modules.text_overlay import text_overlay
 from modules.switch_theme import switch_theme
 from modules.generators import generators
 import assets
+from frame_scheduler import frame_scheduler
+import image_export
+import profiler
+import render
+from render_graph import render_node
+from render_worker import render_worker
+from layer_pool import layer_pool
 
 class ui_controller:
     """! The ui_controller class.
@@ -32,12 +42,24 @@ class ui_controller:
     Orchestrates pygame event handling, ui drawing, art generation, randomization, and art exporting.
     """
 
+    ## Export resolution that saves the art at every image_export.pyramid_sizes size, rendered at the largest.
+    pyramid_resolution = "All sizes: %dx%d" % image_export.pyramid_sizes[0]
     ## Possible canvas export resolutions.
     resolutions_list = [
         "4K: 3840x2160",
         "Full HD: 1920x1080",
-        "HD: 1280x720"
+        "HD: 1280x720",
+        pyramid_resolution
     ]
+    ## Export quality choices, with the image_export.save_image options each saves with. Best compresses PNG images
+    ## the most and saves JPEG images at the highest quality, Fast saves PNG images quickest with little compression.
+    ## Default uses AAG_PNG_COMPRESSION and AAG_JPEG_QUALITY.
+    export_qualities = {
+        "Best": {"png_compression": 9, "jpeg_quality": 95},
+        "Default": {"png_compression": image_export.default_png_compression,
+                    "jpeg_quality": image_export.default_jpeg_quality},
+        "Fast": {"png_compression": 1, "jpeg_quality": 75}
+    }
 
     ## Application window width.
     SW = 1280
@@ -65,12 +87,32 @@ class ui_controller:
     ## Position of the switch theme widget
     switch_theme_pos = (284, 90)
 
-    ## Canvas internal size.
-    canvas_size = (3840, 2160)
     ## Canvas ui display port size.
     canvas_display_size = (int(SW//1.8), int(SH//1.8))
+    ## Canvas internal size, the canvas is an interactive preview and full resolution art is rendered for export.
+    canvas_size = canvas_display_size
+    ## Size of the reference space art is laid out in, the preview and every export keep its aspect ratio.
+    art_reference_size = (3840, 2160)
+    ## Seconds settings have to stay unchanged before full resolution art is rendered in the background.
+    full_render_delay = 1.0
     ## Position of the canvas on the ui.
     canvas_pos = ((SW - canvas_display_size[0])//2, (SH - canvas_display_size[1])//2)
+    ## Window area of the canvas, the variation gallery is drawn over it while it is open.
+    canvas_rect = pg.Rect(canvas_pos, canvas_display_size)
+    ## Seconds between frames while a text entry has focus, so its cursor keeps blinking while the loop is idle.
+    cursor_blink_wake_time = 0.1
+    ## File types offered by the export dialog, the extension of the picked file name sets the format.
+    export_file_types = [
+        ("Portable Network Graphics", "*.png"),
+        ("JPEG", "*.jpg *.jpeg"),
+        ("Bitmap", "*.bmp"),
+        ("Truevision TGA", "*.tga"),
+        ("Scalable Vector Graphics", "*.svg")
+    ]
+    ## Position of the export status line.
+    export_status_pos = (SW // 2 - 300, SH - 40)
+    ## Window strip the export status line is drawn in.
+    export_status_rect = pg.Rect(0, SH - 45, SW, 25)
 
 
     def __init__(self):
@@ -90,6 +132,32 @@ class ui_controller:
 
         ## Current canvas export resolution.
         self.export_resolution = ui_controller.resolutions_list[0]
+        ## Current export quality, an export_qualities key.
+        self.export_quality = "Default"
+
+        ## Master seed every random stream of the current art is derived from.
+        self.seed = render.new_seed()
+
+        ## Palette, layer settings and seed the canvas art was last generated with.
+        self.art_recipe = {"palette": ["#FFFFFF"], "background_index": 0, "layers": [], "seed": self.seed}
+
+        ## Worker processes the full resolution layers are drawn in, one per core.
+        self.layer_pool = layer_pool()
+
+        ## Renders the art at the export resolution in the background.
+        self.full_render = render_worker(self.full_render_delay, self.layer_pool)
+
+        ## Event type the export worker posts when an export changes state or makes progress.
+        self.export_event = pg.event.custom_type()
+        ## Renders and saves exports in the background, one after another, None until the first export.
+        self.exports = None
+        self.__tk_root = None
+
+        ## Event type the gallery posts when a thumbnail is rendered.
+        self.gallery_event = pg.event.custom_type()
+        ## Grid of variations of the art drawn over the canvas, rendered as thumbnails on the layer pool. None until it
+        ## is first opened.
+        self.gallery = None
         
         ## A boolean that specifies if the program is running, program terminates if False.
         self.isrunning = True
@@ -106,6 +174,10 @@ class ui_controller:
         pg.display.set_icon(assets.logo)
         ## Manages pygame_gui elements and events.
         self.ui_manager = pgui.UIManager((self.SW, self.SH))
+        ## Paces the main loop and tracks the parts of the window to redraw.
+        self.frames = frame_scheduler((self.SW, self.SH), self.ui_manager.get_sprite_group)
+        self.__hud_rect = None
+        self.__background = render_node("ui.background", self.__draw_background)
 
 
     def __initialize_widgets(self):
@@ -121,58 +193,102 @@ class ui_controller:
         #     pg.image.load("assets/overlay5.png").convert_alpha(),
         #     pg.image.load("assets/overlay6.png").convert_alpha()
         # ]
+        widgets.generators = generators(self.canvas_size[0], self.canvas_size[1], self.art_reference_size)
+
         widgets.color_palette = color_palette(self.palette_pos[0], self.palette_pos[1], self.window, self.ui_manager)
         widgets.help = help(self.help_pos[0], self.help_pos[1], self.window, self.ui_manager)
         widgets.switch_theme = switch_theme(self.switch_theme_pos[0], self.switch_theme_pos[1], self.window, self.ui_manager)
-        widgets.layer_one = layer(self.layer_one_pos[0], self.layer_one_pos[1], self.window, self.ui_manager, "ONE")
-        widgets.layer_two = layer(self.layer_two_pos[0], self.layer_two_pos[1], self.window, self.ui_manager, "TWO")
-        widgets.layer_three = layer(self.layer_three_pos[0], self.layer_three_pos[1], self.window, self.ui_manager, "THREE")
-        widgets.text_overlay = text_overlay(self.text_overlay_pos[0], self.text_overlay_pos[1], self.window, self.ui_manager)
-        widgets.overlay = overlay(self.overlay_pos[0], self.overlay_pos[1], self.window, self.ui_manager)
-        
-        widgets.generators = generators(self.canvas_size[0], self.canvas_size[1])
+        widgets.layer_one = layer(self.layer_one_pos[0], self.layer_one_pos[1], self.window, self.ui_manager, "ONE", self.canvas_size)
+        widgets.layer_two = layer(self.layer_two_pos[0], self.layer_two_pos[1], self.window, self.ui_manager, "TWO", self.canvas_size)
+        widgets.layer_three = layer(self.layer_three_pos[0], self.layer_three_pos[1], self.window, self.ui_manager, "THREE", self.canvas_size)
+        widgets.text_overlay = text_overlay(self.text_overlay_pos[0], self.text_overlay_pos[1], self.window, self.ui_manager, self.canvas_size)
+        widgets.overlay = overlay(self.overlay_pos[0], self.overlay_pos[1], self.window, self.ui_manager, self.canvas_size)
 
 
-    def process_events(self):
+    def process_events(self, events):
         """! Processes pygame events.
         
         Handles generation and export controls itself and calls events() in widgets for all other event processing.
+
+        @param events   The events of the frame, from frame_scheduler.next_events.
         """
-        for event in pg.event.get():
+        for event in events:
+            if event.type == self.export_event:
+                self.frames.invalidate(self.export_status_rect)
+                continue
+
+            if event.type == self.gallery_event:
+                self.frames.invalidate(self.canvas_rect)
+                continue
+
+            # Hovering only changes the ui elements under the mouse, which frame_scheduler.invalidate_sprites finds.
+            # Anything else can change the widgets or the canvas, so the whole window is redrawn.
+            if event.type != pg.MOUSEMOTION or any(event.buttons):
+                self.frames.invalidate_all()
+
             if event.type == pg.QUIT:
                 self.isrunning = False
                 break
 
             if event.type == pg.KEYDOWN:
-                if event.key == pg.K_ESCAPE:
+                if event.key == pg.K_ESCAPE and self.is_gallery_open():
+                    self.gallery.close()
+                elif event.key == pg.K_ESCAPE:
                     self.isrunning = False
                     break
 
+            if event.type == pg.MOUSEBUTTONDOWN and self.is_gallery_open() and self.canvas_rect.collidepoint(event.pos):
+                # Clicking a thumbnail keeps that variation, right clicking closes the gallery.
+                if event.button == 1:
+                    picked = self.gallery.get_variation_at((event.pos[0] - self.canvas_rect.x,
+                                                            event.pos[1] - self.canvas_rect.y))
+                    if picked is not None and picked.surface is not None:
+                        self.pick_variation(picked)
+                elif event.button == 3:
+                    self.gallery.close()
+
+            profiler.toggle_hud(event)
+
             if event.type == pg.USEREVENT:
                 if event.user_type == pgui.UI_DROP_DOWN_MENU_CHANGED:
                     if event.ui_object_id == "resolution_dropdown":
                         self.export_resolution = event.text
+                        self.request_full_render()
+                    elif event.ui_object_id == "quality_dropdown":
+                        self.export_quality = event.text
 
                 if event.user_type == pgui.UI_BUTTON_PRESSED:
                     if event.ui_object_id == "generate_button":
-
-                        self.canvas.draw_layers()
-                        self.canvas.draw_to_canvas()
+                        self.generate(render.new_seed())
 
                     if event.ui_object_id == "random_generate_button":
-                        widgets.color_palette.randomize()
-                        widgets.layer_one.randomize()
-                        widgets.layer_two.randomize()
-                        widgets.layer_three.randomize()
+                        seed = render.new_seed()
+
+                        widgets.color_palette.randomize(render.seed_stream(seed, "randomize palette"))
+                        widgets.layer_one.randomize(render.seed_stream(seed, "randomize " + render.layer_stream_name(0)))
+                        widgets.layer_two.randomize(render.seed_stream(seed, "randomize " + render.layer_stream_name(1)))
+                        widgets.layer_three.randomize(render.seed_stream(seed, "randomize " + render.layer_stream_name(2)))
 
                         self.draw_ui_static()
-                        
-                        self.canvas.draw_layers()
-                        self.canvas.draw_to_canvas()
-                        
+
+                        self.generate(seed)
+
                     if event.ui_object_id == "export_art_button":
                         self.export_art()
 
+                    if event.ui_object_id == "variations_button":
+                        self.open_gallery(mutate=False)
+
+                    if event.ui_object_id == "mutations_button":
+                        self.open_gallery(mutate=True)
+
+                if event.user_type == pgui.UI_TEXT_ENTRY_FINISHED:
+                    if event.ui_object_id == "seed_entry":
+                        if event.text.strip().isdigit():
+                            self.generate(int(event.text))
+                        else:
+                            self.seed_entry.set_text(str(self.seed))
+
                 redraw = 0
 
                 redraw += widgets.color_palette.events(event)
@@ -185,6 +301,7 @@ class ui_controller:
 
                 if redraw > 0:
                     self.canvas.draw_to_canvas()
+                    self.request_full_render()
 
                 if widgets.switch_theme.events(event):
                     widgets.layer_one.change_colors()
@@ -204,28 +321,13 @@ class ui_controller:
         Draws the background color and some text itself and calls canvas and widgets for all other drawing.
         """
 
-        if widgets.switch_theme.getDarkMode():
-            self.window.fill(assets.background_color)
-            assets.text_to_screen(window=self.window, text="ABSTRACT ART GENERATOR", color=assets.ui_h1_color, pos=(430, 35), font_size=40)
-            assets.text_to_screen(window=self.window, text="LAYERS", color=assets.ui_h1_color, pos=(self.layer_one_pos[0] + 42,
-                            self.layer_one_pos[1]-22.5), font_size=24)
-            assets.text_to_screen(window=self.window, text="RESOLUTION", color=assets.ui_h1_color, pos=(self.SW-240, 560+20), font_size=14)
-        else:
-            self.window.fill(pg.Color("#D1D6D9"))
-            assets.text_to_screen(window=self.window, text="ABSTRACT ART GENERATOR", color="#000000", pos=(430, 35), font_size=40)
-            assets.text_to_screen(window=self.window, text="LAYERS", color="#000000", pos=(self.layer_one_pos[0] + 42,
-                            self.layer_one_pos[1]-22.5), font_size=24)
-            assets.text_to_screen(window=self.window, text="RESOLUTION", color="#000000", pos=(self.SW-240, 560+20), font_size=14)
-        #self.window.fill(assets.background_color if widgets.switch_theme.getDarkMode() else pg.Color("#D1D6D9")) # og = ffffff (white), pink = #ffd6d6
-        #self.window.fill(assets.background_color)
-
-        
+        self.__background.set_params(widgets.switch_theme.getDarkMode())
+        self.window.blit(self.__background.get(), (0, 0))
 
-        # assets.text_to_screen(window=self.window, text="ABSTRACT ART GENERATOR", color=assets.ui_h1_color, pos=(430, 35), font_size=40)
-        # assets.text_to_screen(window=self.window, text="LAYERS", color=assets.ui_h1_color, pos=(self.layer_one_pos[0] + 42,
-        #                     self.layer_one_pos[1]-22.5), font_size=24)
-        # assets.text_to_screen(window=self.window, text="RESOLUTION", color=assets.ui_h1_color, pos=(self.SW-240, 560+20), font_size=14) #assets.ui_color, 
-        self.canvas.draw()
+        if self.is_gallery_open():
+            self.gallery.draw(self.window, self.canvas_rect.topleft, assets.inactive_color)
+        else:
+            self.canvas.draw()
         widgets.color_palette.draw_ui_dynamic()
         widgets.help.draw_ui_dynamic()
         widgets.layer_one.draw_ui_dynamic()
@@ -234,6 +336,64 @@ class ui_controller:
         widgets.overlay.draw_ui_dynamic()
         widgets.text_overlay.draw_ui_dynamic()
 
+        status = self.get_export_status()
+        if status:
+            assets.text_to_screen(window=self.window, text=status, pos=self.export_status_pos, font_size=12,
+                                  color=assets.ui_h1_color if widgets.switch_theme.getDarkMode() else "#000000")
+
+
+    def get_export_status(self):
+        """! Gets the status line of the exports.
+
+        @return The state of the running export and how many are queued after it, or how the last export ended. An
+                empty string before the first export.
+        """
+        if self.exports is None:
+            return ""
+        jobs = self.exports.get_jobs()
+        running = [job for job in jobs if not job.is_finished()]
+        if running:
+            job = running[0]
+            status = "%s %s" % (job.state.upper(), os.path.basename(job.path))
+            if job.state == "saving":
+                status += " %d%%" % (job.progress * 100)
+            if len(running) > 1:
+                status += "  (%d MORE QUEUED)" % (len(running) - 1)
+            return status
+        if jobs:
+            job = jobs[-1]
+            if job.state == "failed":
+                return "EXPORT FAILED %s: %s" % (os.path.basename(job.path), job.error)
+            return "SAVED " + os.path.basename(job.path)
+        return ""
+
+
+    def __draw_background(self, dark_mode):
+        """! Draws the window background and headings to a new surface, they only change with the theme.
+
+        @param dark_mode    True to draw the dark theme, False for the light theme.
+
+        @return The background surface, the size of the window.
+        """
+        background = pg.Surface((self.SW, self.SH))
+        if dark_mode:
+            background.fill(assets.background_color)
+            assets.text_to_screen(window=background, text="ABSTRACT ART GENERATOR", color=assets.ui_h1_color, pos=(430, 35), font_size=40)
+            assets.text_to_screen(window=background, text="LAYERS", color=assets.ui_h1_color, pos=(self.layer_one_pos[0] + 42,
+                            self.layer_one_pos[1]-22.5), font_size=24)
+            assets.text_to_screen(window=background, text="RESOLUTION", color=assets.ui_h1_color, pos=(self.SW-240, 560+20), font_size=14)
+            assets.text_to_screen(window=background, text="SEED", color=assets.ui_h1_color, pos=(self.SW // 2 - 300, 560+20), font_size=14)
+            assets.text_to_screen(window=background, text="QUALITY", color=assets.ui_h1_color, pos=(self.SW // 2, 560+20), font_size=14)
+        else:
+            background.fill(pg.Color("#D1D6D9"))
+            assets.text_to_screen(window=background, text="ABSTRACT ART GENERATOR", color="#000000", pos=(430, 35), font_size=40)
+            assets.text_to_screen(window=background, text="LAYERS", color="#000000", pos=(self.layer_one_pos[0] + 42,
+                            self.layer_one_pos[1]-22.5), font_size=24)
+            assets.text_to_screen(window=background, text="RESOLUTION", color="#000000", pos=(self.SW-240, 560+20), font_size=14)
+            assets.text_to_screen(window=background, text="SEED", color="#000000", pos=(self.SW // 2 - 300, 560+20), font_size=14)
+            assets.text_to_screen(window=background, text="QUALITY", color="#000000", pos=(self.SW // 2, 560+20), font_size=14)
+        return background
+
 
     def draw_ui_static(self):
         """! Draws the static ui.
@@ -256,6 +416,16 @@ class ui_controller:
                                                 relative_rect=pg.Rect(self.SW // 2 + 100, 575+20, 200, 22), manager=self.ui_manager,
                                                 object_id = "resolution_dropdown")
 
+        quality_dropdown = pgui.elements.UIDropDownMenu(options_list=list(self.export_qualities),
+                                                starting_option=self.export_quality,
+                                                relative_rect=pg.Rect(self.SW // 2, 575+20, 95, 22), manager=self.ui_manager,
+                                                object_id="quality_dropdown")
+
+        ## Text entry showing the master seed, entering a seed regenerates the art from it.
+        self.seed_entry = pgui.elements.UITextEntryLine(relative_rect=pg.Rect(self.SW // 2 - 300, 575+20, 200, 22), manager=self.ui_manager,
+                                                object_id="seed_entry")
+        self.seed_entry.set_text(str(self.seed))
+
         export_art_button = pgui.elements.UIButton(relative_rect=pg.Rect(self.SW // 2 + 100, self.SH - 100, 200, 50),
                                                 text="Export", manager=self.ui_manager, object_id="export_art_button")
 
@@ -266,49 +436,220 @@ class ui_controller:
                                                 text="Generate Randomly", manager=self.ui_manager,
                                                 object_id="random_generate_button")
 
+        variations_button = pgui.elements.UIButton(relative_rect=pg.Rect(self.SW // 2 - 95, 575+20, 90, 22),
+                                                text="Variations", manager=self.ui_manager, object_id="variations_button")
+
+        mutations_button = pgui.elements.UIButton(relative_rect=pg.Rect(self.SW // 2 + 5, 575+20, 90, 22),
+                                                text="Mutations", manager=self.ui_manager, object_id="mutations_button")
+
+        self.frames.invalidate_all()
+
+
+    def generate(self, seed):
+        """! Draws new art with the current settings.
+
+        @param seed     The master seed to draw with, shown in the seed entry.
+        """
+        self.seed = seed
+        self.seed_entry.set_text(str(seed))
+        if self.gallery is not None:
+            self.gallery.close()
+
+        # Drawing the layers first settles the seed of each layer, locked layers keep theirs.
+        self.canvas.draw_layers(seed)
+        self.art_recipe = {
+            "palette": list(widgets.color_palette.get_colors_from_palette()),
+            "background_index": widgets.color_palette.background_index,
+            "layers": [widgets.layer_one.get_settings(), widgets.layer_two.get_settings(), widgets.layer_three.get_settings()],
+            "seed": seed
+        }
+
+        self.canvas.draw_to_canvas()
+        self.request_full_render()
+
+
+    def is_gallery_open(self):
+        """! @return True if the gallery is drawn over the canvas. """
+        return self.gallery is not None and self.gallery.is_open()
+
+
+    def open_gallery(self, mutate):
+        """! Fills the gallery over the canvas with variations of the current art.
+
+        The settings that aren't locked are picked at random like Generate Randomly, or mutated from the current ones,
+        and every variation gets a new master seed. Thumbnails fill the grid as they finish rendering.
+
+        @param mutate   True to mutate the settings, False to pick them at random.
+        """
+        if self.gallery is None:
+            # Only the gallery needs its module, importing it on startup would delay the first frame.
+            from gallery import gallery
+            self.gallery = gallery(self.layer_pool, self.canvas_display_size,
+                                   self.art_reference_size[0] / self.art_reference_size[1], self.gallery_event)
+
+        layer_widgets = self.canvas.get_layer_widgets()
+        # The widgets' settings rather than the last generated art's, they may have changed since.
+        recipe = self.get_recipe(self.gallery.thumbnail_size)
+        recipe["palette"] = list(widgets.color_palette.get_colors_from_palette())
+        recipe["background_index"] = widgets.color_palette.background_index
+        recipe["layers"] = [widget.get_settings() for widget in layer_widgets]
+        self.gallery.fill(recipe, widgets.color_palette.get_name_of_palette(), widgets.color_palette.get_locks(),
+                          [widget.get_locks() for widget in layer_widgets], mutate)
+        self.frames.invalidate(self.canvas_rect)
+
+
+    def pick_variation(self, picked):
+        """! Keeps a gallery variation, its settings are set on the widgets and its seed generated at full resolution.
+
+        @param picked   The gallery variation.
+        """
+        widgets.color_palette.set_palette(picked.palette_name, picked.recipe["background_index"])
+        for widget, settings in zip(self.canvas.get_layer_widgets(), picked.recipe["layers"]):
+            widget.set_settings(settings)
+
+        self.draw_ui_static()
+
+        self.generate(picked.recipe["seed"])
+
+
+    def request_full_render(self):
+        """! Requests a background render of the canvas art at the export resolution. """
+        self.full_render.request(self.get_recipe(self.get_resolution_size(self.export_resolution)))
+
 
     def export_art(self):
-        """! Exports the canvas to a png image. """
-        tkinter_window = Tk()
-        tkinter_window.withdraw()
-
-        available_formats = [("Portable Network Graphics", "*.png")]
-        filename = asksaveasfilename(title="Export File", filetypes=available_formats)
-
-        if filename:
-            path = filename[:]
-            if self.export_resolution == ui_controller.resolutions_list[0]:
-                pg.image.save(self.canvas.get_canvas(), path + ".png")
-            elif self.export_resolution == ui_controller.resolutions_list[1]:
-                pg.image.save(pg.transform.smoothscale(self.canvas.get_canvas(), (1920, 1080)), path + ".png")
-            elif self.export_resolution == ui_controller.resolutions_list[2]:
-                pg.image.save(pg.transform.smoothscale(self.canvas.get_canvas(), (1280, 720)), path + ".png")
-        else:
-            pass
+        """! Queues an export of the canvas art to the file picked in a save dialog.
+
+        The canvas only holds a preview, so the art is rendered natively at the export resolution, on the export worker
+        so the ui keeps running. The finished background render is handed over when it matches. The file extension
+        picks the format, see image_export, and names without one are saved as png. Svg images are written shape by
+        shape instead and sized to the export resolution. The pyramid_resolution saves one image per size, each named
+        after its size, see image_export.save_pyramid. PNG and JPEG images are saved with the options of the
+        export_quality.
+        """
+        # Only exporting needs tkinter, importing it on startup would delay the first frame.
+        from tkinter import Tk
+        from tkinter.filedialog import asksaveasfilename
+
+        if self.__tk_root is None:
+            self.__tk_root = Tk()
+            self.__tk_root.withdraw()
+
+        filename = asksaveasfilename(parent=self.__tk_root, title="Export File", filetypes=self.export_file_types)
+        if not filename:
+            return
+
+        path = filename
+        if image_export.get_format(path) is None and not path.lower().endswith(".svg"):
+            path += ".png"
+        recipe = self.get_recipe(self.get_resolution_size(self.export_resolution))
+        sizes = image_export.pyramid_sizes if self.export_resolution == self.pyramid_resolution else None
+        if self.exports is None:
+            # Started by the first export like tkinter, its worker thread and imports aren't needed before then.
+            from export_worker import export_worker
+            self.exports = export_worker(self.full_render.result, self.export_event)
+        self.exports.submit(path, recipe, self.full_render.peek(recipe), sizes, **self.export_qualities[self.export_quality])
+
+
+    def get_recipe(self, size):
+        """! Gets the render recipe of the art on the canvas.
+
+        @param size     The size to render the art at.
+
+        @return A recipe for render.render_surface.
+        """
+        recipe = dict(self.art_recipe)
+        recipe["text"] = widgets.text_overlay.get_settings()
+        recipe["overlay"] = widgets.overlay.get_active_overlay()
+        recipe["size"] = size
+        return recipe
+
+
+    def get_resolution_size(self, resolution):
+        """! Gets the size of an export resolution.
+
+        @param resolution   One of the resolutions_list entries.
+
+        @return The (width, height) of the resolution.
+        """
+        width, height = resolution.split(": ")[1].split("x")
+        return (int(width), int(height))
+
+
+    def get_focused_text_entries(self):
+        """! Gets the text entries with focus.
+
+        Their cursors blink without any events, so the main loop wakes up to redraw them while it is idle.
+
+        @return A list of the focused text entries.
+        """
+        return [element for element in self.ui_manager.get_focus_set()
+                if isinstance(element, pgui.elements.UITextEntryLine)]
+
+
+    def draw_frame(self):
+        """! Redraws the dirty parts of the window and shows them.
+
+        Everything is drawn clipped to the dirty area, so the cost follows what changed rather than the window size.
+        """
+        hud = None
+        if self.frames.is_dirty():
+            hud = profiler.render_hud()
+            if hud is not None:
+                self.frames.invalidate(hud.get_rect(topleft=profiler.hud_pos))
+            self.frames.invalidate(self.__hud_rect)
+
+        rects = self.frames.get_dirty_rects()
+        if not rects:
+            return
+
+        self.window.set_clip(rects[0].unionall(rects[1:]))
+
+        with profiler.span("draw_ui_dynamic", "frame"):
+            self.draw_ui_dynamic()
+
+        with profiler.span("draw_ui", "frame"):
+            self.ui_manager.draw_ui(self.window)
+
+        self.__hud_rect = profiler.draw_hud(self.window, panel=hud) if hud is not None else None
+
+        self.window.set_clip(None)
+        pg.display.update(rects)
 
 
     def run(self):
         """! Main loop.
 
-        Draws static ui then enters loop where it processes events and draws the dynamic ui.
+        Draws static ui then enters loop where it processes events and draws the dynamic ui. The loop sleeps until the
+        next event while nothing changes, see frame_scheduler.
         """
         self.draw_ui_static()
 
         while self.isrunning:
-            delta_time = pg.time.Clock().tick(60)/1000.0
+            text_entries = self.get_focused_text_entries()
+            events, delta_time = self.frames.next_events(self.cursor_blink_wake_time if text_entries else None)
 
-            self.process_events()
+            with profiler.span("frame", "frame"):
+                with profiler.span("events", "frame"):
+                    self.process_events(events)
 
-            self.ui_manager.update(delta_time)
+                with profiler.span("ui_manager.update", "frame"):
+                    self.ui_manager.update(delta_time)
+                    self.frames.invalidate_sprites()
+                    for text_entry in self.get_focused_text_entries():
+                        self.frames.invalidate(text_entry.rect)
 
-            self.draw_ui_dynamic()
-
-            self.ui_manager.draw_ui(self.window)
+                self.draw_frame()
 
-            pg.display.update()
+            startup_report.first_frame()
 
+        # Exports still queued are finished rather than lost.
+        if self.exports is not None:
+            self.exports.wait()
+        self.layer_pool.shutdown()
         pg.quit()
 
-##The ui_controller instance that initializes the program
-controller = ui_controller()
-controller.run()
\ No newline at end of file
+if __name__ == "__main__":
+    ##The ui_controller instance that initializes the program
+    controller = ui_controller()
+    controller.run()